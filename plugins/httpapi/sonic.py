@@ -35,22 +35,235 @@ options:
     default: '/restconf'
     vars:
       - name: ansible_httpapi_restconf_root
+  keepalive_pool_size:
+    type: int
+    description:
+      - Maximum number of idle persistent HTTP(S) connections kept open to the device
+        and reused across requests.
+      - When set to C(0), every request is sent over a new connection through the
+        C(ansible.netcommon.httpapi) connection plugin.
+      - Pooled connections are opened directly to the device and do not use a proxy.
+        They are authenticated like the connection plugin requests, with the
+        C(session_key) option if set, and with the credentials otherwise.
+      - A request which fails on a pooled connection closed by the device is sent again
+        on a new connection if it is a GET, PUT or DELETE request, or if it could not be
+        sent at all.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_keepalive_pool_size
+  keepalive_idle_timeout:
+    type: int
+    description:
+      - Number of seconds a pooled connection may stay idle before it is closed instead
+        of being reused.
+      - Should be lower than the idle timeout of the REST server on the device.
+    default: 30
+    vars:
+      - name: ansible_httpapi_sonic_keepalive_idle_timeout
+  concurrent_requests:
+    type: int
+    description:
+      - Maximum number of GET requests sent concurrently to the device.
+      - Only consecutive GET requests within the list of requests passed to one
+        C(edit_config) call are sent concurrently. Write requests are always sent
+        one at a time and in order. Responses are returned in the order of the requests.
+      - When set to C(1), all requests are sent one at a time.
+      - Concurrent requests benefit from a I(keepalive_pool_size) of the same size.
+    default: 1
+    vars:
+      - name: ansible_httpapi_sonic_concurrent_requests
+  yang_patch:
+    type: bool
+    description:
+      - Send consecutive PATCH and DELETE requests within the list of requests passed
+        to one C(edit_config) call as a single RESTCONF YANG Patch (RFC 8072) edit.
+      - If the device rejects the YANG Patch, the requests are sent one at a time.
+        If the device does not support YANG Patch, it is not used again for the
+        lifetime of the connection.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_yang_patch
+  cache_ttl:
+    type: int
+    description:
+      - Number of seconds a successful GET response is cached by the persistent
+        connection and served to later requests for the same path.
+      - A PATCH, PUT, POST or DELETE request invalidates all cached responses. A write
+        to one path of the device may change the data of unrelated paths, within the
+        same YANG module (for example port breakout or VLAN membership) as well as in
+        the other YANG models the device maps onto the same configuration.
+      - The cache therefore mainly saves the repeated GET requests sent between two
+        write requests, such as the facts gathered by several tasks in a row.
+      - Changes made to the device outside of this connection are only picked up once
+        the cached responses expire.
+      - When set to C(0), GET responses are not cached.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_cache_ttl
+  cache_size:
+    type: int
+    description:
+      - Maximum number of GET responses kept in the cache enabled by I(cache_ttl).
+        The least recently used responses are evicted first.
+    default: 256
+    vars:
+      - name: ansible_httpapi_sonic_cache_size
+  compression:
+    type: bool
+    description:
+      - Request gzip compressed responses from the device with an C(Accept-Encoding) header.
+      - Responses are kept compressed as received, also in the cache enabled by
+        I(cache_ttl), and are decompressed and decoded to text one chunk at a time
+        before their JSON data is parsed, over pooled connections as well as over
+        the C(ansible.netcommon.httpapi) connection plugin.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_compression
+  reboot_ready_path:
+    type: str
+    description:
+      - RESTCONF path polled with GET requests to check if the device is ready again
+        after a configuration change which triggers a reboot.
+    default: 'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost'
+    vars:
+      - name: ansible_httpapi_sonic_reboot_ready_path
+  reboot_ready_count:
+    type: int
+    description:
+      - Number of consecutive successful polls of I(reboot_ready_path) required to
+        consider the device ready after a reboot.
+      - Successful polls are only counted once the device has been seen rebooting,
+        either through a failed poll or through a change of the value read from
+        I(reboot_boot_time_path).
+    default: 2
+    vars:
+      - name: ansible_httpapi_sonic_reboot_ready_count
+  reboot_boot_time_path:
+    type: str
+    description:
+      - RESTCONF path of the boot time of the device, read before the configuration
+        change and while polling I(reboot_ready_path), to detect a reboot which
+        completed between two polls.
+      - When set to an empty string, the device is only considered rebooted after a
+        failed poll of I(reboot_ready_path).
+    default: 'data/openconfig-system:system/state/boot-time'
+    vars:
+      - name: ansible_httpapi_sonic_reboot_boot_time_path
+  reboot_probe_delay:
+    type: int
+    description:
+      - Number of seconds to wait after a reboot is detected before polling the device.
+      - The delay is shortened to end no later than I(reboot_timeout).
+    default: 30
+    vars:
+      - name: ansible_httpapi_sonic_reboot_probe_delay
+  reboot_timeout:
+    type: int
+    description:
+      - Maximum number of seconds, from sending the request which triggers a reboot,
+        for the device to become ready again.
+    default: 600
+    vars:
+      - name: ansible_httpapi_sonic_reboot_timeout
+  record_file:
+    type: path
+    description:
+      - Path of a file to which every request sent to the device and its response are
+        appended, one JSON document per line. The file is gzip compressed if its name
+        ends with C(.gz).
+      - Each line holds the C(method), C(path) and C(data) of the request and the
+        C(code) and C(value) of its C(response).
+      - Use a different file for each host, for example with
+        C(ansible_httpapi_sonic_record_file={{ inventory_hostname }}.jsonl.gz).
+    vars:
+      - name: ansible_httpapi_sonic_record_file
+  replay_file:
+    type: path
+    description:
+      - Path of a file written with I(record_file) from which the responses to the
+        requests are served, without connecting to the device.
+      - Responses to the same request are served in the recorded order, the last one
+        being served again once the others are used. A PATCH, PUT, POST or DELETE
+        request with data differing from the recorded requests gets the first
+        recorded response for its path, or an empty response with code C(204) if the
+        path was not recorded. A GET request for a path which was not recorded fails.
+      - When set, I(record_file) is ignored.
+    vars:
+      - name: ansible_httpapi_sonic_replay_file
+  replay_latency:
+    type: float
+    description:
+      - Number of seconds added to every request served from I(replay_file), to
+        emulate the latency of the device.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_replay_latency
 """
 
+import base64
+import codecs
+import gzip
 import json
-import time
+import os
 import re
+import select
+import socket
+import ssl
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import groupby
 
-from ansible.module_utils._text import to_text
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.six.moves.urllib.response import addinfourl
 from ansible.plugins.httpapi import HttpApiBase
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.profile_utils import (
+    get_path_template
+)
 
 CONTENT_TYPE = 'application/yang-data+json'
+YANG_PATCH_CONTENT_TYPE = 'application/yang-patch+json'
+YANG_PATCH_OPERATIONS = {'patch': 'merge', 'delete': 'remove'}
+# Methods of the requests which can be sent again after a failure of their
+# pooled connection, as the device has the same state whether it got them
+# once or twice
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+# Number of bytes of a response body decompressed and decoded at a time
+RESPONSE_CHUNK_SIZE = 64 * 1024
+# Maximum number of request records kept for 'get_request_stats'
+REQUEST_STATS_SIZE = 10000
+# Initial and maximum number of seconds between polls of a rebooting device
+REBOOT_PROBE_INTERVAL = 5
+REBOOT_PROBE_MAX_INTERVAL = 30
+# RESTCONF error tags of a 400 response rejecting a query parameter
+QUERY_UNSUPPORTED_ERROR_TAGS = ('invalid-value', 'unknown-element')
+# Reference to a query parameter in the error of a 400 response, formatted
+# with the names of the parameters sent: "query parameter 'depth'",
+# "content query parameter" or "fields=..."
+QUERY_PARAMETER_RE = r"\b(?:query|param(?:eter)?)\W+(?:{0})\b|\b(?:{0})\W+(?:query|param(?:eter)?)\b|\b(?:{0})="
+# Error codes indicating that the device does not accept YANG Patch requests at all
+YANG_PATCH_UNSUPPORTED_CODES = (404, 405, 406, 415, 501)
 
 
 class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._pool = None
+        self._cache = None
+        self._yang_patch_supported = True
+        self._query_unsupported = set()
+        self._request_stats = deque(maxlen=REQUEST_STATS_SIZE)
+        self._replay = None
+        self._record_lock = threading.Lock()
+
     def send_request(self, data, **message_kwargs):
         if data:
             data = json.dumps(data)
@@ -61,9 +274,238 @@ class HttpApi(HttpApiBase):
             'Content-Type': message_kwargs.get('content_type') or CONTENT_TYPE,
             'Accept': message_kwargs.get('accept') or CONTENT_TYPE,
         }
-        response, response_data = self.connection.send(path, data, headers=headers, method=message_kwargs.get('method'))
+        if self.get_option('compression'):
+            headers['Accept-Encoding'] = 'gzip'
+        method = message_kwargs.get('method')
+        query = ''
+        query_key = get_yang_module(normalize_path(path)) or normalize_path(path)
+        if method == 'get' and query_key not in self._query_unsupported:
+            query = get_query_string(message_kwargs)
+        if query:
+            try:
+                return self._send(path + '?' + query, data, headers, message_kwargs)
+            except ConnectionError as exc:
+                if getattr(exc, 'code', None) != 400 or not is_query_unsupported_error(exc, query):
+                    raise
+                response = self._send(path, data, headers, message_kwargs)
+                # The device rejects RESTCONF query parameters for this YANG module, stop sending them.
+                self._query_unsupported.add(query_key)
+                return response
 
-        return handle_response(response, response_data, message_kwargs)
+        return self._send(path, data, headers, message_kwargs)
+
+    def _send(self, path, data, headers, message_kwargs):
+        method = message_kwargs.get('method')
+        start = time.time()
+        cached = None
+        cache = self._get_cache()
+        if cache is not None:
+            if method == 'get':
+                cached = cache.get(path)
+            else:
+                cache.invalidate(path)
+
+        if cached:
+            response, response_data = cached[0], BytesIO(cached[1])
+        else:
+            response, response_data = self._transport(path, data, headers, method)
+            if cache is not None and method == 'get' and not isinstance(response, HTTPError):
+                cache.put(path, response, response_data.getvalue())
+
+        network_time = time.time() - start
+        size = len(response_data.getvalue())
+        start = time.time()
+        body = ResponseBody(response, response_data)
+        try:
+            return handle_response(response, body, message_kwargs)
+        finally:
+            decode_time = time.time() - start
+            self._request_stats.append({
+                'method': method,
+                'path': get_path_template(path),
+                'status': response.getcode(),
+                'bytes_out': len(data) if data else 0,
+                'bytes_in': size,
+                'bytes_decoded': body.size,
+                'network_time': network_time,
+                'decode_time': decode_time,
+                'cached': bool(cached)
+            })
+            if not cached:
+                self.connection.queue_message('vvvv', 'received %d bytes (%d decoded) for %s %s in %.3f seconds, decoded in %.3f seconds'
+                                              % (size, body.size, method, path, network_time, decode_time))
+
+    def get_query_unsupported(self):
+        """Return the YANG modules, or the paths outside of data resources,
+        for which the device rejects RESTCONF query parameters
+        """
+        return sorted(self._query_unsupported)
+
+    def get_request_stats(self):
+        """Return and clear the records of the requests sent since the last call"""
+        stats = list(self._request_stats)
+        self._request_stats.clear()
+        return stats
+
+    def _transport(self, path, data, headers, method):
+        if self.get_option('replay_file'):
+            return self._replay_request(path, data, method)
+        if self.get_option('keepalive_pool_size') > 0:
+            response, response_data = self._send_keepalive(path, data, headers, method)
+        else:
+            # Keep gzip encoded bodies as received, they are decompressed by 'handle_response'
+            response, response_data = self.connection.send(path, data, headers=headers, method=method, decompress=False)
+        if self.get_option('record_file'):
+            self._record_request(path, data, method, response, response_data.getvalue())
+        return response, response_data
+
+    def _record_request(self, path, data, method, response, response_data):
+        entry = {
+            'method': method,
+            'path': path,
+            'data': load_json(data),
+            'response': {'code': response.getcode(), 'value': load_json(ResponseBody(response, BytesIO(response_data)).read())}
+        }
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._record_lock:
+            with open_recording(self.get_option('record_file'), 'at') as record_file:
+                record_file.write(line)
+
+    def _replay_request(self, path, data, method):
+        with self._record_lock:
+            if self._replay is None:
+                self._replay = ReplayStore(self.get_option('replay_file'))
+        latency = self.get_option('replay_latency')
+        if latency:
+            time.sleep(latency)
+
+        entry = self._replay.get(method, path, load_json(data))
+        if entry is None:
+            if method == 'get':
+                raise AnsibleConnectionFailure('No recorded response for GET {0} in {1}'.format(path, self.get_option('replay_file')))
+            entry = {'response': {'code': 204, 'value': ''}}
+
+        code = entry['response'].get('code', 200)
+        value = entry['response'].get('value', '')
+        body = to_bytes(value if isinstance(value, str) else json.dumps(value))
+        url = self._get_url() + path
+        if code >= 400:
+            response = HTTPError(url, code, '', {}, BytesIO(body))
+        else:
+            response = addinfourl(BytesIO(body), {}, url, code)
+        return response, BytesIO(body)
+
+    def _get_cache(self):
+        if self._cache is None and self.get_option('cache_ttl') > 0:
+            self._cache = ResponseCache(self.get_option('cache_size'), self.get_option('cache_ttl'))
+        return self._cache
+
+    def _send_keepalive(self, path, data, headers, method):
+        """Send a request over a pooled persistent connection
+
+        Mirrors the authentication and error handling of the httpapi
+        connection plugin 'send' method, and returns the same
+        (response, response buffer) pair.
+        """
+        if not self.connection.connected:
+            # Authenticate as the connection plugin does before its first
+            # request, with the session_key option or the 'login' method
+            self.connection._connect()
+        url = self._get_url() + path
+        method = (method or ('POST' if data else 'GET')).upper()
+        req_headers = dict(headers)
+        req_headers.update(self._get_auth_headers())
+        http_agent = self.connection.get_option('http_agent')
+        if http_agent:
+            req_headers['User-Agent'] = http_agent
+        body = to_bytes(data) if data else None
+
+        pool = self._get_pool()
+        while True:
+            conn, reused = pool.acquire()
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=req_headers)
+                sent = True
+                resp = conn.getresponse()
+                resp_data = resp.read()
+            except (http_client.HTTPException, socket.error) as exc:
+                conn.close()
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    # The device may have dropped an idle connection, retry
+                    # on another one unless the device may have applied the request
+                    continue
+                raise AnsibleConnectionFailure("Could not connect to {0}: {1}".format(url, exc))
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            pool.release(conn)
+
+        response = addinfourl(BytesIO(resp_data), resp.msg, url, resp.status)
+        if resp.status >= 400:
+            exc = HTTPError(url, resp.status, resp.reason, resp.msg, BytesIO(resp_data))
+            is_handled = self.handle_httperror(exc)
+            if is_handled is True:
+                return self._send_keepalive(path, data, headers, method)
+            if is_handled is False:
+                raise exc
+            response = is_handled
+
+        self.connection._auth = self.update_auth(response, BytesIO(resp_data)) or self.connection._auth
+        return response, BytesIO(resp_data)
+
+    def _get_url(self):
+        """Return the URL of the device, as built by the connection plugin"""
+        protocol = 'https' if self.connection.get_option('use_ssl') else 'http'
+        port = self.connection.get_option('port') or (443 if protocol == 'https' else 80)
+        return '{0}://{1}:{2}'.format(protocol, self.connection.get_option('host'), port)
+
+    def _get_auth_headers(self):
+        if self.connection._auth:
+            return self.connection._auth
+        credentials = '{0}:{1}'.format(self.connection.get_option('remote_user') or '',
+                                       self.connection.get_option('password') or '')
+        return {'Authorization': 'Basic ' + to_text(base64.b64encode(to_bytes(credentials)))}
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ConnectionPool(self._new_connection,
+                                        self.get_option('keepalive_pool_size'),
+                                        self.get_option('keepalive_idle_timeout'))
+        return self._pool
+
+    def _new_connection(self):
+        host = self.connection.get_option('host')
+        port = self.connection.get_option('port')
+        timeout = self.connection.get_option('persistent_command_timeout')
+        if not self.connection.get_option('use_ssl'):
+            return http_client.HTTPConnection(host, port or 80, timeout=timeout)
+
+        ca_path = self.connection.get_option('ca_path')
+        if self.connection.get_option('validate_certs'):
+            if ca_path and os.path.isdir(ca_path):
+                context = ssl.create_default_context(capath=ca_path)
+            else:
+                context = ssl.create_default_context(cafile=ca_path)
+        else:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        client_cert = self.connection.get_option('client_cert')
+        if client_cert:
+            context.load_cert_chain(client_cert, self.connection.get_option('client_key'))
+        ciphers = self.connection.get_option('ciphers')
+        if ciphers:
+            context.set_ciphers(':'.join(to_list(ciphers)))
+
+        return http_client.HTTPSConnection(host, port or 443, timeout=timeout, context=context)
+
+    def logout(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     def get(self, command):
         return self.send_request(path=command, data=None, method='get')
@@ -74,33 +516,146 @@ class HttpApi(HttpApiBase):
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        workers = self.get_option('concurrent_requests')
         responses = list()
-        for req in to_list(requests):
-            try:
-                response = self.send_request(**req)
-            except ConnectionError as exc:
-                if suppr_ntf_excp and req.get('method') == 'get' and re.search("[nN]ot [fF]ound.*code': 404", str(exc)):
-                    # 'code': 404, 'error-message': 'Resource not found'
-                    response = [{}, {}]
-                else:
-                    raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
-            responses.append(response)
+        yang_patch = self.get_option('yang_patch') and self._yang_patch_supported
+        for kind, group in groupby(to_list(requests), key=get_batch_kind):
+            group = list(group)
+            if kind == 'get' and workers > 1 and len(group) > 1:
+                with ThreadPoolExecutor(max_workers=min(workers, len(group))) as executor:
+                    responses.extend(executor.map(lambda req: self._edit_config_request(req, suppr_ntf_excp), group))
+            elif kind == 'edit' and yang_patch and len(group) > 1:
+                responses.extend(self._edit_config_yang_patch(group, suppr_ntf_excp))
+            else:
+                responses.extend(self._edit_config_request(req, suppr_ntf_excp) for req in group)
         return responses
 
+    def _edit_config_request(self, req, suppr_ntf_excp):
+        try:
+            response = self.send_request(**req)
+        except ConnectionError as exc:
+            if suppr_ntf_excp and req.get('method') == 'get' and re.search("[nN]ot [fF]ound.*code': 404", str(exc)):
+                # 'code': 404, 'error-message': 'Resource not found'
+                response = [{}, {}]
+            else:
+                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+        return response
+
+    def _edit_config_yang_patch(self, requests, suppr_ntf_excp):
+        """Send a list of PATCH and DELETE requests as one YANG Patch edit
+
+        The YANG Patch is applied atomically by the device. If it is
+        rejected, nothing has been applied and the requests are sent
+        one at a time instead.
+        """
+        edits = []
+        for edit_id, req in enumerate(requests, start=1):
+            edit = {
+                'edit-id': str(edit_id),
+                'operation': YANG_PATCH_OPERATIONS[req['method']],
+                'target': '/' + req['path'].lstrip('/')[len('data/'):]
+            }
+            if req['method'] == 'patch':
+                edit['value'] = req.get('data')
+            edits.append(edit)
+        yang_patch = {'ietf-yang-patch:yang-patch': {'patch-id': 'ansible-edit-config', 'edit': edits}}
+
+        try:
+            response = self.send_request(yang_patch, path='data', method='patch', content_type=YANG_PATCH_CONTENT_TYPE)
+        except ConnectionError as exc:
+            if getattr(exc, 'code', None) in YANG_PATCH_UNSUPPORTED_CODES:
+                self._yang_patch_supported = False
+            return [self._edit_config_request(req, suppr_ntf_excp) for req in requests]
+
+        return [response] * len(requests)
+
     def edit_config_reboot(self, requests):
-        """Send a list of http requests to remote device and allow time for reboot
+        """Send a list of http requests to remote device and wait for it to
+        be ready again if a request triggers a reboot
+
+        Returns the measured downtime in seconds, from sending the request
+        which triggered the reboot until the device is ready, or None if
+        no request triggered a reboot.
         """
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        if self._cache is not None:
+            self._cache.clear()
+        downtime = None
+        boot_time = self._get_boot_time()
         for req in to_list(requests):
+            start = time.time()
             try:
                 response = self.send_request(**req)
             except Exception as exc:
                 if 'command timeout triggered' not in str(exc):
                     raise Exception(to_text(exc, errors='surrogate_then_replace'))
                 else:
-                    time.sleep(300)
+                    downtime = self.wait_for_ready(start, boot_time)
+                    boot_time = self._get_boot_time()
+        return downtime
+
+    def wait_for_ready(self, start, boot_time=None):
+        """Poll the device with backoff until it is ready after a reboot
+
+        Successful polls only count once the device has been seen down,
+        or once its boot time differs from 'boot_time', the boot time
+        read before the reboot, so that a device which did not start
+        rebooting yet is not reported ready.
+
+        Returns the number of seconds elapsed since 'start'.
+        """
+        deadline = start + self.get_option('reboot_timeout')
+        if self._pool is not None:
+            # Pooled connections do not survive the reboot
+            self._pool.close()
+        time.sleep(max(0, min(self.get_option('reboot_probe_delay'), deadline - time.time())))
+
+        interval = REBOOT_PROBE_INTERVAL
+        ready_count = 0
+        rebooted = False
+        while True:
+            if self._is_ready():
+                if not rebooted and boot_time is not None:
+                    rebooted = self._get_boot_time() not in (None, boot_time)
+                if rebooted:
+                    ready_count += 1
+                    if ready_count >= self.get_option('reboot_ready_count'):
+                        return time.time() - start
+                interval = REBOOT_PROBE_INTERVAL
+            else:
+                rebooted = True
+                ready_count = 0
+            if time.time() + interval > deadline:
+                raise AnsibleConnectionFailure('Device not ready within {0} seconds of the request '
+                                               'triggering a reboot'.format(self.get_option('reboot_timeout')))
+            time.sleep(interval)
+            interval = min(interval * 2, REBOOT_PROBE_MAX_INTERVAL)
+
+    def _is_ready(self):
+        return self._probe(self.get_option('reboot_ready_path')) is not None
+
+    def _get_boot_time(self):
+        """Return the raw boot time of the device, or None if it cannot be read"""
+        if not self.get_option('reboot_boot_time_path'):
+            return None
+        return self._probe(self.get_option('reboot_boot_time_path'))
+
+    def _probe(self, path):
+        """Send a GET request for a path, bypassing the cache
+
+        Returns the decoded body of a successful response, or None.
+        """
+        path = '/'.join([self.get_option('root_path').rstrip('/'), path.lstrip('/')])
+        headers = {'Content-Type': CONTENT_TYPE, 'Accept': CONTENT_TYPE}
+        try:
+            response, response_data = self._transport(path, None, headers, 'get')
+        except Exception:
+            return None
+        if isinstance(response, HTTPError) or not 200 <= response.getcode() < 300:
+            return None
+        return ResponseBody(response, response_data).read()
 
     def get_capabilities(self):
         result = {}
@@ -110,13 +665,247 @@ class HttpApi(HttpApiBase):
         return json.dumps(result)
 
 
+def is_connection_dropped(conn):
+    """Return True if the device closed an idle connection, which then
+    reads as end of file
+    """
+    if conn.sock is None:
+        return True
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (ValueError, socket.error):
+        return True
+
+
+class ConnectionPool(object):
+    """Bounded pool of idle persistent connections to the device"""
+
+    def __init__(self, factory, size, idle_timeout):
+        self._factory = factory
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Return a (connection, reused) pair, preferring the most recently used idle connection"""
+        now = time.time()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used < self._idle_timeout and not is_connection_dropped(conn):
+                    return conn, True
+                conn.close()
+        return self._factory(), False
+
+    def release(self, conn):
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                conn.close()
+
+
+class ResponseCache(object):
+    """LRU cache of GET responses, keyed by normalized path, with a time-to-live"""
+
+    def __init__(self, size, ttl):
+        self._size = size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the cached (response, body) pair for a path, if any"""
+        key = normalize_path(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.pop(key)
+            self._entries[key] = entry
+            return entry[1], entry[2]
+
+    def put(self, path, response, response_data):
+        key = normalize_path(path)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time(), response, response_data)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drop the cached responses which may be affected by a write to a path
+
+        SONiC writes have side effects beyond the written subtree, on
+        sibling paths of the same YANG module as well as on other YANG
+        modules, so every cached response is dropped.
+        """
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseBody(object):
+    """File-like body of a response, decompressed as it is read if gzip encoded
+
+    Counts the number of decoded bytes read, for the request records. A
+    read of 'size' bytes only decompresses the compressed data needed for
+    them.
+    """
+
+    def __init__(self, response, response_data):
+        headers = getattr(response, 'headers', None) or {}
+        if (headers.get('Content-Encoding') or '').lower() == 'gzip':
+            self._reader = gzip.GzipFile(fileobj=response_data, mode='rb')
+        else:
+            self._reader = response_data
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._reader.read(size)
+        self.size += len(data)
+        return data
+
+
+class ReplayStore(object):
+    """Recorded responses, served in the recorded order for each request"""
+
+    def __init__(self, file_name):
+        self._lock = threading.Lock()
+        self._entries = {}
+        with open_recording(file_name, 'rt') as record_file:
+            for line in record_file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault((entry.get('method'), normalize_path(entry['path'])), []).append(entry)
+
+    def get(self, method, path, data):
+        """Return the next recorded entry for a request, or None if its path was not recorded
+
+        The first entry with the same data is preferred. The last entry
+        for a request is kept and served again.
+        """
+        entries = self._entries.get((method, normalize_path(path)))
+        if not entries:
+            return None
+        with self._lock:
+            idx = next((idx for idx, entry in enumerate(entries) if entry.get('data') == data), 0)
+            if len(entries) > 1:
+                return entries.pop(idx)
+            return entries[0]
+
+
+def open_recording(file_name, mode):
+    """Open a record/replay file, gzip compressed if its name ends with '.gz'"""
+    if file_name.endswith('.gz'):
+        return gzip.open(file_name, mode)
+    return open(file_name, mode)
+
+
+def load_json(data):
+    """Decode JSON request or response data for a recording, keeping other data as text"""
+    if not data:
+        return None if data is None else ''
+    data = to_text(data)
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data
+
+
+def normalize_path(path):
+    """Normalize a request path for use as a cache key"""
+    path = re.sub(r'/+', '/', path.strip('/'))
+    return re.sub(r'%[0-9a-fA-F]{2}', lambda match: match.group(0).upper(), path)
+
+
+def get_yang_module(path):
+    """Return the YANG module of a data resource path, or None for other paths"""
+    segments = path.split('?')[0].split('/')
+    if 'data' not in segments:
+        return None
+    for segment in segments[segments.index('data') + 1:]:
+        if ':' in segment:
+            return segment.split(':')[0]
+    return None
+
+
+def is_query_unsupported_error(exc, query):
+    """Check if the RESTCONF errors of a failed request reject one of the
+    parameters of its query string: an 'invalid-value' or 'unknown-element'
+    error whose message, path or information names the parameter
+    """
+    error = exc.args[0] if exc.args else None
+    if not isinstance(error, dict):
+        return False
+    names = '|'.join(re.escape(param.split('=')[0]) for param in query.split('&'))
+    parameter_re = re.compile(QUERY_PARAMETER_RE.format(names), re.IGNORECASE)
+    for err in error.get('ietf-restconf:errors', error.get('errors', {})).get('error', []):
+        if not isinstance(err, dict) or err.get('error-tag') not in QUERY_UNSUPPORTED_ERROR_TAGS:
+            continue
+        text = ' '.join(to_text(err.get(key) or '') for key in ('error-message', 'error-path', 'error-info'))
+        if parameter_re.search(text):
+            return True
+    return False
+
+
+def get_query_string(request):
+    """Build the RESTCONF query string for the 'depth', 'content' and 'fields' options of a request"""
+    params = []
+    if request.get('depth'):
+        params.append('depth=%s' % request['depth'])
+    if request.get('content'):
+        params.append('content=%s' % request['content'])
+    if request.get('fields'):
+        params.append('fields=%s' % quote(request['fields'], safe='()/;:'))
+    return '&'.join(params)
+
+
+def get_batch_kind(request):
+    """Classify a request for batching in 'edit_config'"""
+    method = request.get('method')
+    if method == 'get':
+        return 'get'
+    if method in YANG_PATCH_OPERATIONS and request.get('path', '').lstrip('/').startswith('data/'):
+        return 'edit'
+    return method
+
+
+def read_text(response_data, chunk_size=RESPONSE_CHUNK_SIZE):
+    """Return the UTF-8 text of a response body, read, decompressed and
+    decoded one chunk at a time, so that neither the whole decompressed
+    body nor a copy of it as bytes is held besides the text
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    text = []
+    while True:
+        chunk = response_data.read(chunk_size)
+        if not chunk:
+            break
+        text.append(decoder.decode(chunk))
+    text.append(decoder.decode(b'', final=True))
+    return ''.join(text)
+
+
 def handle_response(response, response_data, request_data):
-    response_data = response_data.read()
+    response_data = read_text(response_data)
     try:
         if not response_data:
             response_data = ""
         else:
-            response_data = json.loads(response_data.decode('utf-8'))
+            response_data = json.loads(response_data)
     except ValueError:
         pass
 
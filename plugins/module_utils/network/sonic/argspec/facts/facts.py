@@ -110,4 +110,8 @@ class FactsArgs(object):  # pylint: disable=R0903
     argument_spec = {
         'gather_subset': dict(default=['!config'], type='list', elements='str'),
         'gather_network_resources': dict(choices=choices, type='list', elements='str'),
+        'max_workers': dict(default=1, type='int'),
+        'cache_dir': dict(type='path'),
+        'cache_ttl': dict(type='int'),
+        'fingerprint': dict(default=False, type='bool'),
     }
@@ -33,7 +33,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 
@@ -101,19 +104,21 @@ class Aaa(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_aaa_facts = self.get_aaa_facts()
-
         result['before'] = existing_aaa_facts
-        if result['changed']:
-            result['after'] = changed_aaa_facts
-
-        new_config = changed_aaa_facts
         old_config = existing_aaa_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_aaa_facts)
-            self.post_process_generated_config(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_aaa_facts)
+                self.post_process_generated_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_aaa_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
@@ -33,7 +33,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import to_request
 from ansible.module_utils.connection import ConnectionError
@@ -134,21 +137,23 @@ class Bgp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_facts = self.get_bgp_facts()
-
         result['before'] = existing_bgp_facts
-        if result['changed']:
-            result['after'] = changed_bgp_facts
-
-        new_config = changed_bgp_facts
         old_config = existing_bgp_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_bgp_facts,
-                                        TEST_KEYS_generate_config)
-            new_config = self.post_process_generated_config(new_config)
-            old_config = remove_empties_from_list(old_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_bgp_facts,
+                                            TEST_KEYS_generate_config)
+                new_config = self.post_process_generated_config(new_config)
+                old_config = remove_empties_from_list(old_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_bgp_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_lists_in_config(new_config)
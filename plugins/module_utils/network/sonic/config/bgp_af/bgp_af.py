@@ -40,7 +40,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
     __DELETE_SUBCONFIG_AND_LEAFS,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.sort_config_util import (
     sort_config
@@ -209,11 +212,16 @@ class Bgp_af(ConfigBase):
         result['before'] = existing_bgp_af_facts
 
         old_config = existing_bgp_af_facts
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, existing_bgp_af_facts)
-            new_config = sort_config(new_config, TEST_KEYS_sort_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, existing_bgp_af_facts)
+                new_config = sort_config(new_config, TEST_KEYS_sort_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_bgp_af_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -28,7 +28,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.sort_config_util import (
     sort_config,
@@ -118,20 +121,22 @@ class Bgp_as_paths(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_as_paths_facts = self.get_bgp_as_paths_facts()
-
         result['before'] = existing_bgp_as_paths_facts
-        if result['changed']:
-            result['after'] = changed_bgp_as_paths_facts
-
-        new_config = changed_bgp_as_paths_facts
         old_config = existing_bgp_as_paths_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_bgp_as_paths_facts,
-                                        TEST_KEYS_generate_config)
-            new_config = remove_void_config(new_config, TEST_KEYS_sort_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_bgp_as_paths_facts,
+                                            TEST_KEYS_generate_config)
+                new_config = remove_void_config(new_config, TEST_KEYS_sort_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_bgp_as_paths_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             new_config = sort_config(new_config)
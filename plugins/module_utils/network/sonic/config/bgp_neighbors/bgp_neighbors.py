@@ -25,6 +25,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_config_keys,
+    set_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states,
     get_diff,
@@ -36,7 +40,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.sort_config_util import (
     sort_config,
@@ -239,6 +246,7 @@ class Bgp_neighbors(ConfigBase):
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
+        set_facts_key_filter(self._module, 'bgp_neighbors', get_config_keys(self._module, lambda conf: [conf['vrf_name']]))
         facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
         bgp_facts = facts['ansible_network_resources'].get('bgp_neighbors')
         if not bgp_facts:
@@ -267,16 +275,21 @@ class Bgp_neighbors(ConfigBase):
         result['before'] = existing_bgp_facts
         old_config = existing_bgp_facts
 
-        if self._module.check_mode:
-            result.pop('after', None)
-            old_config = self.pre_process_generated_config(commands, deepcopy(existing_bgp_facts))
-            new_config = get_new_config(commands, old_config,
-                                        TEST_KEYS_generate_config)
-            new_config = self.post_process_generated_config(new_config)
-            new_config = remove_empties_from_list(new_config)
-            new_config = sort_config(new_config, TEST_KEYS_sort_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                result.pop('after', None)
+                old_config = self.pre_process_generated_config(commands, deepcopy(existing_bgp_facts))
+                new_config = get_new_config(commands, old_config,
+                                            TEST_KEYS_generate_config)
+                new_config = self.post_process_generated_config(new_config)
+                new_config = remove_empties_from_list(new_config)
+                new_config = sort_config(new_config, TEST_KEYS_sort_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             changed_bgp_facts = self.get_bgp_neighbors_facts()
             new_config = changed_bgp_facts
             new_config = sort_config(new_config, TEST_KEYS_sort_config)
@@ -287,7 +300,8 @@ class Bgp_neighbors(ConfigBase):
             new_config = sort_config(new_config, TEST_KEYS_sort_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       TEST_KEYS_generate_config)
         result['commands'] = commands
         return result
 
@@ -33,7 +33,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible.module_utils.connection import ConnectionError
@@ -181,19 +184,22 @@ class Br_l2pt(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_br_l2pt_facts = self.get_br_l2pt_facts()
-
         result['before'] = Br_l2pt.sort_lists_in_config(existing_br_l2pt_facts)
-        if result['changed']:
-            result['after'] = Br_l2pt.sort_lists_in_config(changed_br_l2pt_facts)
 
         old_config = existing_br_l2pt_facts
-        new_config = changed_br_l2pt_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_commands = remove_empties_from_list(commands)
-            new_config = get_new_config(commands, old_config, TEST_KEYS_generate_config)
-            result['after_generated'] = Br_l2pt.sort_lists_in_config(remove_empty_protocols(new_config))
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_commands = remove_empties_from_list(commands)
+                new_config = get_new_config(commands, old_config, TEST_KEYS_generate_config)
+                add_generated_config(self._module, result, Br_l2pt.sort_lists_in_config(remove_empty_protocols(new_config)))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_br_l2pt_facts()
+            if result['changed']:
+                result['after'] = Br_l2pt.sort_lists_in_config(new_config)
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
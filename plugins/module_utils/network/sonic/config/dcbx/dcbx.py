@@ -35,7 +35,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 import re
@@ -141,13 +144,18 @@ class Dcbx(ConfigBase):
         result['before'] = existing_dcbx_facts
 
         new_config = {}
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_dcbx_facts,
-                                        TEST_KEYS_generate_config)
-
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_dcbx_facts,
+                                            TEST_KEYS_generate_config)
+
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_dcbx_facts()
             result['after'] = new_config
 
@@ -38,7 +38,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_OP_DEFAULT,
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 
@@ -128,20 +131,22 @@ class Dhcp_snooping(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_dhcp_snooping_facts = self.get_dhcp_snooping_facts()
-
         result['before'] = existing_dhcp_snooping_facts
-        if result['changed']:
-            result['after'] = changed_dhcp_snooping_facts
-
-        new_config = changed_dhcp_snooping_facts
         old_config = existing_dhcp_snooping_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_dhcp_snooping_facts,
-                                        test_keys_generate_config)
-            new_config = remove_empties(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_dhcp_snooping_facts,
+                                            test_keys_generate_config)
+                new_config = remove_empties(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_dhcp_snooping_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_lists_in_config(new_config)
@@ -30,7 +30,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     edit_config,
@@ -115,11 +118,16 @@ class Drop_counter(ConfigBase):
 
         result['before'] = existing_drop_counter_facts
         old_config = existing_drop_counter_facts
-        if self._module.check_mode:
-            new_config = remove_empties_from_list(get_new_config(commands, existing_drop_counter_facts, TEST_KEYS_generate_config))
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = remove_empties_from_list(get_new_config(commands, existing_drop_counter_facts, TEST_KEYS_generate_config))
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_drop_counter_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __MERGE_OP_DEFAULT,
     __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ecmp_load_share.ecmp_load_share import (
     LOADSHARE_MODE_ATTR_MAP,
@@ -140,20 +143,22 @@ class Ecmp_load_share(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ecmp_load_share_facts = self.get_ecmp_load_share_facts()
-
         result['before'] = existing_ecmp_load_share_facts
-        if result['changed']:
-            result['after'] = changed_ecmp_load_share_facts
-
-        new_config = changed_ecmp_load_share_facts
         old_config = existing_ecmp_load_share_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, old_config,
-                                        TEST_KEYS_generate_config)
-            new_config = remove_empties(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, old_config,
+                                            TEST_KEYS_generate_config)
+                new_config = remove_empties(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_ecmp_load_share_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 FBS_CLASSIFIERS_PATH = 'data/openconfig-fbs-ext:fbs/classifiers'
@@ -128,19 +131,21 @@ class Fbs_classifiers(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_fbs_classifiers_facts = self.get_fbs_classifiers_facts()
-
         result['before'] = existing_fbs_classifiers_facts
-        if result['changed']:
-            result['after'] = changed_fbs_classifiers_facts
-
-        new_config = changed_fbs_classifiers_facts
         old_config = existing_fbs_classifiers_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_fbs_classifiers_facts, TEST_KEYS_generate_config)
-            self.post_process_generated_config(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_fbs_classifiers_facts, TEST_KEYS_generate_config)
+                self.post_process_generated_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_fbs_classifiers_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             self.sort_lists_in_config(new_config)
             self.sort_lists_in_config(old_config)
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 delete_all = False
@@ -139,12 +142,17 @@ class Fbs_groups(ConfigBase):
         result['before'] = existing_fbs_groups_facts
         old_config = existing_fbs_groups_facts
 
-        if self._module.check_mode:
-            new_config = remove_empties(get_new_config(commands, existing_fbs_groups_facts, TEST_KEYS_generate_config))
-            self.sort_lists_in_config(new_config)
-            self.handle_default_entries(new_config, False)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = remove_empties(get_new_config(commands, existing_fbs_groups_facts, TEST_KEYS_generate_config))
+                self.sort_lists_in_config(new_config)
+                self.handle_default_entries(new_config, False)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_fbs_groups_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -37,7 +37,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 is_delete_all = False
@@ -145,12 +148,17 @@ class Fbs_policies(ConfigBase):
 
         result['before'] = existing_fbs_policies_facts
         old_config = existing_fbs_policies_facts
-        if self._module.check_mode:
-            new_config = remove_empties_from_list(get_new_config(commands, existing_fbs_policies_facts, TEST_KEYS_generate_config))
-            self.sort_lists_in_config(new_config)
-            self.handle_default_entries(new_config, False)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = remove_empties_from_list(get_new_config(commands, existing_fbs_policies_facts, TEST_KEYS_generate_config))
+                self.sort_lists_in_config(new_config)
+                self.handle_default_entries(new_config, False)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_fbs_policies_facts()
             if result['changed']:
                 result['after'] = new_config
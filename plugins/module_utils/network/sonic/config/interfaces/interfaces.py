@@ -40,6 +40,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_config_keys,
+    set_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.interfaces_util import (
     build_interfaces_create_request,
     retrieve_default_intf_speed,
@@ -53,7 +57,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
@@ -153,6 +160,7 @@ class Interfaces(ConfigBase):
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
+        set_facts_key_filter(self._module, 'interfaces', get_config_keys(self._module, self.get_config_interface_names))
         facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
         interfaces_facts = facts['ansible_network_resources'].get('interfaces')
         if not interfaces_facts:
@@ -160,6 +168,12 @@ class Interfaces(ConfigBase):
 
         return interfaces_facts
 
+    def get_config_interface_names(self, conf):
+        """Return the normalized name of an interface of the 'config' option"""
+        intf = [{'name': conf['name']}]
+        normalize_interface_name(intf, self._module)
+        return [intf[0]['name']]
+
     def execute_module(self):
         """ Execute the module
 
@@ -180,29 +194,32 @@ class Interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_interfaces_facts = self.get_interfaces_facts()
-
         result['before'] = existing_interfaces_facts
-        if result['changed']:
-            result['after'] = changed_interfaces_facts
-
-        new_config = changed_interfaces_facts
         old_config = existing_interfaces_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_interfaces_facts,
-                                        TEST_KEYS_formatted_diff)
-            # See the above comment about natsort module
-            # new_config = natsorted(new_config, key=lambda x: x['name'])
-            # For time-being, use simple "sort"
-            new_config.sort(key=lambda x: x['name'])
-            result['after_generated'] = new_config
-            old_config.sort(key=lambda x: x['name'])
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_interfaces_facts,
+                                            TEST_KEYS_formatted_diff)
+                # See the above comment about natsort module
+                # new_config = natsorted(new_config, key=lambda x: x['name'])
+                # For time-being, use simple "sort"
+                new_config.sort(key=lambda x: x['name'])
+                add_generated_config(self._module, result, new_config)
+                old_config.sort(key=lambda x: x['name'])
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_interfaces_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
@@ -35,7 +35,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -159,11 +162,16 @@ class Ipv6_router_advertisement(ConfigBase):
 
         result['before'] = existing_ipv6_router_advertisement_facts
         old_config = existing_ipv6_router_advertisement_facts
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, old_config)
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, old_config)
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_ipv6_router_advertisement_facts()
             if result['changed']:
                 result['after'] = new_config
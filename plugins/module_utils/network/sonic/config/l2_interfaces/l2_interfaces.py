@@ -39,7 +39,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_CONFIG,
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
@@ -118,19 +121,21 @@ class L2_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_l2_interfaces_facts = self.get_l2_interfaces_facts()
-
         result['before'] = existing_l2_interfaces_facts
-        if result['changed']:
-            result['after'] = changed_l2_interfaces_facts
-
-        new_config = changed_l2_interfaces_facts
         old_config = existing_l2_interfaces_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_l2_interfaces_facts,
-                                        TEST_KEYS_formatted_diff)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_l2_interfaces_facts,
+                                            TEST_KEYS_formatted_diff)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_l2_interfaces_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             self.sort_config(new_config)
             self.sort_config(old_config)
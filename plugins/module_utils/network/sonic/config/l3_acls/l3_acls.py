@@ -28,6 +28,10 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     validate_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_config_keys,
+    set_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states
 )
@@ -38,7 +42,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 DELETE = 'delete'
@@ -146,12 +153,18 @@ class L3_acls(ConfigBase):
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
+        set_facts_key_filter(self._module, 'l3_acls', get_config_keys(self._module, self.get_config_acl_keys))
         facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
         l3_acls_facts = facts['ansible_network_resources'].get('l3_acls')
         if not l3_acls_facts:
             return []
         return l3_acls_facts
 
+    @staticmethod
+    def get_config_acl_keys(conf):
+        """Return the (address family, name) keys of the ACLs of an entry of the 'config' option"""
+        return [(conf['address_family'], acl['name']) for acl in conf.get('acls') or []]
+
     def execute_module(self):
         """ Execute the module
 
@@ -172,28 +185,31 @@ class L3_acls(ConfigBase):
 
             result['changed'] = True
 
-        changed_l3_acls_facts = self.get_l3_acls_facts()
-
         result['before'] = existing_l3_acls_facts
-        if result['changed']:
-            result['after'] = changed_l3_acls_facts
-
         result['commands'] = commands
 
-        new_config = changed_l3_acls_facts
         old_config = existing_l3_acls_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_l3_acls_facts,
-                                        TEST_KEYS_formatted_diff)
-            self.post_process_generated_config(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_l3_acls_facts,
+                                            TEST_KEYS_formatted_diff)
+                self.post_process_generated_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_l3_acls_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             self.sort_config(new_config)
             self.sort_config(old_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
@@ -39,7 +39,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.interfaces_util import (
@@ -140,11 +143,16 @@ class Lag_interfaces(ConfigBase):
 
         result['before'] = existing_lag_interfaces_facts
         old_config = existing_lag_interfaces_facts
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, existing_lag_interfaces_facts)
-            self.sort_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, existing_lag_interfaces_facts)
+                self.sort_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_lag_interfaces_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -37,7 +37,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_new_config,
     get_formatted_config_diff,
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
-    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -243,12 +246,17 @@ class Ldap(ConfigBase):
         result['before'] = existing_ldap_facts
         old_config = existing_ldap_facts
 
-        if self._module.check_mode:
-            existing_ldap_facts = remove_empties_from_list(existing_ldap_facts)
-            new_config = self._get_generated_config(commands, existing_ldap_facts, self._module.params['state'])
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                existing_ldap_facts = remove_empties_from_list(existing_ldap_facts)
+                new_config = self._get_generated_config(commands, existing_ldap_facts, self._module.params['state'])
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             changed_ldap_facts = self.get_ldap_facts()
             new_config = changed_ldap_facts
             if result['changed']:
@@ -29,7 +29,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -194,12 +197,17 @@ class Lldp_interfaces(ConfigBase):
         result['before'] = self.sort_lists_in_config(existing_lldp_interfaces_facts)
         old_config = existing_lldp_interfaces_facts
 
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_commands = remove_empties_from_list(commands)
-            new_config = self.get_new_config(new_commands, existing_lldp_interfaces_facts)
-            result['after_generated'] = self.sort_lists_in_config(new_config)
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                result.pop('after', None)
+                new_commands = remove_empties_from_list(commands)
+                new_config = self.get_new_config(new_commands, existing_lldp_interfaces_facts)
+                add_generated_config(self._module, result, self.sort_lists_in_config(new_config))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             changed_lldp_interfaces_facts = self.get_lldp_interfaces_facts()
             new_config = changed_lldp_interfaces_facts
             if result['changed']:
@@ -35,7 +35,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 NETWORK_INSTANCE_PATH = '/data/openconfig-network-instance:network-instances/network-instance'
@@ -126,20 +129,22 @@ class Mac(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mac_facts = self.get_mac_facts()
-
         result['before'] = existing_mac_facts
-        if result['changed']:
-            result['after'] = changed_mac_facts
-
-        new_config = changed_mac_facts
         old_config = existing_mac_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_mac_facts,
-                                        TEST_KEYS_generate_config)
-            new_config = remove_empties_from_list(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_mac_facts,
+                                            TEST_KEYS_generate_config)
+                new_config = remove_empties_from_list(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_mac_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_lists_in_config(new_config)
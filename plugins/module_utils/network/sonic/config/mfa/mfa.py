@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -138,11 +141,16 @@ class Mfa(ConfigBase):
         result['before'] = existing_mfa_facts
         old_config = existing_mfa_facts
 
-        if self._module.check_mode:
-            new_commands = deepcopy(commands)
-            new_config = get_new_config(new_commands, old_config, TEST_KEYS_formatted_diff)
-            result['after_generated'] = self._post_process_generated_output(new_config)
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_commands = deepcopy(commands)
+                new_config = get_new_config(new_commands, old_config, TEST_KEYS_formatted_diff)
+                add_generated_config(self._module, result, self._post_process_generated_output(new_config))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_mfa_facts()
             if result['changed']:
                 result['after'] = new_config
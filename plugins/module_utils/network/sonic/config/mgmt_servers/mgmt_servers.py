@@ -32,7 +32,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 SYS_PATH = '/data/openconfig-system:system'
@@ -185,18 +188,20 @@ class Mgmt_servers(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mgmt_servers_facts = self.get_mgmt_servers_facts()
-
         result['before'] = existing_mgmt_servers_facts
-        if result['changed']:
-            result['after'] = changed_mgmt_servers_facts
-
-        new_config = changed_mgmt_servers_facts
         old_config = existing_mgmt_servers_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_mgmt_servers_facts, TEST_KEYS_generate_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_mgmt_servers_facts, TEST_KEYS_generate_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_mgmt_servers_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
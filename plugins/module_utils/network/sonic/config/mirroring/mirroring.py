@@ -35,7 +35,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 PATCH = 'patch'
@@ -111,20 +114,22 @@ class Mirroring(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mirroring_facts = self.get_mirroring_facts()
-
         result['before'] = existing_mirroring_facts
-        if result['changed']:
-            result['after'] = changed_mirroring_facts
-
-        new_config = changed_mirroring_facts
         old_config = existing_mirroring_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, old_config, TEST_KEYS_generate_config)
-            new_config = remove_empties(new_config)
-            self.sort_mirrors(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, old_config, TEST_KEYS_generate_config)
+                new_config = remove_empties(new_config)
+                self.sort_mirrors(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_mirroring_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_mirrors(old_config)
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_OP_DEFAULT,
     __DELETE_SAME_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
@@ -147,7 +150,7 @@ def derive_delete_vlink(key_set, command, exist_conf):
             md_keys_after = []
             mdk_c_keys = {mdk["key_id"]: mdk for mdk in command.get("message_digest_list", [])}
             for md_key in exist_conf["message_digest_list"]:
-                md_key_c = mdk_c_keys[md_key["key_id"]]
+                md_key_c = mdk_c_keys.get(md_key["key_id"])
 
                 if md_key_c:
                     if len(md_key_c) == 1:
@@ -250,11 +253,16 @@ class Ospf_area(ConfigBase):
         new_config = deepcopy(existing_ospf_area_facts)
         # just used for diff mode, setting it to a default value that would show no differences. If there are changes then set to changed value
 
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_ospf_area_facts,
-                                        TEST_KEYS_generate_config)
-            result['after_generated'] = new_config
-        elif result['changed']:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_ospf_area_facts,
+                                            TEST_KEYS_generate_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated and result['changed']:
             new_config = self.get_ospf_area_facts()
             result['after'] = new_config
         if self._module._diff:
@@ -37,7 +37,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_new_config,
     get_formatted_config_diff,
     __DELETE_CONFIG,
-    __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF
+    __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -218,29 +221,32 @@ class Ospfv2(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ospfv2_facts = self.get_ospfv2_facts()
-
         result['before'] = existing_ospfv2_facts
-        if result['changed']:
-            result['after'] = changed_ospfv2_facts
-
-        new_config = changed_ospfv2_facts
         old_config = existing_ospfv2_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            existing_ospfv2_facts = remove_empties_from_list(existing_ospfv2_facts)
-            is_overridden = False
-            for cmd in commands:
-                if cmd['state'] == 'overridden':
-                    is_overridden = True
-                    break
-            if is_overridden:
-                new_config = get_new_config(commands, existing_ospfv2_facts, TEST_KEYS_overridden_diff)
-            else:
-                new_config = get_new_config(commands, existing_ospfv2_facts, TEST_KEYS_diff)
-            new_config = remove_empties_from_list(new_config)
-            result['after_generated'] = self._post_process_generated_output(new_config)
-            self.sort_lists_in_config(result['after_generated'])
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                existing_ospfv2_facts = remove_empties_from_list(existing_ospfv2_facts)
+                is_overridden = False
+                for cmd in commands:
+                    if cmd['state'] == 'overridden':
+                        is_overridden = True
+                        break
+                if is_overridden:
+                    new_config = get_new_config(commands, existing_ospfv2_facts, TEST_KEYS_overridden_diff)
+                else:
+                    new_config = get_new_config(commands, existing_ospfv2_facts, TEST_KEYS_diff)
+                new_config = remove_empties_from_list(new_config)
+                generated_config = self._post_process_generated_output(new_config)
+                self.sort_lists_in_config(generated_config)
+                add_generated_config(self._module, result, generated_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_ospfv2_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
@@ -35,7 +35,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
     get_formatted_config_diff,
-    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -130,31 +133,32 @@ class Ospfv2_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ospfv2_interfaces_facts = self.get_ospfv2_interfaces_facts()
-
         result['before'] = existing_ospfv2_interfaces_facts
-        if result['changed']:
-            result['after'] = changed_ospfv2_interfaces_facts
-
-        new_config = changed_ospfv2_interfaces_facts
         old_config = existing_ospfv2_interfaces_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_commands = deepcopy(commands)
-            self._add_default_address(new_commands)
-            self._add_default_address(new_config)
-            self._add_default_address(old_config)
-
-            if self._module.params['state'] == 'overridden':
-                new_config = get_new_config(new_commands, old_config, TEST_KEYS_overridden_diff)
-            else:
-                new_config = get_new_config(new_commands, old_config, TEST_KEYS)
-            self._add_default_address(new_config)
-            self.sort_lists_in_config(new_config)
-            new_config = self._get_generated_config(new_commands, new_config, self._module.params['state'])
-            self._strip_default_address(new_config)
-            self._strip_default_address(old_config)
-            result['after_generated'] = remove_empties_from_list(new_config)
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_commands = deepcopy(commands)
+                self._add_default_address(new_commands)
+                self._add_default_address(old_config)
+
+                if self._module.params['state'] == 'overridden':
+                    new_config = get_new_config(new_commands, old_config, TEST_KEYS_overridden_diff)
+                else:
+                    new_config = get_new_config(new_commands, old_config, TEST_KEYS)
+                self._add_default_address(new_config)
+                self.sort_lists_in_config(new_config)
+                new_config = self._get_generated_config(new_commands, new_config, self._module.params['state'])
+                self._strip_default_address(new_config)
+                self._strip_default_address(old_config)
+                add_generated_config(self._module, result, remove_empties_from_list(new_config))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_ospfv2_interfaces_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
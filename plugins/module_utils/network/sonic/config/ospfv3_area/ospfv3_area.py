@@ -32,7 +32,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
@@ -127,11 +130,16 @@ class Ospfv3_area(ConfigBase):
         result['before'] = existing_ospfv3_area_facts
         new_config = deepcopy(existing_ospfv3_area_facts)
 
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, existing_ospfv3_area_facts)
-            new_config.sort(key=lambda x: (x['vrf_name'], x['area_id']))
-            result['after_generated'] = new_config
-        elif result['changed']:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, existing_ospfv3_area_facts)
+                new_config.sort(key=lambda x: (x['vrf_name'], x['area_id']))
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated and result['changed']:
             new_config = self.get_ospfv3_area_facts()
             new_config.sort(key=lambda x: (x['vrf_name'], x['area_id']))
             result['after'] = new_config
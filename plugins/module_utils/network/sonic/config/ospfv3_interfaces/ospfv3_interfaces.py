@@ -21,7 +21,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
     get_formatted_config_diff,
-    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -101,21 +104,23 @@ class Ospfv3_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ospfv3_interfaces_facts = self.get_ospfv3_interfaces_facts()
-
         result['before'] = existing_ospfv3_interfaces_facts
-        if result['changed']:
-            result['after'] = changed_ospfv3_interfaces_facts
-
-        new_config = changed_ospfv3_interfaces_facts
         old_config = existing_ospfv3_interfaces_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_commands = deepcopy(commands)
-            new_config = get_new_config(new_commands, old_config, TEST_KEYS)
-            new_config = self.new_cfg(new_config)
-            new_config.sort(key=lambda x: x['name'])
-            result['after_generated'] = remove_empties_from_list(new_config)
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_commands = deepcopy(commands)
+                new_config = get_new_config(new_commands, old_config, TEST_KEYS)
+                new_config = self.new_cfg(new_config)
+                new_config.sort(key=lambda x: x['name'])
+                add_generated_config(self._module, result, remove_empties_from_list(new_config))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_ospfv3_interfaces_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
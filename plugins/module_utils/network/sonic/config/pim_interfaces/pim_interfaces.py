@@ -36,7 +36,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_formatted_config_diff,
-    get_new_config
+    get_new_config,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -110,10 +113,15 @@ class Pim_interfaces(ConfigBase):
         result['before'] = existing_pim_interfaces_facts
         old_config = existing_pim_interfaces_facts
 
-        if self._module.check_mode:
-            new_config = self.get_generated_config(commands, existing_pim_interfaces_facts)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_generated_config(commands, existing_pim_interfaces_facts)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             changed_pim_interfaces_facts = self.get_pim_interfaces_facts()
             new_config = changed_pim_interfaces_facts
             if result['changed']:
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -102,11 +105,16 @@ class Pms(ConfigBase):
         result['before'] = existing_pms_facts
         new_config = deepcopy(existing_pms_facts)
 
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, existing_pms_facts)
-            new_config.sort(key=lambda x: x['name'])
-            result['after_generated'] = remove_empties_from_list(new_config)
-        elif result['changed']:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, existing_pms_facts)
+                new_config.sort(key=lambda x: x['name'])
+                add_generated_config(self._module, result, remove_empties_from_list(new_config))
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated and result['changed']:
             new_config = self.get_pms_facts()
             new_config.sort(key=lambda x: x['name'])
             result['after'] = new_config
@@ -43,7 +43,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_OP_DEFAULT,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 
@@ -203,11 +206,16 @@ class Poe(ConfigBase):
         # setting new config to a default value, if there are changes then set to changed value
         new_config = existing_poe_facts
 
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_poe_facts,
-                                        TEST_KEYS_generate_config)
-            result['after_generated'] = new_config
-        elif result['changed']:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_poe_facts,
+                                            TEST_KEYS_generate_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated and result['changed']:
             new_config = self.get_poe_facts()
             result['after'] = new_config
 
@@ -39,7 +39,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -139,10 +142,15 @@ class Ptp_port_ds(ConfigBase):
         result['before'] = existing_ptp_port_ds_facts
         old_config = existing_ptp_port_ds_facts
 
-        if self._module.check_mode:
-            new_config = self.get_generated_config(commands, existing_ptp_port_ds_facts)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_generated_config(commands, existing_ptp_port_ds_facts)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_ptp_port_ds_facts()
             new_config = remove_empties_from_list(new_config)
             if result['changed']:
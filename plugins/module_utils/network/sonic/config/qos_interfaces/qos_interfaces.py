@@ -29,7 +29,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
@@ -151,12 +154,17 @@ class Qos_interfaces(ConfigBase):
         result['before'] = existing_qos_interfaces_facts
         old_config = existing_qos_interfaces_facts
 
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_qos_interfaces_facts, TEST_KEYS_generate_config)
-            self.post_process_generated_config(new_config)
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_qos_interfaces_facts, TEST_KEYS_generate_config)
+                self.post_process_generated_config(new_config)
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_qos_interfaces_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -34,7 +34,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 
@@ -93,18 +96,20 @@ class Qos_pfc(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_qos_pfc_facts = self.get_qos_pfc_facts()
-
         result['before'] = existing_qos_pfc_facts
-        if result['changed']:
-            result['after'] = changed_qos_pfc_facts
-
-        new_config = changed_qos_pfc_facts
         old_config = existing_qos_pfc_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_qos_pfc_facts)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_qos_pfc_facts)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_qos_pfc_facts()
+            if result['changed']:
+                result['after'] = new_config
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
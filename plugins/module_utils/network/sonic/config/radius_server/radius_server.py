@@ -27,7 +27,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_formatted_config_diff,
-    get_new_config
+    get_new_config,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
@@ -103,10 +106,15 @@ class Radius_server(ConfigBase):
         result['before'] = existing_radius_server_facts
         old_config = existing_radius_server_facts
 
-        if self._module.check_mode:
-            new_config = self.get_new_config(commands, existing_radius_server_facts)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = self.get_new_config(commands, existing_radius_server_facts)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_radius_server_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -33,7 +33,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __MERGE_OP_DEFAULT,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 
@@ -96,7 +99,9 @@ class Roce(ConfigBase):
         if commands and len(requests) > 0:
             if not self._module.check_mode:
                 try:
-                    edit_config_reboot(self._module, to_request(self._module, requests))
+                    downtime = edit_config_reboot(self._module, to_request(self._module, requests))
+                    if downtime is not None:
+                        result['reboot_downtime'] = downtime
                 except ConnectionError as exc:
                     pass
             result['changed'] = True
@@ -105,10 +110,15 @@ class Roce(ConfigBase):
         result['before'] = existing_roce_facts
         old_config = existing_roce_facts
 
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_roce_facts, TEST_KEYS_generate_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_roce_facts, TEST_KEYS_generate_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_roce_facts()
             if result['changed']:
                 result['after'] = new_config
@@ -36,7 +36,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
@@ -155,27 +158,30 @@ class Static_routes(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_static_routes_facts = self.get_static_routes_facts()
-
         result['before'] = existing_static_routes_facts
-        if result['changed']:
-            result['after'] = changed_static_routes_facts
-
-        new_config = changed_static_routes_facts
         old_config = existing_static_routes_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = get_new_config(commands, existing_static_routes_facts,
-                                        TEST_KEYS_formatted_diff)
-            self.post_process_generated_config(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_static_routes_facts,
+                                            TEST_KEYS_formatted_diff)
+                self.post_process_generated_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_static_routes_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_lists_in_config(new_config)
             self.sort_lists_in_config(old_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
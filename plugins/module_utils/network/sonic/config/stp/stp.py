@@ -36,7 +36,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     __DELETE_OP_DEFAULT,
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -149,22 +152,24 @@ class Stp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_stp_facts = self.get_stp_facts()
-
         result['before'] = existing_stp_facts
-        if result['changed']:
-            result['after'] = changed_stp_facts
-
-        new_config = changed_stp_facts
         old_config = existing_stp_facts
-        if self._module.check_mode:
-            result.pop('after', None)
-            for command in commands:
-                self.transform_config_for_diff_check(command)
-            self.transform_config_for_diff_check(existing_stp_facts)
-            new_config = get_new_config(commands, existing_stp_facts, TEST_KEYS_generate_config)
-            new_config = self.post_process_generated_config(new_config)
-            result['after_generated'] = new_config
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                for command in commands:
+                    self.transform_config_for_diff_check(command)
+                self.transform_config_for_diff_check(existing_stp_facts)
+                new_config = get_new_config(commands, existing_stp_facts, TEST_KEYS_generate_config)
+                new_config = self.post_process_generated_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
+            new_config = self.get_stp_facts()
+            if result['changed']:
+                result['after'] = new_config
 
         if self._module._diff:
             self.sort_lists_in_config(new_config)
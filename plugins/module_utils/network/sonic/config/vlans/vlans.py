@@ -28,6 +28,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     update_states,
     remove_empties_from_list,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_config_keys,
+    set_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.interfaces_util import (
     build_interfaces_create_request,
 )
@@ -37,7 +41,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     get_new_config,
-    get_formatted_config_diff
+    get_formatted_config_diff,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -88,6 +95,7 @@ class Vlans(ConfigBase):
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
+        set_facts_key_filter(self._module, 'vlans', get_config_keys(self._module, lambda conf: [conf['vlan_id']]))
         facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
         vlans_facts = facts['ansible_network_resources'].get('vlans')
         if not vlans_facts:
@@ -116,12 +124,17 @@ class Vlans(ConfigBase):
         result['before'] = existing_vlans_facts
         old_config = existing_vlans_facts
 
-        if self._module.check_mode:
-            new_config = get_new_config(commands, existing_vlans_facts, test_keys_generate_config)
-            new_config = self.deal_with_default_entries(new_config)
-            new_config.sort(key=lambda x: x['vlan_id'])
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                new_config = get_new_config(commands, existing_vlans_facts, test_keys_generate_config)
+                new_config = self.deal_with_default_entries(new_config)
+                new_config.sort(key=lambda x: x['vlan_id'])
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             new_config = self.get_vlans_facts()
             if result['changed']:
                 result['after'] = new_config
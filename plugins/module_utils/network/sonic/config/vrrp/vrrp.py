@@ -38,7 +38,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_new_config,
     get_formatted_config_diff,
     __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
-    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    use_generated_config,
+    warn_generated_config_error,
+    add_generated_config
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -167,12 +170,17 @@ class Vrrp(ConfigBase):
         result['before'] = existing_vrrp_facts
         old_config = existing_vrrp_facts
 
-        if self._module.check_mode:
-            result.pop('after', None)
-            new_config = self._get_generated_config(commands, existing_vrrp_facts, self._module.params['state'])
-            self.sort_lists_in_config(new_config)
-            result['after_generated'] = new_config
-        else:
+        generated = use_generated_config(self._module)
+        if generated:
+            try:
+                result.pop('after', None)
+                new_config = self._get_generated_config(commands, existing_vrrp_facts, self._module.params['state'])
+                self.sort_lists_in_config(new_config)
+                add_generated_config(self._module, result, new_config)
+            except Exception as exc:
+                warn_generated_config_error(self._module, exc)
+                generated = False
+        if not generated:
             changed_vrrp_facts = self.get_vrrp_facts()
             new_config = changed_vrrp_facts
             self.sort_lists_in_config(new_config)
@@ -18,14 +18,19 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors.bgp_neighbors import Bgp_neighborsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_bgp_neighbors,
     get_from_params_map,
-    get_peergroups,
 )
 
 
@@ -97,7 +102,7 @@ class Bgp_neighborsFacts(object):
         objs = list()
 
         if not data:
-            data = get_all_bgp_neighbors(self._module)
+            data = get_all_bgp_neighbors(self._module, peer_groups=True, vrfs=get_facts_key_filter(self._module, 'bgp_neighbors'))
             filtered_data = self.filter_neighbors_data(data)
             if filtered_data:
                 data = filtered_data
@@ -111,7 +116,7 @@ class Bgp_neighborsFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['bgp_neighbors'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -141,7 +146,7 @@ class Bgp_neighborsFacts(object):
 
             tmp['vrf_name'] = vrf_name
             tmp['bgp_as'] = bgp_as
-            peergroup = get_peergroups(self._module, vrf_name)
+            peergroup = conf.get('peer_groups')
             if peergroup:
                 tmp['peer_group'] = peergroup
             fil_neighbors = []
@@ -17,6 +17,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
@@ -61,7 +64,7 @@ class Br_l2ptFacts(object):
         ansible_facts['ansible_network_resources'].pop('br_l2pt', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['br_l2pt'] = remove_empties_from_list(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
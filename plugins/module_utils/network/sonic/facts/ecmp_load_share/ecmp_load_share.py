@@ -18,6 +18,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
@@ -203,7 +206,7 @@ class Ecmp_load_shareFacts(object):
         ansible_facts['ansible_network_resources'].pop('ecmp_load_share', None)
         facts = {}
         if ecmp_load_share_facts:
-            params = utils.validate_config(self.argument_spec, {'config': ecmp_load_share_facts})
+            params = validate_config(self.argument_spec, {'config': ecmp_load_share_facts})
             facts['ecmp_load_share'] = remove_empties(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -16,6 +16,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.evpn_esi_multihome.evpn_esi_multihome import Evpn_esi_multihomeArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
@@ -61,7 +64,7 @@ class Evpn_esi_multihomeFacts(object):
         facts = {}
 
         if evpn_esi_mh:
-            params = utils.validate_config(self.argument_spec, {'config': evpn_esi_mh})
+            params = validate_config(self.argument_spec, {'config': evpn_esi_mh})
             facts['evpn_esi_multihome'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
 
@@ -12,188 +12,392 @@ calls the appropriate facts gathering function
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import threading
+from copy import deepcopy
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils._text import to_text
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_connection
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.data_source_utils import DataSource
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_cache_utils import get_facts_cache
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import has_facts_key_filter
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.fingerprint_utils import get_config_fingerprints
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
-    Bgp_ext_communitiesFacts,
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2_interfaces.ospfv2_interfaces import Ospfv2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3_interfaces.ospfv3_interfaces import Ospfv3_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2.ospfv2 import Ospfv2Facts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3_area.ospfv3_area import Ospfv3_areaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3.ospfv3 import Ospfv3Facts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrrp.vrrp import VrrpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pms.pms import PmsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ldap.ldap import LdapFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pki.pki import PkiFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor_interfaces.ip_neighbor_interfaces import (
-    Ip_neighbor_interfacesFacts
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ipv6_router_advertisement.ipv6_router_advertisement import (
-    Ipv6_router_advertisementFacts
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_snooping.dhcp_snooping import Dhcp_snoopingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_interfaces.lldp_interfaces import Lldp_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ptp_default_ds.ptp_default_ds import Ptp_default_dsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.stp.stp import StpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.sflow.sflow import SflowFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fips.fips import FipsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.roce.roce import RoceFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer import Qos_bufferFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_pfc.qos_pfc import Qos_pfcFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_maps.qos_maps import Qos_mapsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_scheduler.qos_scheduler import Qos_schedulerFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred import Qos_wredFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_interfaces.qos_interfaces import Qos_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_global.pim_global import Pim_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_interfaces.pim_interfaces import Pim_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.login_lockout.login_lockout import Login_lockoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.poe.poe import PoeFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mgmt_servers.mgmt_servers import Mgmt_serversFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospf_area.ospf_area import Ospf_areaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh.ssh import SshFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lst.lst import LstFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_classifiers.fbs_classifiers import Fbs_classifiersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_groups.fbs_groups import Fbs_groupsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_policies.fbs_policies import Fbs_policiesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ars.ars import ArsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.network_policy.network_policy import Network_policyFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.br_l2pt.br_l2pt import Br_l2ptFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mirroring.mirroring import MirroringFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mfa.mfa import MfaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.drop_counter.drop_counter import Drop_counterFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.evpn_esi_multihome.evpn_esi_multihome import Evpn_esi_multihomeFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ptp_port_ds.ptp_port_ds import Ptp_port_dsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dcbx.dcbx import DcbxFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh_server.ssh_server import Ssh_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ecmp_load_share.ecmp_load_share import Ecmp_load_shareFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_interfaces.fbs_interfaces import Fbs_interfacesFacts
+
+
+class FactsRegistry(Mapping):
+    """Mapping of the resource names to their facts classes, which imports
+    a facts class when it is first looked up
+    """
+
+    def __init__(self, resources, importer):
+        self._resources = tuple(resources)
+        self._importer = importer
+        self._classes = {}
+
+    def __getitem__(self, resource):
+        if resource not in self._resources:
+            raise KeyError(resource)
+        if resource not in self._classes:
+            self._classes[resource] = self._importer(resource)
+        return self._classes[resource]
+
+    def __iter__(self):
+        return iter(self._resources)
+
+    def __len__(self):
+        return len(self._resources)
+
+    def __contains__(self, resource):
+        return resource in self._resources
+
+
+def import_facts_class(resource):
+    """Import the facts class of a resource
+
+    The imports are written as import statements, for Ansible to find
+    the facts modules and package them with the module.
+    """
+    if resource == 'vlans':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts as facts_class
+    elif resource == 'interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts as facts_class
+    elif resource == 'l2_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import (
+            L2_interfacesFacts as facts_class
+        )
+    elif resource == 'l3_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import (
+            L3_interfacesFacts as facts_class
+        )
+    elif resource == 'lag_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import (
+            Lag_interfacesFacts as facts_class
+        )
+    elif resource == 'bgp':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts as facts_class
+    elif resource == 'bgp_af':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts as facts_class
+    elif resource == 'bgp_neighbors':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import (
+            Bgp_neighborsFacts as facts_class
+        )
+    elif resource == 'bgp_neighbors_af':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import (
+            Bgp_neighbors_afFacts as facts_class
+        )
+    elif resource == 'bgp_as_paths':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import (
+            Bgp_as_pathsFacts as facts_class
+        )
+    elif resource == 'bgp_communities':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import (
+            Bgp_communitiesFacts as facts_class
+        )
+    elif resource == 'bgp_ext_communities':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
+            Bgp_ext_communitiesFacts as facts_class
+        )
+    elif resource == 'ospfv2_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2_interfaces.ospfv2_interfaces import (
+            Ospfv2_interfacesFacts as facts_class
+        )
+    elif resource == 'ospfv3_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3_interfaces.ospfv3_interfaces import (
+            Ospfv3_interfacesFacts as facts_class
+        )
+    elif resource == 'ospfv2':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2.ospfv2 import Ospfv2Facts as facts_class
+    elif resource == 'ospfv3_area':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3_area.ospfv3_area import (
+            Ospfv3_areaFacts as facts_class
+        )
+    elif resource == 'ospfv3':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv3.ospfv3 import Ospfv3Facts as facts_class
+    elif resource == 'mclag':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts as facts_class
+    elif resource == 'prefix_lists':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import (
+            Prefix_listsFacts as facts_class
+        )
+    elif resource == 'vlan_mapping':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import (
+            Vlan_mappingFacts as facts_class
+        )
+    elif resource == 'vrfs':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts as facts_class
+    elif resource == 'vrrp':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrrp.vrrp import VrrpFacts as facts_class
+    elif resource == 'vxlans':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts as facts_class
+    elif resource == 'users':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts as facts_class
+    elif resource == 'system':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts as facts_class
+    elif resource == 'port_breakout':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import (
+            Port_breakoutFacts as facts_class
+        )
+    elif resource == 'pms':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pms.pms import PmsFacts as facts_class
+    elif resource == 'ptp_default_ds':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ptp_default_ds.ptp_default_ds import (
+            Ptp_default_dsFacts as facts_class
+        )
+    elif resource == 'aaa':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts as facts_class
+    elif resource == 'ldap':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ldap.ldap import LdapFacts as facts_class
+    elif resource == 'tacacs_server':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import (
+            Tacacs_serverFacts as facts_class
+        )
+    elif resource == 'radius_server':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import (
+            Radius_serverFacts as facts_class
+        )
+    elif resource == 'static_routes':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import (
+            Static_routesFacts as facts_class
+        )
+    elif resource == 'ntp':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts as facts_class
+    elif resource == 'logging':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts as facts_class
+    elif resource == 'pki':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pki.pki import PkiFacts as facts_class
+    elif resource == 'ip_neighbor':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import (
+            Ip_neighborFacts as facts_class
+        )
+    elif resource == 'ip_neighbor_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor_interfaces.ip_neighbor_interfaces import (
+            Ip_neighbor_interfacesFacts as facts_class
+        )
+    elif resource == 'ipv6_router_advertisement':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ipv6_router_advertisement.ipv6_router_advertisement import (
+            Ipv6_router_advertisementFacts as facts_class
+        )
+    elif resource == 'port_group':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts as facts_class
+    elif resource == 'dhcp_relay':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts as facts_class
+    elif resource == 'dhcp_snooping':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_snooping.dhcp_snooping import (
+            Dhcp_snoopingFacts as facts_class
+        )
+    elif resource == 'acl_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import (
+            Acl_interfacesFacts as facts_class
+        )
+    elif resource == 'l2_acls':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts as facts_class
+    elif resource == 'l3_acls':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts as facts_class
+    elif resource == 'lldp_global':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import (
+            Lldp_globalFacts as facts_class
+        )
+    elif resource == 'mac':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts as facts_class
+    elif resource == 'bfd':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts as facts_class
+    elif resource == 'copp':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts as facts_class
+    elif resource == 'route_maps':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts as facts_class
+    elif resource == 'lldp_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_interfaces.lldp_interfaces import (
+            Lldp_interfacesFacts as facts_class
+        )
+    elif resource == 'stp':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.stp.stp import StpFacts as facts_class
+    elif resource == 'sflow':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.sflow.sflow import SflowFacts as facts_class
+    elif resource == 'fips':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fips.fips import FipsFacts as facts_class
+    elif resource == 'roce':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.roce.roce import RoceFacts as facts_class
+    elif resource == 'qos_buffer':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer import Qos_bufferFacts as facts_class
+    elif resource == 'qos_pfc':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_pfc.qos_pfc import Qos_pfcFacts as facts_class
+    elif resource == 'qos_maps':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_maps.qos_maps import Qos_mapsFacts as facts_class
+    elif resource == 'qos_scheduler':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_scheduler.qos_scheduler import (
+            Qos_schedulerFacts as facts_class
+        )
+    elif resource == 'qos_wred':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred import Qos_wredFacts as facts_class
+    elif resource == 'qos_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_interfaces.qos_interfaces import (
+            Qos_interfacesFacts as facts_class
+        )
+    elif resource == 'pim_global':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_global.pim_global import Pim_globalFacts as facts_class
+    elif resource == 'pim_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_interfaces.pim_interfaces import (
+            Pim_interfacesFacts as facts_class
+        )
+    elif resource == 'login_lockout':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.login_lockout.login_lockout import (
+            Login_lockoutFacts as facts_class
+        )
+    elif resource == 'poe':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.poe.poe import PoeFacts as facts_class
+    elif resource == 'mgmt_servers':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mgmt_servers.mgmt_servers import (
+            Mgmt_serversFacts as facts_class
+        )
+    elif resource == 'ospf_area':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospf_area.ospf_area import Ospf_areaFacts as facts_class
+    elif resource == 'ssh':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh.ssh import SshFacts as facts_class
+    elif resource == 'lst':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lst.lst import LstFacts as facts_class
+    elif resource == 'fbs_classifiers':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_classifiers.fbs_classifiers import (
+            Fbs_classifiersFacts as facts_class
+        )
+    elif resource == 'fbs_groups':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_groups.fbs_groups import Fbs_groupsFacts as facts_class
+    elif resource == 'fbs_policies':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_policies.fbs_policies import (
+            Fbs_policiesFacts as facts_class
+        )
+    elif resource == 'ars':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ars.ars import ArsFacts as facts_class
+    elif resource == 'network_policy':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.network_policy.network_policy import (
+            Network_policyFacts as facts_class
+        )
+    elif resource == 'mirroring':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mirroring.mirroring import MirroringFacts as facts_class
+    elif resource == 'mfa':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mfa.mfa import MfaFacts as facts_class
+    elif resource == 'dcbx':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dcbx.dcbx import DcbxFacts as facts_class
+    elif resource == 'drop_counter':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.drop_counter.drop_counter import (
+            Drop_counterFacts as facts_class
+        )
+    elif resource == 'br_l2pt':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.br_l2pt.br_l2pt import Br_l2ptFacts as facts_class
+    elif resource == 'ptp_port_ds':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ptp_port_ds.ptp_port_ds import (
+            Ptp_port_dsFacts as facts_class
+        )
+    elif resource == 'evpn_esi_multihome':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.evpn_esi_multihome.evpn_esi_multihome import (
+            Evpn_esi_multihomeFacts as facts_class
+        )
+    elif resource == 'ssh_server':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh_server.ssh_server import Ssh_serverFacts as facts_class
+    elif resource == 'ecmp_load_share':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ecmp_load_share.ecmp_load_share import (
+            Ecmp_load_shareFacts as facts_class
+        )
+    elif resource == 'fbs_interfaces':
+        from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_interfaces.fbs_interfaces import (
+            Fbs_interfacesFacts as facts_class
+        )
+    else:
+        raise KeyError(resource)
+    return facts_class
+
 
 FACT_LEGACY_SUBSETS = {}
-FACT_RESOURCE_SUBSETS = dict(
-    vlans=VlansFacts,
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_interfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    bgp=BgpFacts,
-    bgp_af=Bgp_afFacts,
-    bgp_neighbors=Bgp_neighborsFacts,
-    bgp_neighbors_af=Bgp_neighbors_afFacts,
-    bgp_as_paths=Bgp_as_pathsFacts,
-    bgp_communities=Bgp_communitiesFacts,
-    bgp_ext_communities=Bgp_ext_communitiesFacts,
-    ospfv2_interfaces=Ospfv2_interfacesFacts,
-    ospfv3_interfaces=Ospfv3_interfacesFacts,
-    ospfv2=Ospfv2Facts,
-    ospfv3_area=Ospfv3_areaFacts,
-    ospfv3=Ospfv3Facts,
-    mclag=MclagFacts,
-    prefix_lists=Prefix_listsFacts,
-    vlan_mapping=Vlan_mappingFacts,
-    vrfs=VrfsFacts,
-    vrrp=VrrpFacts,
-    vxlans=VxlansFacts,
-    users=UsersFacts,
-    system=SystemFacts,
-    port_breakout=Port_breakoutFacts,
-    pms=PmsFacts,
-    ptp_default_ds=Ptp_default_dsFacts,
-    aaa=AaaFacts,
-    ldap=LdapFacts,
-    tacacs_server=Tacacs_serverFacts,
-    radius_server=Radius_serverFacts,
-    static_routes=Static_routesFacts,
-    ntp=NtpFacts,
-    logging=LoggingFacts,
-    pki=PkiFacts,
-    ip_neighbor=Ip_neighborFacts,
-    ip_neighbor_interfaces=Ip_neighbor_interfacesFacts,
-    ipv6_router_advertisement=Ipv6_router_advertisementFacts,
-    port_group=Port_groupFacts,
-    dhcp_relay=Dhcp_relayFacts,
-    dhcp_snooping=Dhcp_snoopingFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    l2_acls=L2_aclsFacts,
-    l3_acls=L3_aclsFacts,
-    lldp_global=Lldp_globalFacts,
-    mac=MacFacts,
-    bfd=BfdFacts,
-    copp=CoppFacts,
-    route_maps=Route_mapsFacts,
-    lldp_interfaces=Lldp_interfacesFacts,
-    stp=StpFacts,
-    sflow=SflowFacts,
-    fips=FipsFacts,
-    roce=RoceFacts,
-    qos_buffer=Qos_bufferFacts,
-    qos_pfc=Qos_pfcFacts,
-    qos_maps=Qos_mapsFacts,
-    qos_scheduler=Qos_schedulerFacts,
-    qos_wred=Qos_wredFacts,
-    qos_interfaces=Qos_interfacesFacts,
-    pim_global=Pim_globalFacts,
-    pim_interfaces=Pim_interfacesFacts,
-    login_lockout=Login_lockoutFacts,
-    poe=PoeFacts,
-    mgmt_servers=Mgmt_serversFacts,
-    ospf_area=Ospf_areaFacts,
-    ssh=SshFacts,
-    lst=LstFacts,
-    fbs_classifiers=Fbs_classifiersFacts,
-    fbs_groups=Fbs_groupsFacts,
-    fbs_policies=Fbs_policiesFacts,
-    ars=ArsFacts,
-    network_policy=Network_policyFacts,
-    mirroring=MirroringFacts,
-    mfa=MfaFacts,
-    dcbx=DcbxFacts,
-    drop_counter=Drop_counterFacts,
-    br_l2pt=Br_l2ptFacts,
-    ptp_port_ds=Ptp_port_dsFacts,
-    evpn_esi_multihome=Evpn_esi_multihomeFacts,
-    ssh_server=Ssh_serverFacts,
-    ecmp_load_share=Ecmp_load_shareFacts,
-    fbs_interfaces=Fbs_interfacesFacts
-)
+FACT_RESOURCE_SUBSETS = FactsRegistry((
+    'vlans',
+    'interfaces',
+    'l2_interfaces',
+    'l3_interfaces',
+    'lag_interfaces',
+    'bgp',
+    'bgp_af',
+    'bgp_neighbors',
+    'bgp_neighbors_af',
+    'bgp_as_paths',
+    'bgp_communities',
+    'bgp_ext_communities',
+    'ospfv2_interfaces',
+    'ospfv3_interfaces',
+    'ospfv2',
+    'ospfv3_area',
+    'ospfv3',
+    'mclag',
+    'prefix_lists',
+    'vlan_mapping',
+    'vrfs',
+    'vrrp',
+    'vxlans',
+    'users',
+    'system',
+    'port_breakout',
+    'pms',
+    'ptp_default_ds',
+    'aaa',
+    'ldap',
+    'tacacs_server',
+    'radius_server',
+    'static_routes',
+    'ntp',
+    'logging',
+    'pki',
+    'ip_neighbor',
+    'ip_neighbor_interfaces',
+    'ipv6_router_advertisement',
+    'port_group',
+    'dhcp_relay',
+    'dhcp_snooping',
+    'acl_interfaces',
+    'l2_acls',
+    'l3_acls',
+    'lldp_global',
+    'mac',
+    'bfd',
+    'copp',
+    'route_maps',
+    'lldp_interfaces',
+    'stp',
+    'sflow',
+    'fips',
+    'roce',
+    'qos_buffer',
+    'qos_pfc',
+    'qos_maps',
+    'qos_scheduler',
+    'qos_wred',
+    'qos_interfaces',
+    'pim_global',
+    'pim_interfaces',
+    'login_lockout',
+    'poe',
+    'mgmt_servers',
+    'ospf_area',
+    'ssh',
+    'lst',
+    'fbs_classifiers',
+    'fbs_groups',
+    'fbs_policies',
+    'ars',
+    'network_policy',
+    'mirroring',
+    'mfa',
+    'dcbx',
+    'drop_counter',
+    'br_l2pt',
+    'ptp_port_ds',
+    'evpn_esi_multihome',
+    'ssh_server',
+    'ecmp_load_share',
+    'fbs_interfaces',
+), import_facts_class)
 
 
 class Facts(FactsBase):
@@ -206,6 +410,130 @@ class Facts(FactsBase):
     def __init__(self, module):
         super(Facts, self).__init__(module)
 
+    def get_network_resources_facts(self, facts_resource_obj_map, resource_facts_type=None, data=None):
+        """Collect the facts of the network resources, concurrently if
+        the 'max_workers' module option is greater than 1
+
+        The GET responses are shared by the facts classes through a
+        data source for the duration of the collection. When the facts
+        cache is enabled, the facts of the resources which are valid in
+        the cache are taken from it, and the collected facts are saved
+        to it, unless a resource module restricts the facts of a resource
+        to some entries. With the 'fingerprint' module option, the
+        fingerprints of the resources configuration are added to the facts,
+        and the facts of the resources are only collected when the facts
+        cache is enabled and their fingerprint differs from the cached one.
+        The resource modules, which collect the facts of the existing
+        configuration before changing it, only take the facts of a resource
+        from the cache if its fingerprint computed in this run is unchanged.
+
+        :param facts_resource_obj_map: resource names mapped to facts classes
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+        runable_subsets = self.gen_runable(resource_facts_type, frozenset(facts_resource_obj_map.keys()), resource_facts=True)
+        if not runable_subsets:
+            return None
+
+        # Keep the order of the registry, for the facts to be merged in the same order in every run
+        resources = [resource for resource in facts_resource_obj_map if resource in runable_subsets]
+        facts_cache = None
+        if data is None and not has_facts_key_filter(self._module, resources):
+            facts_cache = get_facts_cache(self._module, get_connection)
+        # Only the facts module has the 'gather_network_resources' option
+        fingerprint_required = 'gather_network_resources' not in self._module.params
+        fingerprints = {}
+        if self._module.params.get('fingerprint'):
+            overall_fingerprint, fingerprints = get_config_fingerprints(self._module, resources)
+            self.ansible_facts['ansible_net_config_fingerprint'] = {'overall': overall_fingerprint, 'resources': fingerprints}
+            if facts_cache is None:
+                # Only the fingerprints are returned
+                self.ansible_facts['ansible_net_gather_network_resources'] = resources
+                return None
+            # A resource without fingerprint is collected
+            fingerprint_required = True
+        elif facts_cache is not None and fingerprint_required:
+            overall_fingerprint, fingerprints = get_config_fingerprints(self._module, resources)
+
+        fetched_resources = resources
+        if facts_cache is not None:
+            fetched_resources = self.get_cached_resources_facts(facts_cache, resources, fingerprints, fingerprint_required)
+            if not fetched_resources:
+                self.ansible_facts['ansible_net_gather_network_resources'] = resources
+                return None
+            facts_resource_obj_map = dict((resource, facts_resource_obj_map[resource]) for resource in fetched_resources)
+            resource_facts_type = fetched_resources
+
+        workers = self._module.params.get('max_workers') or 1
+        self._module._sonic_data_source = DataSource(fetched_resources)
+        try:
+            if workers <= 1:
+                super(Facts, self).get_network_resources_facts(facts_resource_obj_map, resource_facts_type, data)
+            else:
+                self.get_network_resources_facts_concurrently(facts_resource_obj_map, fetched_resources, workers, data)
+        finally:
+            del self._module._sonic_data_source
+
+        if facts_cache is not None:
+            network_resources = self.ansible_facts['ansible_network_resources']
+            for resource in fetched_resources:
+                facts_cache.put(resource, network_resources.get(resource), fingerprints.get(resource))
+            facts_cache.save()
+            self.ansible_facts['ansible_net_gather_network_resources'] = resources
+        return None
+
+    def get_cached_resources_facts(self, facts_cache, resources, fingerprints, fingerprint_required=False):
+        """Add the facts of the resources which are valid in the facts cache
+
+        :param fingerprints: resource names mapped to the fingerprints of their configuration, if computed
+        :param fingerprint_required: only use the cached facts of the resources with an unchanged fingerprint
+        :rtype: list
+        :returns: the resources which facts must be collected from the device
+        """
+        fetched_resources = []
+        for resource in resources:
+            entry = facts_cache.get(resource, fingerprints.get(resource), fingerprint_required)
+            if entry is None:
+                fetched_resources.append(resource)
+            elif entry['facts'] is not None:
+                self.ansible_facts['ansible_network_resources'][resource] = deepcopy(entry['facts'])
+        return fetched_resources
+
+    def get_network_resources_facts_concurrently(self, facts_resource_obj_map, resources, workers, data=None):
+        """Collect the facts of the network resources with 'workers' threads
+
+        :param facts_resource_obj_map: resource names mapped to facts classes
+        :param resources: names of the resources to collect, in order
+        :param workers: maximum number of threads
+        :param data: previously collected conf
+        """
+        self.ansible_facts['ansible_net_gather_network_resources'] = resources
+        instances = [facts_resource_obj_map[resource](self._module) for resource in resources]
+
+        connection = get_connection(self._module)
+        batched_connection = BatchedConnection(connection)
+        fail_json = self._module.fail_json
+        self._module._sonic_connection = batched_connection
+        self._module.fail_json = raise_facts_failure
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(instances))) as executor:
+                futures = [executor.submit(populate_resource_facts, inst, self._connection, data) for inst in instances]
+        finally:
+            self._module.fail_json = fail_json
+            self._module._sonic_connection = connection
+            batched_connection.close()
+
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                self._module.fail_json(**exc.result)
+        for future in futures:
+            facts = future.result()
+            self.ansible_facts['ansible_network_resources'].update(facts.pop('ansible_network_resources'))
+            self.ansible_facts.update(facts)
+
     def get_facts(self, legacy_facts_type=None, resource_facts_type=None, data=None):
         """ Collect the facts for sonic
 
@@ -223,3 +551,97 @@ class Facts(FactsBase):
             self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
 
         return self.ansible_facts, self._warnings
+
+
+class FactsFailure(Exception):
+    """Failure of the facts collection of a resource, with the 'fail_json' arguments"""
+
+    def __init__(self, result):
+        super(FactsFailure, self).__init__(result.get('msg'))
+        self.result = result
+
+
+def raise_facts_failure(**kwargs):
+    """Replacement of the module 'fail_json' method in the facts collection workers"""
+    raise FactsFailure(kwargs)
+
+
+def populate_resource_facts(instance, connection, data):
+    """Collect the facts of one resource into a new facts dictionary"""
+    facts = {'ansible_network_resources': {}}
+    try:
+        instance.populate_facts(connection, facts, data)
+    except FactsFailure:
+        raise
+    except Exception as exc:
+        raise FactsFailure({'msg': to_text(exc)})
+    return facts
+
+
+class BatchedConnection(object):
+    """Connection proxy for the facts collection workers
+
+    The persistent connection handles one call at a time. The GET requests
+    which the workers send while a call is in progress are queued, and sent
+    together in the next 'edit_config' call. The httpapi plugin sends them
+    concurrently to the device if its 'concurrent_requests' option is set.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._condition = threading.Condition()
+        self._pending = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._dispatch)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def edit_config(self, requests, *args):
+        if args or not requests or any(not isinstance(req, dict) or req.get('method') != 'get' for req in requests):
+            return self._connection.edit_config(requests, *args)
+
+        call = {'requests': requests, 'done': threading.Event()}
+        with self._condition:
+            self._pending.append(call)
+            self._condition.notify()
+        call['done'].wait()
+        if 'error' in call:
+            raise call['error']
+        return call['responses']
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _dispatch(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                calls, self._pending = self._pending, []
+            self._send(calls)
+
+    def _send(self, calls):
+        try:
+            responses = self._connection.edit_config([req for call in calls for req in call['requests']])
+        except Exception as exc:
+            if len(calls) > 1:
+                # Send the calls again one by one, to fail only the calls with failing requests
+                for call in calls:
+                    self._send([call])
+                return
+            calls[0]['error'] = exc
+            calls[0]['done'].set()
+            return
+
+        for call in calls:
+            count = len(call['requests'])
+            call['responses'], responses = responses[:count], responses[count:]
+            call['done'].set()
@@ -17,6 +17,9 @@ from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
@@ -58,7 +61,7 @@ class Fbs_interfacesFacts(object):
             data = self.render_config(cfg)
         facts = {}
         if data:
-            params = utils.validate_config(self.argument_spec, {'config': data})
+            params = validate_config(self.argument_spec, {'config': data})
             facts['fbs_interfaces'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
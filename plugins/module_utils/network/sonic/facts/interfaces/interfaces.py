@@ -13,11 +13,22 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
 from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.interfaces.interfaces import InterfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -26,6 +37,8 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible.module_utils.connection import ConnectionError
 
 GET = "get"
+INTERFACES_FIELDS = "interface(name;config;openconfig-if-ethernet:ethernet/config)"
+INTERFACE_FIELDS = "name;config;openconfig-if-ethernet:ethernet/config"
 
 
 class InterfacesFacts(object):
@@ -48,14 +61,28 @@ class InterfacesFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_all_interfaces(self):
-        """Get all the interfaces available in chassis"""
+        """Get all the interfaces available in chassis, or the interfaces
+        of the facts key filter"""
         all_interfaces = {}
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        names = get_facts_key_filter(self._module, 'interfaces')
+        if names is None:
+            request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET,
+                        "content": "config", "fields": INTERFACES_FIELDS}]
+        else:
+            request = [{"path": "data/openconfig-interfaces:interfaces/interface={}".format(quote(name, safe='')), "method": GET,
+                        "content": "config", "fields": INTERFACE_FIELDS} for name in names]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc), code=exc.code)
 
+        if names is not None:
+            interfaces = []
+            for resp in response:
+                if len(resp) >= 2 and resp[1]:
+                    interfaces.extend(resp[1].get("openconfig-interfaces:interface", []))
+            return interfaces
+
         if "openconfig-interfaces:interfaces" in response[0][1]:
             all_interfaces = response[0][1].get("openconfig-interfaces:interfaces", {})
 
@@ -93,7 +120,7 @@ class InterfacesFacts(object):
         facts = {}
         if objs:
             facts['interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             for cfg in params['config']:
                 facts['interfaces'].append(utils.remove_empties(cfg))
         ansible_facts['ansible_network_resources'].update(facts)
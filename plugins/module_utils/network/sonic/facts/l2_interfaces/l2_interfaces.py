@@ -18,6 +18,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l2_interfaces.l2_interfaces import L2_interfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -26,6 +29,8 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible.module_utils.connection import ConnectionError
 
 GET = "get"
+L2_INTERFACES_FIELDS = ("interface(name;openconfig-if-ethernet:ethernet/openconfig-vlan:switched-vlan/config;"
+                        "openconfig-if-aggregate:aggregation/openconfig-vlan:switched-vlan/config)")
 
 
 class L2_interfacesFacts(object):
@@ -103,7 +108,8 @@ class L2_interfacesFacts(object):
     def get_all_l2_interfaces(self):
         """Get all the l2_interfaces available in chassis"""
         l2_interfaces = {}
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET,
+                    "content": "config", "fields": L2_INTERFACES_FIELDS}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
@@ -148,7 +154,7 @@ class L2_interfacesFacts(object):
         facts = {}
         if objs:
             facts['l2_interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             for cfg in params['config']:
                 facts['l2_interfaces'].append(utils.remove_empties(cfg))
         ansible_facts['ansible_network_resources'].update(facts)
@@ -13,12 +13,23 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
 from copy import deepcopy
 
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -29,6 +40,7 @@ IPV4_HOST_MASK = '/32'
 IPV6_HOST_MASK = '/128'
 L4_PORT_START = 0
 L4_PORT_END = 65535
+ACL_TYPES = {'ipv4': 'ACL_IPV4', 'ipv6': 'ACL_IPV6'}
 
 action_payload_to_value_map = {
     'ACCEPT': 'permit',
@@ -121,7 +133,7 @@ class L3_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l3_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['l3_acls'] = utils.remove_empties({'config': params['config']})['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -218,10 +230,17 @@ class L3_aclsFacts(object):
         return config
 
     def get_l3_acls(self):
-        """Get all l3 acl configurations available in chassis"""
+        """Get all l3 acl configurations available in chassis, or the
+        configurations of the (address family, name) keys of the facts
+        key filter"""
         acls_path = 'data/openconfig-acl:acl/acl-sets'
         method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
+        acl_keys = get_facts_key_filter(self._module, 'l3_acls')
+        if acl_keys is None:
+            request = [{'path': acls_path, 'method': method}]
+        else:
+            request = [{'path': '%s/acl-set=%s,%s' % (acls_path, quote(acl_name, safe=''), ACL_TYPES[acl_type]), 'method': method}
+                       for acl_type, acl_name in acl_keys]
 
         try:
             response = edit_config(self._module, to_request(self._module, request))
@@ -229,7 +248,11 @@ class L3_aclsFacts(object):
             self._module.fail_json(msg=str(exc), code=exc.code)
 
         acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
+        if acl_keys is not None:
+            for resp in response:
+                if len(resp) >= 2 and resp[1]:
+                    acls.extend(resp[1].get('openconfig-acl:acl-set', []))
+        elif response[0][1].get('openconfig-acl:acl-sets'):
             acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
 
         ipv4_acls_configs = []
@@ -14,23 +14,26 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.mac.mac import MacArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_vrfs,
+    get_vrf_subtrees,
 )
 
-NETWORK_INSTANCE_PATH = '/data/openconfig-network-instance:network-instances/network-instance'
+MAC_CONFIG_PATHS = (
+    'fdb/config/mac-aging-time',
+    'openconfig-mac-dampening:mac-dampening/config',
+    'fdb/mac-table/entries'
+)
 
 
 class MacFacts(object):
@@ -66,7 +69,7 @@ class MacFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['mac'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -74,10 +77,13 @@ class MacFacts(object):
     def update_mac(self, module):
         mac_address_cfg_list = []
         vrfs = get_all_vrfs(module)
+        vrf_subtrees = get_vrf_subtrees(module, vrfs, MAC_CONFIG_PATHS)
+
         for vrf_name in vrfs:
-            aging_time = self.get_config(vrf_name, module, 'fdb/config/mac-aging-time', 'openconfig-network-instance:mac-aging-time')
-            dampening_cfg_dict = self.get_config(vrf_name, module, 'openconfig-mac-dampening:mac-dampening/config', 'openconfig-mac-dampening:config')
-            entries_dict = self.get_config(vrf_name, module, 'fdb/mac-table/entries', 'openconfig-network-instance:entries')
+            vrf_responses = vrf_subtrees[vrf_name]
+            aging_time = self.get_response_value(vrf_responses[0], 'openconfig-network-instance:mac-aging-time')
+            dampening_cfg_dict = self.get_response_value(vrf_responses[1], 'openconfig-mac-dampening:config')
+            entries_dict = self.get_response_value(vrf_responses[2], 'openconfig-network-instance:entries')
             cfg_dict = {}
             mac_dict = {}
             mac_table_entries = []
@@ -115,15 +121,9 @@ class MacFacts(object):
 
         return mac_address_cfg_list
 
-    def get_config(self, vrf_name, module, path, name):
+    @staticmethod
+    def get_response_value(response, name):
         cfg_dict = {}
-        get_path = '%s=%s/%s' % (NETWORK_INSTANCE_PATH, vrf_name, path)
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if name in response[0][1]:
-                cfg_dict = response[0][1].get(name, None)
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
+        if name in response:
+            cfg_dict = response.get(name, None)
         return cfg_dict
@@ -18,6 +18,9 @@ from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties,
     remove_empties_from_list
@@ -84,7 +87,7 @@ class MirroringFacts(object):
         ansible_facts['ansible_network_resources'].pop('mirroring', None)
         facts = {}
         if mirror_session_facts:
-            params = utils.validate_config(self.argument_spec, {'config': mirror_session_facts})
+            params = validate_config(self.argument_spec, {'config': mirror_session_facts})
             facts['mirroring'] = remove_empties(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -6,21 +6,19 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.ospfv3.ospfv3 import Ospfv3Args
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.ospfv3.ospfv3 import Ospfv3Args
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_vrfs,
+    get_vrf_subtrees,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
-from ansible.module_utils.connection import ConnectionError
 
 
-network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
 protocol_ospf_path = 'protocols/protocol=OSPF3,ospfv3/ospfv3'  # OSPFv3 path
 
 
@@ -65,7 +63,7 @@ class Ospfv3Facts(object):
         ansible_facts['ansible_network_resources'].pop('ospfv3', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['ospfv3'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -74,18 +72,12 @@ class Ospfv3Facts(object):
         """Get all OSPFv3 configurations available in chassis"""
         ospf_configs = []
         vrfs = get_all_vrfs(module)
+        vrf_subtrees = get_vrf_subtrees(module, vrfs, [protocol_ospf_path])
         for vrf_name in vrfs:
-            all_ospf_path = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_ospf_path)
-            request = [{"path": all_ospf_path, "method": "GET"}]
-
-            try:
-                response = edit_config(module, to_request(module, request))
-            except ConnectionError as exc:
-                module.fail_json(msg=str(exc), code=exc.code)
-
-            if 'openconfig-network-instance:ospfv3' in response[0][1]:
+            response = vrf_subtrees[vrf_name][0]
+            if 'openconfig-network-instance:ospfv3' in response:
                 ospf_dict = {}
-                ospf_global = response[0][1]['openconfig-network-instance:ospfv3'].get('global', {})
+                ospf_global = response['openconfig-network-instance:ospfv3'].get('global', {})
                 ospf_dict.update(self.get_ospf_globals(ospf_global))
                 ospf_dict.update(self.get_ospf_timers(ospf_global))
                 ospf_dict.update(self.get_ospf_redistribute(ospf_global.get("openconfig-ospfv3-ext:route-distribution-policies", {})))
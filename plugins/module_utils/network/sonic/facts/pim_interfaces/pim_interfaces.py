@@ -18,15 +18,17 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.pim_interfaces.pim_interfaces import Pim_interfacesArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.pim_interfaces.pim_interfaces import Pim_interfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
-    get_all_vrfs
+    get_all_vrfs,
+    get_vrf_subtrees
 )
-from ansible.module_utils.connection import ConnectionError
+
+NETWORK_INSTANCE_PATH = 'data/openconfig-network-instance:network-instances/network-instance'
+PIM_INTERFACES_PATH = 'protocols/protocol=PIM,pim/pim/interfaces'
 
 
 class Pim_interfacesFacts(object):
@@ -71,7 +73,7 @@ class Pim_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('pim_interfaces', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['pim_interfaces'] = utils.remove_empties({'config': params['config']})['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -103,22 +105,11 @@ class Pim_interfacesFacts(object):
 
     def get_pim_interfaces(self):
         """Get all interface PIM configurations available in chassis"""
-        pim_interfaces_path = (
-            'data/openconfig-network-instance:network-instances/network-instance={vrf}'
-            '/protocols/protocol=PIM,pim/pim/interfaces'
-        )
-        method = 'GET'
-
         pim_interfaces = []
         vrf_list = get_all_vrfs(self._module)
+        vrf_subtrees = get_vrf_subtrees(self._module, vrf_list, [PIM_INTERFACES_PATH], instance_path=NETWORK_INSTANCE_PATH)
         for vrf_name in vrf_list:
-            request = {"path": pim_interfaces_path.format(vrf=vrf_name), "method": method}
-            try:
-                response = edit_config(self._module, to_request(self._module, request))
-            except ConnectionError as exc:
-                self._module.fail_json(msg=str(exc), code=exc.code)
-
-            response = response[0][1].get('openconfig-network-instance:interfaces')
+            response = vrf_subtrees[vrf_name][0].get('openconfig-network-instance:interfaces')
             if response and response.get('interface'):
                 pim_interfaces.extend(response['interface'])
 
@@ -17,6 +17,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.poe.poe import PoeArgs
 
@@ -64,7 +67,7 @@ class PoeFacts(object):
             # using mock data instead
             data = self.get_poe_info()
 
-        cleaned_data = utils.remove_empties(utils.validate_config(self.argument_spec, {"config": data})["config"])
+        cleaned_data = utils.remove_empties(validate_config(self.argument_spec, {"config": data})["config"])
 
         ansible_facts['ansible_network_resources'].pop('poe', None)
         facts = {}
@@ -19,6 +19,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible.module_utils.connection import ConnectionError
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils \
@@ -153,7 +156,7 @@ class Prefix_listsFacts:
         ansible_facts['ansible_network_resources'].pop('prefix_lists', None)
         facts = {}
         if prefix_sets:
-            params = utils.validate_config(self.argument_spec, {'config': prefix_sets})
+            params = validate_config(self.argument_spec, {'config': prefix_sets})
             facts['prefix_lists'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
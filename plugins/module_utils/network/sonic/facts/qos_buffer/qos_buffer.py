@@ -16,6 +16,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
@@ -57,7 +60,7 @@ class Qos_bufferFacts(object):
             data = self.render_config(self._module)
         facts = {}
         if data:
-            params = utils.validate_config(self.argument_spec, {'config': data})
+            params = validate_config(self.argument_spec, {'config': data})
             facts['qos_buffer'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -17,6 +17,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
@@ -119,7 +122,7 @@ class Qos_mapsFacts(object):
             data = self.render_config(self._module)
         facts = {}
         if data:
-            params = utils.validate_config(self.argument_spec, {'config': data})
+            params = validate_config(self.argument_spec, {'config': data})
             facts['qos_maps'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -18,6 +18,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.route_maps.route_maps import Route_mapsArgs
 
@@ -69,7 +72,7 @@ class Route_mapsFacts(object):
         ansible_facts['ansible_network_resources'].pop('route_maps', None)
         facts = {}
         if route_maps:
-            params = utils.validate_config(self.argument_spec,
+            params = validate_config(self.argument_spec,
                                            {'config': route_maps})
             params_cleaned = {'config': remove_empties_from_list(params['config'])}
             facts['route_maps'] = params_cleaned['config']
@@ -15,23 +15,21 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.static_routes.static_routes import Static_routesArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_vrfs,
+    get_vrf_subtrees,
 )
 
-network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
 protocol_static_routes_path = 'protocols/protocol=STATIC,static/static-routes'
 
 
@@ -69,7 +67,7 @@ class Static_routesFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['static_routes'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -77,18 +75,13 @@ class Static_routesFacts(object):
     def get_static_routes(self, module):
         all_static_routes = []
         vrfs = get_all_vrfs(module)
+        vrf_subtrees = get_vrf_subtrees(module, vrfs, [protocol_static_routes_path])
         for vrf_name in vrfs:
-            get_path = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
-            request = {'path': get_path, 'method': 'get'}
-            try:
-                response = edit_config(module, to_request(module, request))
-            except ConnectionError as exc:
-                module.fail_json(msg=str(exc), code=exc.code)
-            for resp in response:
-                if 'openconfig-network-instance:static-routes' in resp[1]:
-                    static_routes_dict = resp[1].get('openconfig-network-instance:static-routes', {})
-                    static_routes_dict['vrf'] = vrf_name
-                    all_static_routes.append(static_routes_dict)
+            resp = vrf_subtrees[vrf_name][0]
+            if 'openconfig-network-instance:static-routes' in resp:
+                static_routes_dict = resp.get('openconfig-network-instance:static-routes', {})
+                static_routes_dict['vrf'] = vrf_name
+                all_static_routes.append(static_routes_dict)
         return all_static_routes
 
     def update_static_routes(self, data):
@@ -16,6 +16,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 
 from ansible.module_utils.connection import ConnectionError
 
@@ -26,6 +29,14 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.system.system import SystemArgs
 
 GET = "get"
+SYSTEM_PATH = 'data/openconfig-system:system'
+# Subtrees of the system container read by the facts
+SYSTEM_FIELDS = ('config;openconfig-system-ext:auditd-system/config;'
+                 'openconfig-system-ext:login(concurrent-session/config;password-attributes/config;session/config);'
+                 'openconfig-system-ext:banner/config')
+DEVICE_METADATA_PATH = 'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost'
+SAG_GLOBAL_PATH = 'data/sonic-sag:sonic-sag/SAG_GLOBAL/SAG_GLOBAL_LIST/'
+HASH_ALGORITHM_PATH = 'data/openconfig-loadshare-mode-ext:loadshare/hash-algorithm/config'
 
 
 class SystemFacts(object):
@@ -47,196 +58,85 @@ class SystemFacts(object):
 
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
-    def get_system(self):
-        """
-        Get system hostname available in chassis
+    def get_system_snapshot(self):
         """
-        request = [{"path": "data/openconfig-system:system/config", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        if ('openconfig-system:config' in response[0][1]):
-            data = response[0][1]['openconfig-system:config']
-        else:
-            data = {}
-        return data
+        Get the system configuration of the chassis, in one batch of GET requests
 
-    def get_intf_naming_auto_breakout(self):
+        :rtype: tuple
+        :returns: the 'openconfig-system:system' container, filtered to SYSTEM_FIELDS,
+                  the localhost device metadata, the SAG global entry and the load
+                  share hash algorithm configuration; an empty dict for each of them
+                  which is not configured
         """
-        Get interface_naming_mode and auto-breakout status available in chassis
-        """
-        request = [{"path": "data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost", "method": GET}]
+        requests = [
+            {"path": SYSTEM_PATH, "method": GET, "fields": SYSTEM_FIELDS},
+            {"path": DEVICE_METADATA_PATH, "method": GET},
+            {"path": SAG_GLOBAL_PATH, "method": GET},
+            {"path": HASH_ALGORITHM_PATH, "method": GET}
+        ]
         try:
-            response = edit_config(self._module, to_request(self._module, request))
+            responses = edit_config(self._module, to_request(self._module, requests))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc), code=exc.code)
-        data = {}
-        if ('sonic-device-metadata:DEVICE_METADATA_LIST' in response[0][1]):
-            intf_data = response[0][1]['sonic-device-metadata:DEVICE_METADATA_LIST']
-            if 'intf_naming_mode' in intf_data[0]:
-                if intf_data[0]['intf_naming_mode'] == 'standard-ext':
-                    intf_data[0]['intf_naming_mode'] = 'standard_extended'
-                data['intf_naming_mode'] = intf_data[0]['intf_naming_mode']
-            if 'auto-breakout' in intf_data[0]:
-                data['auto-breakout'] = intf_data[0]['auto-breakout']
-        return data
 
-    def get_anycast_addr(self):
+        bodies = [(response[1] if len(response) > 1 else None) or {} for response in responses]
+        system = bodies[0].get('openconfig-system:system') or {}
+        metadata = (bodies[1].get('sonic-device-metadata:DEVICE_METADATA_LIST') or [{}])[0]
+        anycast_addr = (bodies[2].get('sonic-sag:SAG_GLOBAL_LIST') or [{}])[0]
+        hash_algo = bodies[3].get('openconfig-loadshare-mode-ext:config') or {}
+        return system, metadata, anycast_addr, hash_algo
+
+    def get_system(self, system):
         """
-        Get system anycast address available in chassis
+        Get system hostname available in chassis
         """
-        request = [{"path": "data/sonic-sag:sonic-sag/SAG_GLOBAL/SAG_GLOBAL_LIST/", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        if ('sonic-sag:SAG_GLOBAL_LIST' in response[0][1]):
-            data = response[0][1]['sonic-sag:SAG_GLOBAL_LIST'][0]
-        else:
-            data = {}
-        return data
+        return deepcopy(system.get('config', {}))
 
-    def get_load_share_hash_algo(self):
+    def get_intf_naming_auto_breakout(self, metadata):
         """
-        Get load share hash algorithm
+        Get interface_naming_mode and auto-breakout status available in chassis
         """
-        request = [{"path": "data/openconfig-loadshare-mode-ext:loadshare/hash-algorithm/config", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        if ('openconfig-loadshare-mode-ext:config' in response[0][1]):
-            data = response[0][1]['openconfig-loadshare-mode-ext:config']
-        else:
-            data = {}
+        data = {}
+        if 'intf_naming_mode' in metadata:
+            if metadata['intf_naming_mode'] == 'standard-ext':
+                data['intf_naming_mode'] = 'standard_extended'
+            else:
+                data['intf_naming_mode'] = metadata['intf_naming_mode']
+        if 'auto-breakout' in metadata:
+            data['auto-breakout'] = metadata['auto-breakout']
         return data
 
-    def get_auditd_rules(self):
+    def get_auditd_rules(self, system):
         """
         Get auditd rules configuration available in chassis
         """
-        request = [{"path": "data/openconfig-system:system/openconfig-system-ext:auditd-system", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
         data = {}
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system-ext:auditd-system' in response[0][1]):
-                    auditd_system_data = response[0][1]['openconfig-system-ext:auditd-system']
-                    if 'config' in auditd_system_data:
-                        audit_rules_config = auditd_system_data['config']
-                        if 'audit-rules' in audit_rules_config:
-                            audit_rules = audit_rules_config['audit-rules']
-                            data['audit-rules'] = audit_rules
+        audit_rules_config = system.get('openconfig-system-ext:auditd-system', {}).get('config', {})
+        if 'audit-rules' in audit_rules_config:
+            data['audit-rules'] = audit_rules_config['audit-rules']
         return data
 
-    def get_concurrent_session_limit(self):
+    def get_concurrent_session_limit(self, login):
         """Get concurrent session limit configured on chassis"""
-        request = [{"path": "data/openconfig-system:system/openconfig-system-ext:login/concurrent-session/config", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
         data = {}
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system-ext:config' in response[0][1]):
-                    session_limit = response[0][1]['openconfig-system-ext:config']
-                    if 'limit' in session_limit:
-                        data['concurrent_session_limit'] = session_limit['limit']
+        session_limit = login.get('concurrent-session', {}).get('config', {})
+        if 'limit' in session_limit:
+            data['concurrent_session_limit'] = session_limit['limit']
         return data
 
-    def get_switching_mode(self):
+    def get_switching_mode(self, system):
         """
         Get switching-mode configuration if available in chassis
         Switching-mode is not available as a resource to query until it has been configured to CUT_THROUGH mode at least once.
         In that scenario it is assumed the value is STORE_AND_FORWARD.
         """
-        request = [{"path": "data/openconfig-system:system/config/switching-mode", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        data = {}
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system:switching-mode' in response[0][1]):
-                    data["switching-mode"] = response[0][1]['openconfig-system:switching-mode']
-                else:
-                    data["switching-mode"] = "STORE_AND_FORWARD"
-        return data
+        return {"switching-mode": system.get('config', {}).get('switching-mode', "STORE_AND_FORWARD")}
 
-    def get_adjust_txrx_clock_freq(self):
+    def get_adjust_txrx_clock_freq(self, system):
         """
         Get adjust-txrx-clock-freq configuration if available in chassis
         """
-        request = [{"path": "data/openconfig-system:system/config/adjust-txrx-clock-freq", "method": GET}]
-        data = {}
-
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            if 'Resource not found' in str(exc):
-                return data
-
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system:adjust-txrx-clock-freq' in response[0][1]):
-                    data["adjust-txrx-clock-freq"] = response[0][1]['openconfig-system:adjust-txrx-clock-freq']
-                else:
-                    data["adjust-txrx-clock-freq"] = False
-        return data
-
-    def get_password_attributes(self):
-        """Get all the password attribute configured in the device"""
-        request = [{"path": "data/openconfig-system:system/openconfig-system-ext:login/password-attributes/config", "method": GET}]
-        data = {}
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if 'openconfig-system-ext:config' in response[0][1]:
-                    data = response[0][1]['openconfig-system-ext:config']
-        return data
-
-    def get_login_exec_timeout(self):
-        """Get the login timeout configured in the device"""
-        request = [{"path": "data/openconfig-system:system/openconfig-system-ext:login/session/config", "method": GET}]
-        login_exec_timeout_data = {}
-        raw_login_exec_timeout_data = {}
-        data = {}
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system-ext:config' in response[0][1]):
-                    data = response[0][1]['openconfig-system-ext:config']
-
-        return data
-
-    def get_banner(self):
-        """Get system banner"""
-        request = [{"path": "data/openconfig-system:system/openconfig-system-ext:banner/config", "method": GET}]
-        data = {}
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-        if response and response[0]:
-            if len(response[0]) > 1:
-                if ('openconfig-system-ext:config' in response[0][1]):
-                    data = response[0][1]['openconfig-system-ext:config']
-        return data
+        return {"adjust-txrx-clock-freq": system.get('config', {}).get('adjust-txrx-clock-freq', False)}
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for system
@@ -246,43 +146,25 @@ class SystemFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        system, metadata, anycast_addr, hash_algo = self.get_system_snapshot()
+        login = system.get('openconfig-system-ext:login', {})
         if not data:
-            data = self.get_system()
-        intf_naming_auto_breakout = self.get_intf_naming_auto_breakout()
-        if intf_naming_auto_breakout:
-            data.update(intf_naming_auto_breakout)
-        anycast_addr = self.get_anycast_addr()
-        if anycast_addr:
-            data.update(anycast_addr)
-        pwd_configs = self.get_password_attributes()
-        if pwd_configs:
-            data.update(pwd_configs)
-        load_share_hash_algo = self.get_load_share_hash_algo()
-        if load_share_hash_algo:
-            data.update(load_share_hash_algo)
-        auditd_rules = self.get_auditd_rules()
-        if auditd_rules:
-            data.update(auditd_rules)
-        session_limit = self.get_concurrent_session_limit()
-        if session_limit:
-            data.update(session_limit)
-        switching_mode = self.get_switching_mode()
-        if switching_mode:
-            data.update(switching_mode)
-        adjust_txrx_clock_freq = self.get_adjust_txrx_clock_freq()
-        if adjust_txrx_clock_freq:
-            data.update(adjust_txrx_clock_freq)
-        login_exec_timeout = self.get_login_exec_timeout()
-        if login_exec_timeout:
-            data.update(login_exec_timeout)
-        banner = self.get_banner()
-        if banner:
-            data.update(banner)
+            data = self.get_system(system)
+        data.update(self.get_intf_naming_auto_breakout(metadata))
+        data.update(anycast_addr)
+        data.update(login.get('password-attributes', {}).get('config', {}))
+        data.update(hash_algo)
+        data.update(self.get_auditd_rules(system))
+        data.update(self.get_concurrent_session_limit(login))
+        data.update(self.get_switching_mode(system))
+        data.update(self.get_adjust_txrx_clock_freq(system))
+        data.update(login.get('session', {}).get('config', {}))
+        data.update(system.get('openconfig-system-ext:banner', {}).get('config', {}))
         objs = []
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['system'] = utils.remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -18,9 +18,15 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    validate_config
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    get_facts_key_filter
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vlans.vlans import VlansArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -64,25 +70,35 @@ class VlansFacts(object):
 
         facts = {}
         if vlans:
-            params = utils.validate_config(self.argument_spec, {'config': vlans})
+            params = validate_config(self.argument_spec, {'config': vlans})
             facts['vlans'] = remove_empties_from_list(params.get("config"))
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
     def get_vlans(self):
         """
-        Gather all the vlan configuration from the device
+        Gather all the vlan configuration from the device, or the
+        configuration of the VLANs of the facts key filter
 
         Returns: List of dictionaries with each item being a vlan config
         """
-        request = [{"path": "data/sonic-vlan:sonic-vlan", "method": GET}]
+        vlan_ids = get_facts_key_filter(self._module, 'vlans')
+        if vlan_ids is None:
+            request = [{"path": "data/sonic-vlan:sonic-vlan", "method": GET}]
+        else:
+            request = [{"path": "data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST=Vlan{}".format(vlan_id), "method": GET}
+                       for vlan_id in vlan_ids]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc), code=exc.code)
 
         vlans_list = []
-        if len(response[0]) >= 1:
+        if vlan_ids is not None:
+            for resp in response:
+                if len(resp) >= 2 and resp[1]:
+                    vlans_list.extend(resp[1].get("sonic-vlan:VLAN_LIST", []))
+        elif len(response[0]) >= 1:
             if "sonic-vlan:sonic-vlan" in response[0][1]:
                 vlans = response[0][1].get("sonic-vlan:sonic-vlan", {})
                 if vlans:
@@ -31,6 +31,7 @@ __metaclass__ = type
 
 import json
 import re
+import time
 
 from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
@@ -39,6 +40,11 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 from ansible.module_utils.connection import Connection, ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, ConfigLine
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_cache_utils import get_facts_cache
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.profile_utils import (
+    is_profile_enabled,
+    get_profile_summary
+)
 
 _DEVICE_CONFIGS = {}
 STANDARD_ETH_REGEXP = r"(Eth\d+(/\d+)+)"
@@ -52,12 +58,62 @@ def get_connection(module):
     network_api = capabilities.get("network_api")
     if network_api in ["cliconf", "sonic_rest"]:
         module._sonic_connection = Connection(module._socket_path)
+        if is_profile_enabled():
+            enable_profile(module, module._sonic_connection)
     else:
         module.fail_json(msg="Invalid connection type %s" % network_api)
 
     return module._sonic_connection
 
 
+def enable_profile(module, connection):
+    """Add a 'sonic_profile' summary of the connection calls and
+    device requests made by the module to the module result
+    """
+    module._sonic_profile_calls = []
+    get_request_stats(connection)
+
+    def add_profile_summary(result):
+        result['sonic_profile'] = get_profile_summary(module._sonic_profile_calls, get_request_stats(connection))
+
+    exit_json = module.exit_json
+    fail_json = module.fail_json
+
+    def profiled_exit_json(**kwargs):
+        add_profile_summary(kwargs)
+        exit_json(**kwargs)
+
+    def profiled_fail_json(msg, **kwargs):
+        add_profile_summary(kwargs)
+        fail_json(msg=msg, **kwargs)
+
+    module.exit_json = profiled_exit_json
+    module.fail_json = profiled_fail_json
+
+
+def get_request_stats(connection):
+    """Return the records of the requests sent by the httpapi plugin, if supported"""
+    try:
+        return connection.get_request_stats()
+    except ConnectionError:
+        return []
+
+
+def get_query_unsupported(module):
+    """Return the YANG modules for which the httpapi plugin stopped sending
+    RESTCONF query parameters, as the device rejects them
+    """
+    try:
+        return get_connection(module).get_query_unsupported()
+    except ConnectionError:
+        return []
+
+
+def record_call(module, name, start):
+    if hasattr(module, '_sonic_profile_calls'):
+        module._sonic_profile_calls.append((name, time.time() - start))
+
+
 def get_capabilities(module):
     if hasattr(module, "_sonic_capabilities"):
         return module._sonic_capabilities
@@ -77,10 +133,13 @@ def get_config(module, flags=None):
         return _DEVICE_CONFIGS[flag_str]
     except KeyError:
         connection = get_connection(module)
+        start = time.time()
         try:
             out = connection.get_config(flags=flags)
         except ConnectionError as exc:
             module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+        finally:
+            record_call(module, 'get_config', start)
         cfg = to_text(out, errors="surrogate_then_replace").strip()
         _DEVICE_CONFIGS[flag_str] = cfg
         return cfg
@@ -118,10 +177,13 @@ def get_sublevel_config(running_config, module):
 
 def run_commands(module, commands, check_rc=True):
     connection = get_connection(module)
+    start = time.time()
     try:
         return connection.run_commands(commands=commands, check_rc=check_rc)
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc))
+    finally:
+        record_call(module, 'run_commands', start)
 
 
 def edit_config(module, commands, skip_code=None, suppr_ntf_excp=True):
@@ -135,11 +197,36 @@ def edit_config(module, commands, skip_code=None, suppr_ntf_excp=True):
             if url:
                 request["path"] = update_url(url)
     # End
-    if suppr_ntf_excp:
-        # Default: not used for cliconf
-        return connection.edit_config(commands)
-    else:
-        return connection.edit_config(commands, suppr_ntf_excp)
+
+    def send(requests):
+        start = time.time()
+        try:
+            if suppr_ntf_excp:
+                # Default: not used for cliconf
+                return connection.edit_config(requests)
+            else:
+                return connection.edit_config(requests, suppr_ntf_excp)
+        finally:
+            record_call(module, 'edit_config', start)
+
+    if commands and all(is_get_request(request) for request in commands):
+        data_source = getattr(module, '_sonic_data_source', None)
+        if data_source is not None:
+            return data_source.edit_config(commands, send)
+    elif commands:
+        clear_facts_cache(module)
+    return send(commands)
+
+
+def clear_facts_cache(module):
+    """Remove the cached facts of the device, before changing its configuration"""
+    facts_cache = get_facts_cache(module, get_connection)
+    if facts_cache is not None:
+        facts_cache.clear()
+
+
+def is_get_request(request):
+    return isinstance(request, dict) and (request.get('method') or '').lower() == 'get'
 
 
 def edit_config_reboot(module, commands, skip_code=None):
@@ -153,7 +240,8 @@ def edit_config_reboot(module, commands, skip_code=None):
             if url:
                 request["path"] = update_url(url)
     # End
-    connection.edit_config_reboot(commands)
+    clear_facts_cache(module)
+    return connection.edit_config_reboot(commands)
 
 
 def update_url(url):
@@ -168,5 +256,6 @@ def update_url(url):
 
 
 def to_request(module, requests):
-    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict')), module)
+    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict'),
+                                 depth=dict(type='int'), content=dict(), fields=dict()), module)
     return transform(to_list(requests))
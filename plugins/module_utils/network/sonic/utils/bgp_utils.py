@@ -21,6 +21,11 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.data_source_utils import (
+    LIST_KEYS,
+    get_subtree_slice,
+    parse_path
+)
 from ansible.module_utils.connection import ConnectionError
 
 afi_safi_types_map = {
@@ -40,9 +45,13 @@ AS_NOTATION_TO_TYPES_MAP = {
 }
 
 GET = "get"
+network_instances_path = 'data/openconfig-network-instance:network-instances'
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
 protocol_bgp_path = 'protocols/protocol=BGP,bgp/bgp'
 
+# Number of VRFs from which the subtrees of the VRFs are taken from one GET of the network instances
+VRF_BULK_GET_THRESHOLD = 8
+
 
 def to_bgp_as_notation_request_type(as_notation):
     """Convert as_notation types to Openconfig As-dot enums"""
@@ -153,6 +162,9 @@ class BgpAsnStrList(str):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.strvals)
+
     def to_request_attr_fmt(self):
         """Return asn string list according to openconfig model (original input string)"""
         return self.__str__()
@@ -195,6 +207,9 @@ class BgpAsnNN(str):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.asnum_nn)
+
 
 def convert_routemap_bgp_asn(cfglist):
     """Convert Routemaps Bgp Asn-list-string and ext-commnunity ASN:NN to BgpAsnStrList and BgpAsnNN class """
@@ -236,8 +251,86 @@ def get_all_vrfs(module):
     return all_vrfs
 
 
+def get_fields(subpaths):
+    """Return the RESTCONF 'fields' query parameter selecting the subtrees
+    of the network instances at the subpaths, with the keys of their lists
+    """
+    tree = {}
+    for subpath in subpaths:
+        segments = parse_path('network-instance=*/' + subpath)
+        node = tree
+        for idx, (name, keys) in enumerate(segments):
+            if name in node and node[name] is None:
+                # The whole subtree is already selected
+                break
+            if idx == len(segments) - 1:
+                node[name] = None
+                break
+            node = node.setdefault(name, {})
+            if keys is not None:
+                for key_name in LIST_KEYS[name.split(':')[-1]]:
+                    node[key_name] = None
+
+    def format_fields(name, node):
+        if not node:
+            return name
+        if len(node) == 1:
+            return '%s/%s' % (name, format_fields(*next(iter(node.items()))))
+        return '%s(%s)' % (name, ';'.join(format_fields(child_name, child) for child_name, child in node.items()))
+
+    return ';'.join(format_fields(name, node) for name, node in tree.items())
+
+
+def get_vrf_subtrees(module, vrfs, subpaths, instance_path=network_instance_path):
+    """Get the configuration of subtrees of the network instances of VRFs
+
+    Below VRF_BULK_GET_THRESHOLD VRFs, the subtrees of all VRFs are requested
+    in one batch of GET requests. From VRF_BULK_GET_THRESHOLD VRFs, the network
+    instances are requested once, filtered to the subtrees, and the subtrees
+    of each VRF are taken from that response.
+
+    :param vrfs: list of VRF names
+    :param subpaths: list of paths relative to a network instance,
+                     e.g. ['protocols/protocol=BGP,bgp/bgp/global']
+    :param instance_path: path of the network instance list in the requests
+                          of the subtrees
+    :rtype: dict
+    :returns: the VRF names mapped to the list of the response bodies of the
+              GET requests of their subtrees, an empty dict for a subtree
+              which is not configured
+    """
+    vrf_subtrees = {}
+    if len(vrfs) < VRF_BULK_GET_THRESHOLD:
+        requests = []
+        for vrf_name in vrfs:
+            for subpath in subpaths:
+                requests.append({'path': '%s=%s/%s' % (instance_path, vrf_name, subpath), 'method': GET})
+        responses = []
+        if requests:
+            try:
+                responses = edit_config(module, to_request(module, requests))
+            except ConnectionError as exc:
+                module.fail_json(msg=str(exc), code=exc.code)
+        for idx, vrf_name in enumerate(vrfs):
+            vrf_responses = responses[idx * len(subpaths):(idx + 1) * len(subpaths)]
+            vrf_subtrees[vrf_name] = [(response[1] if len(response) > 1 else None) or {} for response in vrf_responses]
+        return vrf_subtrees
+
+    request = {'path': network_instances_path, 'method': GET, 'fields': get_fields(subpaths)}
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError as exc:
+        module.fail_json(msg=str(exc), code=exc.code)
+    body = response[0][1]
+    for vrf_name in vrfs:
+        vrf_subtrees[vrf_name] = []
+        for subpath in subpaths:
+            path = '%s/network-instance=%s/%s' % (network_instances_path, vrf_name, subpath)
+            vrf_subtrees[vrf_name].append(get_subtree_slice(body, network_instances_path, path) or {})
+    return vrf_subtrees
+
+
 def get_peergroups(module, vrf_name):
-    peer_groups = []
     request_path = '%s=%s/protocols/protocol=BGP,bgp/bgp/peer-groups' % (network_instance_path, vrf_name)
     request = {"path": request_path, "method": GET}
     try:
@@ -245,7 +338,12 @@ def get_peergroups(module, vrf_name):
     except ConnectionError as exc:
         module.fail_json(msg=str(exc), code=exc.code)
 
-    resp = response[0][1]
+    return get_peergroups_data(response[0][1])
+
+
+def get_peergroups_data(resp):
+    """Return the peer groups configuration of the response of a peer-groups GET request"""
+    peer_groups = []
     if 'openconfig-network-instance:peer-groups' in resp:
         data = resp['openconfig-network-instance:peer-groups']
         if 'peer-group' in data:
@@ -471,20 +569,11 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
     """Get all BGP Global Address Family Redistribute configurations available in chassis"""
     all_af_redis_data = []
     ret_redis_data = []
+    vrf_subtrees = get_vrf_subtrees(module, vrfs, ['table-connections'])
     for vrf_name in vrfs:
-        af_redis_data = {}
-        request_path = '%s=%s/table-connections' % (network_instance_path, vrf_name)
-        request = {"path": request_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        if "openconfig-network-instance:table-connections" in response[0][1]:
-            af_redis_data.update({vrf_name: response[0][1]['openconfig-network-instance:table-connections']})
-
-        if af_redis_data:
-            all_af_redis_data.append(af_redis_data)
+        resp = vrf_subtrees[vrf_name][0]
+        if "openconfig-network-instance:table-connections" in resp:
+            all_af_redis_data.append({vrf_name: resp['openconfig-network-instance:table-connections']})
 
     if all_af_redis_data:
         for vrf_name in vrfs:
@@ -512,18 +601,13 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
 def get_all_bgp_globals(module, vrfs):
     """Get all BGP configurations available in chassis"""
     all_bgp_globals = []
+    vrf_subtrees = get_vrf_subtrees(module, vrfs, ['%s/global' % protocol_bgp_path])
     for vrf_name in vrfs:
-        get_path = '%s=%s/%s/global' % (network_instance_path, vrf_name, protocol_bgp_path)
-        request = {"path": get_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-        for resp in response:
-            if "openconfig-network-instance:global" in resp[1]:
-                bgp_data = {'global': resp[1].get("openconfig-network-instance:global", {})}
-                bgp_data.update({'vrf_name': vrf_name})
-                all_bgp_globals.append(bgp_data)
+        resp = vrf_subtrees[vrf_name][0]
+        if "openconfig-network-instance:global" in resp:
+            bgp_data = {'global': resp.get("openconfig-network-instance:global", {})}
+            bgp_data.update({'vrf_name': vrf_name})
+            all_bgp_globals.append(bgp_data)
     return all_bgp_globals
 
 
@@ -710,24 +794,37 @@ def get_bgp_neighbors(module, vrf_name):
     return neighbors_data
 
 
-def get_all_bgp_neighbors(module):
-    vrf_list = get_all_vrfs(module)
-    """Get all BGP neighbor configurations available in chassis"""
+def get_all_bgp_neighbors(module, peer_groups=False, vrfs=None):
+    """Get all BGP neighbor configurations available in chassis
+
+    :param peer_groups: add the peer groups configuration of each VRF
+                        as 'peer_groups'
+    :param vrfs: names of the VRFs to get the configurations of, instead
+                 of all the VRFs
+    """
+    vrf_list = get_all_vrfs(module) if vrfs is None else vrfs
     all_bgp_neighbors = []
 
+    subpaths = ['%s/global/config' % protocol_bgp_path, '%s/neighbors' % protocol_bgp_path]
+    if peer_groups:
+        subpaths.append('%s/peer-groups' % protocol_bgp_path)
+    vrf_subtrees = get_vrf_subtrees(module, vrf_list, subpaths)
     for vrf_name in vrf_list:
         neighbors_cfg = {}
+        resp = vrf_subtrees[vrf_name]
 
-        bgp_as = get_bgp_as(module, vrf_name)
+        bgp_as = resp[0].get('openconfig-network-instance:config', {}).get('as')
         if bgp_as:
             neighbors_cfg['bgp_as'] = bgp_as
             neighbors_cfg['vrf_name'] = vrf_name
         else:
             continue
 
-        neighbors = get_bgp_neighbors(module, vrf_name)
+        neighbors = resp[1].get('openconfig-network-instance:neighbors')
         if neighbors:
             neighbors_cfg['neighbors'] = neighbors
+        if peer_groups:
+            neighbors_cfg['peer_groups'] = get_peergroups_data(resp[2])
 
         if neighbors_cfg:
             all_bgp_neighbors.append(neighbors_cfg)
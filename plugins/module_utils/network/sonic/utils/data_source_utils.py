@@ -0,0 +1,266 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Data source of the GET responses shared by the facts classes during a facts collection
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+import threading
+from copy import deepcopy
+
+from ansible.module_utils.six.moves.urllib.parse import unquote
+
+# Subtrees fetched whole by the facts classes of the resources listed with them.
+# When one of these resources is collected along with others, the other facts
+# classes get their GET responses under the subtree from the same response.
+SHARED_SUBTREES = {
+    'data/openconfig-interfaces:interfaces': (
+        'interfaces', 'l2_interfaces', 'ospfv2_interfaces', 'ospfv3_interfaces', 'vrrp', 'poe', 'br_l2pt'
+    ),
+    'data/openconfig-network-instance:network-instances': ('vrfs',),
+    'data/openconfig-system:system/aaa/server-groups': ('ldap',),
+    'data/openconfig-fbs-ext:fbs': ('fbs_groups',),
+    'data/openconfig-loadshare-mode-ext:loadshare': ('ecmp_load_share',),
+    'data/sonic-vxlan:sonic-vxlan': ('vxlans',),
+    'data/sonic-switch:sonic-switch/SWITCH/SWITCH_LIST=switch': ('roce',),
+}
+
+# Key leaves of the lists which entries can be sliced from a response
+LIST_KEYS = {
+    'interface': ('name',),
+    'subinterface': ('index',),
+    'network-instance': ('name',),
+    'protocol': ('identifier', 'name'),
+    'server-group': ('name',),
+    'SWITCH_LIST': ('switch_name',),
+}
+
+
+def get_request_path(request):
+    """Return the normalized path of a GET request which response can be
+    shared, or None
+    """
+    if (request.get('method') or '').lower() != 'get' or request.get('data'):
+        return None
+    if request.get('depth') is not None or request.get('content') or request.get('fields'):
+        return None
+    path = request.get('path') or ''
+    if '?' in path:
+        return None
+    return path.strip('/')
+
+
+def parse_path(path):
+    """Split a path into (name, keys) segments, the keys being None
+    for a segment which is not a list entry
+    """
+    segments = []
+    for segment in path.split('/'):
+        name, sep, keys = segment.partition('=')
+        segments.append((name, [unquote(key) for key in keys.split(',')] if sep else None))
+    return segments
+
+
+def get_key_value(value):
+    """Return a key leaf value as text, without the module prefix of an identity"""
+    value = str(value)
+    if re.match(r'^[A-Za-z][\w.-]*:[^:]+$', value):
+        return value.split(':')[-1]
+    return value
+
+
+def get_subtree_slice(body, path, subpath):
+    """Return the response of a GET request of a path under the path of
+    a response, as sent by the device, or None if it cannot be found in
+    the response
+
+    :param body: body of the response of the GET request of 'path'
+    :param path: normalized path of the response
+    :param subpath: normalized path under 'path'
+    """
+    segments = parse_path(path)
+    module = None
+    for name, keys in segments:
+        if ':' in name:
+            module = name.split(':')[0]
+    name, keys = segments[-1]
+    qualified_name = name if ':' in name else '%s:%s' % (module, name)
+    node = body.get(qualified_name) if isinstance(body, dict) else None
+    if keys is not None:
+        # A list entry is returned as a list of one entry
+        if not isinstance(node, list) or len(node) != 1:
+            return None
+        node = node[0]
+
+    for name, keys in parse_path(subpath[len(path) + 1:]):
+        if not isinstance(node, dict):
+            return None
+        if ':' in name:
+            child_module, local_name = name.split(':', 1)
+        else:
+            child_module, local_name = module, name
+        if child_module == module and local_name in node:
+            node = node[local_name]
+        else:
+            node = node.get('%s:%s' % (child_module, local_name))
+        module = child_module
+        qualified_name = '%s:%s' % (module, local_name)
+        if keys is not None:
+            key_names = LIST_KEYS.get(local_name)
+            if not isinstance(node, list) or not key_names or len(key_names) != len(keys):
+                return None
+            for entry in node:
+                if all(get_key_value(entry.get(key_name)) == key for key_name, key in zip(key_names, keys)):
+                    node = entry
+                    break
+            else:
+                return None
+        if node is None:
+            return None
+
+    if keys is not None:
+        return {qualified_name: [node]}
+    return {qualified_name: node}
+
+
+class SharedResponse(object):
+    """Response of a GET request of a data source, which is set once by
+    the thread sending the request
+    """
+
+    def __init__(self):
+        self.body = None
+        self.code = None
+        self.error = None
+        self.event = threading.Event()
+
+    def set(self, code, body):
+        self.code = code
+        self.body = body
+        self.event.set()
+
+    def set_error(self, error):
+        self.error = error
+        self.event.set()
+
+
+class DataSource(object):
+    """GET responses of a facts collection run
+
+    Every path is sent once. The response of a path under a path already
+    requested is sliced from the response of that path. When 'resources'
+    contains more than one resource and one of them fetches a subtree of
+    SHARED_SUBTREES, the requests of the other resources under that subtree
+    are served from the response of the whole subtree.
+
+    The responses are copied, for the facts classes to change them.
+    """
+
+    def __init__(self, resources=()):
+        resources = set(resources)
+        self._subtrees = []
+        if len(resources) > 1:
+            self._subtrees = [path for path, users in SHARED_SUBTREES.items() if resources.intersection(users)]
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def _find_response(self, path):
+        """Return the path and response of the path or of a path above it
+        already requested, or of a shared subtree above it
+        """
+        if path in self._responses:
+            return path, self._responses[path]
+        for requested_path, response in self._responses.items():
+            if path.startswith(requested_path + '/'):
+                return requested_path, response
+        for subtree in self._subtrees:
+            if path.startswith(subtree + '/'):
+                return subtree, None
+        return path, None
+
+    def edit_config(self, requests, send):
+        """Return the responses of GET requests, as the connection's
+        'edit_config' does
+
+        :param requests: list of GET requests
+        :param send: function sending a list of requests to the device
+        """
+        plan = []
+        to_send = []
+        claimed = []
+        with self._lock:
+            for request in requests:
+                path = get_request_path(request)
+                if path is None:
+                    plan.append((request, None, None, len(to_send)))
+                    to_send.append(request)
+                    continue
+                response_path, response = self._find_response(path)
+                if response is None:
+                    response = SharedResponse()
+                    self._responses[response_path] = response
+                    claimed.append((response_path, response, len(to_send)))
+                    to_send.append(dict(request, path=response_path) if response_path != path else request)
+                plan.append((request, path, response_path, response))
+
+        responses = None
+        if to_send:
+            try:
+                responses = send(to_send)
+            except Exception as exc:
+                with self._lock:
+                    for response_path, response, dummy in claimed:
+                        if len(to_send) == 1:
+                            response.set_error(exc)
+                        else:
+                            # The failed request is not known, the requests are sent again separately
+                            del self._responses[response_path]
+                            response.set_error(None)
+                raise
+            for response_path, response, idx in claimed:
+                response.set(responses[idx][0], responses[idx][1])
+
+        result = []
+        for request, path, response_path, response in plan:
+            if path is None:
+                result.append(responses[response])
+                continue
+            response.event.wait()
+            body = None
+            if response.error is not None:
+                if response_path == path:
+                    raise response.error
+            elif response.code is not None:
+                body = response.body if response_path == path else get_subtree_slice(response.body, response_path, path)
+            if body is None:
+                result.append(self._get_path(path, request, send))
+            else:
+                result.append((response.code, deepcopy(body)))
+        return result
+
+    def _get_path(self, path, request, send):
+        """Return the response of a GET request which could not be sliced
+        from the response of a path above it
+        """
+        with self._lock:
+            response = self._responses.get(path)
+            claimed = response is None
+            if claimed:
+                response = SharedResponse()
+                self._responses[path] = response
+        if claimed:
+            try:
+                response.set(*send([request])[0])
+            except Exception as exc:
+                response.set_error(exc)
+        response.event.wait()
+        if response.error is not None:
+            raise response.error
+        if response.code is None:
+            return send([request])[0]
+        return (response.code, deepcopy(response.body))
@@ -0,0 +1,154 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# On-disk cache of the network resource facts of the devices
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import gzip
+import json
+import os
+import re
+import tempfile
+import time
+
+from ansible.module_utils.connection import ConnectionError
+
+FACTS_CACHE_DIR_ENV_VAR = 'ANSIBLE_SONIC_FACTS_CACHE_DIR'
+FACTS_CACHE_TTL_ENV_VAR = 'ANSIBLE_SONIC_FACTS_CACHE_TTL'
+DEFAULT_FACTS_CACHE_TTL = 300
+FACTS_CACHE_VERSION = 1
+
+
+class FactsCache(object):
+    """Facts of the network resources of one device, saved in a gzip
+    compressed JSON file
+
+    An entry holds the facts of a resource, the time they were collected
+    and the fingerprint of the resource configuration they were collected
+    with, if known. An entry is valid for 'ttl' seconds, and only while
+    the fingerprint of the resource configuration is unchanged when the
+    fingerprints are known.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_FACTS_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with gzip.open(self.path, 'rt') as cache_file:
+                    content = json.load(cache_file)
+                if content.get('version') == FACTS_CACHE_VERSION:
+                    self._entries = content.get('resources') or {}
+            except (IOError, OSError, ValueError, EOFError, AttributeError):
+                # A missing or unreadable cache is empty
+                pass
+        return self._entries
+
+    def get(self, resource, fingerprint=None, fingerprint_required=False):
+        """Return the cache entry of a resource if it is still valid, or None
+
+        :param fingerprint: current fingerprint of the resource configuration
+        :param fingerprint_required: only return an entry with the current fingerprint
+        :rtype: dict
+        :returns: the entry, with the resource facts in 'facts', None if
+                  the resource has no configuration
+        """
+        entry = self._load().get(resource)
+        if not entry:
+            return None
+        if not 0 <= time.time() - entry.get('timestamp', 0) < self.ttl:
+            return None
+        if fingerprint is not None and entry.get('fingerprint') is not None:
+            return entry if entry['fingerprint'] == fingerprint else None
+        if fingerprint_required:
+            return None
+        return entry
+
+    def put(self, resource, facts, fingerprint=None):
+        """Add the facts of a resource to the cache, saved by 'save'"""
+        self._load()[resource] = {'timestamp': time.time(), 'fingerprint': fingerprint, 'facts': facts}
+
+    def save(self):
+        """Write the cache file atomically, readable by its owner only"""
+        directory = os.path.dirname(self.path) or '.'
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        content = {'version': FACTS_CACHE_VERSION, 'resources': self._load()}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.facts-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                with gzip.GzipFile(fileobj=tmp_file, mode='wb') as cache_file:
+                    cache_file.write(json.dumps(content).encode('utf-8'))
+            os.rename(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self):
+        """Remove the cache file"""
+        self._entries = {}
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def get_facts_cache_settings(module):
+    """Return the facts cache directory and TTL, from the 'cache_dir' and
+    'cache_ttl' module options, or from the ANSIBLE_SONIC_FACTS_CACHE_DIR and
+    ANSIBLE_SONIC_FACTS_CACHE_TTL environment variables
+
+    :rtype: tuple
+    :returns: the directory, None if the cache is disabled, and the TTL
+    """
+    cache_dir = module.params.get('cache_dir') or os.environ.get(FACTS_CACHE_DIR_ENV_VAR)
+    cache_ttl = module.params.get('cache_ttl')
+    if cache_ttl is None:
+        cache_ttl = int(os.environ.get(FACTS_CACHE_TTL_ENV_VAR) or DEFAULT_FACTS_CACHE_TTL)
+    return cache_dir, cache_ttl
+
+
+def get_facts_cache_file_name(host, port=None, remote_user=None):
+    """Return the name of the facts cache file of a device, from the host,
+    port and user of the connection, so that devices reached through the
+    same host on different ports, or as different users, have their own
+    cache files
+    """
+    device = str(host)
+    if port:
+        device = '%s_%s' % (device, port)
+    if remote_user:
+        device = '%s@%s' % (remote_user, device)
+    return re.sub(r'[^\w.@-]', '_', device) + '.json.gz'
+
+
+def get_facts_cache(module, connection_factory):
+    """Return the facts cache of the device of a module, or None if the
+    facts cache is disabled
+
+    :param connection_factory: function returning the connection of the module
+    """
+    if not hasattr(module, '_sonic_facts_cache'):
+        module._sonic_facts_cache = None
+        cache_dir, cache_ttl = get_facts_cache_settings(module)
+        if cache_dir:
+            try:
+                connection = connection_factory(module)
+                host = connection.get_option('host')
+                port = connection.get_option('port')
+                remote_user = connection.get_option('remote_user')
+            except ConnectionError:
+                host = None
+            if host:
+                file_name = get_facts_cache_file_name(host, port, remote_user)
+                module._sonic_facts_cache = FactsCache(os.path.join(os.path.expanduser(cache_dir), file_name), cache_ttl)
+    return module._sonic_facts_cache
@@ -0,0 +1,65 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Key filters restricting the facts gathered by the resource modules to the entries of their configuration
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+
+from ansible.module_utils.parsing.convert_bool import boolean
+
+FILTERED_FACTS_ENV_VAR = 'ANSIBLE_SONIC_FILTERED_FACTS'
+# States which only change the entries of the 'config' option
+FILTERED_FACTS_STATES = ('merged', 'replaced')
+
+
+def get_config_keys(module, get_keys):
+    """Return the sorted keys of the entries of the 'config' option of a
+    resource module, or None if the facts of the whole resource are needed
+
+    The whole resource is needed unless the ANSIBLE_SONIC_FILTERED_FACTS
+    environment variable is true, and the state is 'merged' or 'replaced'
+    with a 'config' option.
+
+    :param get_keys: function returning the list of keys of an entry of
+                     the 'config' option, or None if the entry needs the
+                     whole resource
+    """
+    if not boolean(os.environ.get(FILTERED_FACTS_ENV_VAR) or False, strict=False):
+        return None
+    if module.params.get('state') not in FILTERED_FACTS_STATES or not module.params.get('config'):
+        return None
+
+    keys = set()
+    for conf in module.params['config']:
+        conf_keys = get_keys(conf)
+        if conf_keys is None:
+            return None
+        keys.update(conf_keys)
+    return sorted(keys)
+
+
+def set_facts_key_filter(module, resource, keys):
+    """Restrict the facts of a resource gathered for a module to the
+    entries with the given keys, or gather all of them if keys is None
+    """
+    if not hasattr(module, '_sonic_facts_key_filters'):
+        module._sonic_facts_key_filters = {}
+    module._sonic_facts_key_filters[resource] = keys
+
+
+def get_facts_key_filter(module, resource):
+    """Return the keys of the entries of a resource to gather, or None to
+    gather all the entries
+    """
+    return getattr(module, '_sonic_facts_key_filters', {}).get(resource)
+
+
+def has_facts_key_filter(module, resources):
+    """Return True if the facts of one of the resources are filtered"""
+    return any(get_facts_key_filter(module, resource) is not None for resource in resources)
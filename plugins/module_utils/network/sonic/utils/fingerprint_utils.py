@@ -0,0 +1,170 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Fingerprints of the configuration of the network resources of a device
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    to_request,
+    edit_config,
+    get_query_unsupported
+)
+
+GET = 'get'
+
+# Top level configuration containers read by the facts classes of the
+# resources. The fingerprint of a resource changes when the configuration
+# in one of its containers changes. Each container is read whole, so a
+# fingerprint costs about as much as the largest GET of the facts of its
+# resource; it saves the facts requests beyond that one, and the parsing
+# of the facts.
+RESOURCE_CONFIG_TREES = {
+    'vlans': ('sonic-vlan:sonic-vlan',),
+    'interfaces': ('openconfig-interfaces:interfaces',),
+    'l2_interfaces': ('openconfig-interfaces:interfaces',),
+    'l3_interfaces': ('openconfig-interfaces:interfaces',),
+    'lag_interfaces': ('sonic-portchannel:sonic-portchannel',),
+    'bgp': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'bgp_af': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'bgp_neighbors': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'bgp_neighbors_af': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'bgp_as_paths': ('openconfig-routing-policy:routing-policy',),
+    'bgp_communities': ('openconfig-routing-policy:routing-policy',),
+    'bgp_ext_communities': ('openconfig-routing-policy:routing-policy',),
+    'ospfv2_interfaces': ('openconfig-interfaces:interfaces',),
+    'ospfv3_interfaces': ('openconfig-interfaces:interfaces',),
+    'ospfv2': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'ospfv3_area': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'ospfv3': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'mclag': ('openconfig-mclag:mclag',),
+    'prefix_lists': ('openconfig-routing-policy:routing-policy',),
+    'vlan_mapping': ('openconfig-interfaces:interfaces', 'sonic-port:sonic-port', 'sonic-portchannel:sonic-portchannel'),
+    'vrfs': ('openconfig-network-instance:network-instances',),
+    'vrrp': ('openconfig-interfaces:interfaces',),
+    'vxlans': ('sonic-vrf:sonic-vrf', 'sonic-vxlan:sonic-vxlan'),
+    'users': ('openconfig-system:system',),
+    'system': ('openconfig-loadshare-mode-ext:loadshare', 'openconfig-system:system', 'sonic-device-metadata:sonic-device-metadata', 'sonic-sag:sonic-sag'),
+    'port_breakout': ('openconfig-platform:components', 'sonic-port-breakout:sonic-port-breakout'),
+    'pms': ('openconfig-pms-ext:port-security',),
+    'ptp_default_ds': ('ietf-ptp:ptp',),
+    'aaa': ('openconfig-system:system',),
+    'ldap': ('openconfig-system:system',),
+    'tacacs_server': ('openconfig-system:system',),
+    'radius_server': ('openconfig-system:system',),
+    'static_routes': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'ntp': ('openconfig-system:system',),
+    'logging': ('openconfig-system:system',),
+    'pki': ('openconfig-pki:pki',),
+    'ip_neighbor': ('openconfig-neighbor:neighbor-globals',),
+    'ip_neighbor_interfaces': ('openconfig-interfaces:interfaces',),
+    'ipv6_router_advertisement': ('openconfig-interfaces:interfaces',),
+    'port_group': ('openconfig-port-group:port-groups',),
+    'dhcp_relay': ('openconfig-relay-agent:relay-agent',),
+    'dhcp_snooping': ('openconfig-dhcp-snooping:dhcp-snooping', 'openconfig-dhcp-snooping:dhcp-snooping-binding'),
+    'acl_interfaces': ('openconfig-acl:acl',),
+    'l2_acls': ('openconfig-acl:acl',),
+    'l3_acls': ('openconfig-acl:acl',),
+    'lldp_global': ('openconfig-lldp:lldp',),
+    'mac': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'bfd': ('openconfig-bfd:bfd',),
+    'copp': ('openconfig-copp-ext:copp',),
+    'route_maps': ('openconfig-routing-policy:routing-policy',),
+    'lldp_interfaces': ('openconfig-lldp:lldp',),
+    'stp': ('openconfig-spanning-tree:stp',),
+    'sflow': ('openconfig-sampling-sflow:sampling',),
+    'fips': ('openconfig-fips:fips',),
+    'roce': ('sonic-switch:sonic-switch',),
+    'qos_buffer': ('openconfig-qos:qos', 'sonic-switch:sonic-switch'),
+    'qos_pfc': ('openconfig-qos:qos',),
+    'qos_maps': ('openconfig-qos:qos',),
+    'qos_scheduler': ('openconfig-qos:qos',),
+    'qos_wred': ('openconfig-qos:qos',),
+    'qos_interfaces': ('openconfig-qos:qos',),
+    'pim_global': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'pim_interfaces': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'login_lockout': ('openconfig-system:system',),
+    'poe': ('openconfig-interfaces:interfaces', 'openconfig-poe:poe'),
+    'mgmt_servers': ('openconfig-system:system',),
+    'ospf_area': ('openconfig-network-instance:network-instances', 'sonic-vrf:sonic-vrf'),
+    'ssh': ('openconfig-system:system',),
+    'lst': ('openconfig-lst-ext:lst',),
+    'fbs_classifiers': ('openconfig-fbs-ext:fbs',),
+    'fbs_groups': ('openconfig-fbs-ext:fbs',),
+    'fbs_policies': ('openconfig-fbs-ext:fbs',),
+    'ars': ('openconfig-system:system',),
+    'network_policy': ('openconfig-network-policy-ext:network-policies',),
+    'mirroring': ('openconfig-mirror-ext:mirror',),
+    'mfa': ('openconfig-mfa:mfa',),
+    'dcbx': ('openconfig-dcbx:dcbx',),
+    'drop_counter': ('sonic-debugcounter:sonic-debugcounter',),
+    'br_l2pt': ('openconfig-interfaces:interfaces',),
+    'ptp_port_ds': ('ietf-ptp:ptp',),
+    'evpn_esi_multihome': ('openconfig-network-instance:network-instances',),
+    'ssh_server': ('openconfig-system:system',),
+    'ecmp_load_share': ('openconfig-loadshare-mode-ext:loadshare',),
+    'fbs_interfaces': ('openconfig-fbs-ext:fbs',),
+}
+
+
+def get_digest(value):
+    """Return the SHA-256 digest of a JSON value, independent of the order of its keys"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def get_config_trees(resources):
+    """Return the sorted configuration containers of resources"""
+    return sorted(set(tree for resource in resources for tree in RESOURCE_CONFIG_TREES.get(resource, ())))
+
+
+def get_config_fingerprints(module, resources):
+    """Get the fingerprints of the configuration of resources
+
+    Each configuration container of the resources is requested once, with
+    the RESTCONF 'content=config' query parameter, and hashed. The digest of
+    a resource is computed from the digests of its containers.
+
+    A container of a YANG module for which the device rejects query
+    parameters is not hashed, as its response also holds the state data,
+    such as counters, which changes from one request to the next.
+
+    :param resources: list of resource names
+    :rtype: tuple
+    :returns: the digest of the configuration of all the resources, and the
+              resource names mapped to their digests; None for a resource
+              which configuration containers are not known or not hashed,
+              and for all the resources if one of them is None
+    """
+    trees = get_config_trees(resources)
+    tree_digests = {}
+    if trees:
+        requests = [{'path': 'data/%s' % tree, 'method': GET, 'content': 'config'} for tree in trees]
+        try:
+            responses = edit_config(module, to_request(module, requests))
+        except ConnectionError as exc:
+            module.fail_json(msg=str(exc), code=exc.code)
+        unsupported = set(get_query_unsupported(module))
+        for tree, response in zip(trees, responses):
+            if tree.split(':')[0] in unsupported:
+                tree_digests[tree] = None
+            else:
+                tree_digests[tree] = get_digest(response[1] if len(response) > 1 else None)
+
+    resource_digests = {}
+    for resource in resources:
+        resource_trees = RESOURCE_CONFIG_TREES.get(resource)
+        if resource_trees and all(tree_digests[tree] is not None for tree in resource_trees):
+            resource_digests[resource] = get_digest([(tree, tree_digests[tree]) for tree in sorted(resource_trees)])
+        else:
+            resource_digests[resource] = None
+    if None in resource_digests.values():
+        return None, resource_digests
+    return get_digest(sorted(tree_digests.items())), resource_digests
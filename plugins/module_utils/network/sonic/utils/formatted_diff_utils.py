@@ -8,7 +8,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import heapq
 import json
+import os
+from bisect import (
+    bisect_left
+)
+from collections import (
+    deque
+)
 from copy import (
     deepcopy
 )
@@ -16,6 +24,16 @@ from difflib import (
     context_diff
 )
 
+from ansible.module_utils._text import to_native
+from ansible.module_utils.parsing.convert_bool import boolean
+
+GENERATED_AFTER_ENV_VAR = 'ANSIBLE_SONIC_GENERATED_AFTER'
+DIFF_MODE_ENV_VAR = 'ANSIBLE_SONIC_DIFF_MODE'
+DIFF_MAX_LINES_ENV_VAR = 'ANSIBLE_SONIC_DIFF_MAX_LINES'
+
+DIFF_MODE_TEXT = 'text'
+DIFF_MODE_STRUCTURAL = 'structural'
+
 
 def get_key_sets(dict_conf):
     key_set = set(dict_conf.keys())
@@ -30,20 +48,121 @@ def get_key_sets(dict_conf):
     return trival_key_set, dict_list_key_set
 
 
-def get_test_key_set(key, test_keys):
-    tst_keys = deepcopy(test_keys)
-    t_key_set = set()
-    if not tst_keys or not key:
-        return t_key_set
+def get_list_item_key(item, key_names):
+    """Return the tuple of the values of the test keys of a list item, or
+    None if the item is not a dict, or a key is missing, empty or has a value
+    which is not hashable
+    """
+    if not isinstance(item, dict):
+        return None
+    try:
+        item_key = tuple(item[key] for key in key_names)
+        hash(item_key)
+    except (KeyError, TypeError):
+        return None
+    if any(value in [None, [], {}] for value in item_key):
+        return None
+    return item_key
+
+
+class ListIndex(object):
+    """Index of the items of a list of existing configuration, used to match
+    the items of the commands with them and to change the list, in the
+    derivation of the configuration from several commands
+
+    The items are identified by stamps, which follow their order in the list
+    as the items are only removed from the list or added at its end. With
+    the default key match operation, an item which has all the test keys can
+    only match a command item with the same values of these keys, so the
+    items are indexed by the tuple of the values of their keys, the items
+    without a key tuple being candidates for any command item.
+
+    The list is changed in place once it is owned by the derivation, and
+    copied before its first change otherwise.
+    """
+
+    def __init__(self, items, key_names):
+        self.items = items
+        self.key_names = key_names
+        self.owned = False
+        self.stamps = list(range(len(items)))
+        self.next_stamp = len(items)
+        self.item_keys = {}
+        self.index = {}
+        self.other_stamps = []
+        for stamp, item in zip(self.stamps, items):
+            self.add_stamp(stamp, item)
+
+    def add_stamp(self, stamp, item):
+        item_key = None
+        if self.key_names:
+            item_key = get_list_item_key(item, self.key_names)
+        self.item_keys[stamp] = item_key
+        if item_key is None:
+            self.other_stamps.append(stamp)
+        else:
+            self.index.setdefault(item_key, []).append(stamp)
+
+    def get_candidates(self, c_item):
+        """Return the stamps and the items of the list which can match a
+        command item, in their order in the list
+        """
+        c_key = None
+        if self.key_names:
+            c_key = get_list_item_key(c_item, self.key_names)
+        if c_key is None:
+            return zip(self.stamps, self.items)
+        stamps = heapq.merge(self.index.get(c_key, []), self.other_stamps)
+        return ((stamp, self.items[bisect_left(self.stamps, stamp)]) for stamp in stamps)
+
+    def get_remaining_items(self, removed_stamps):
+        """Return a new list of the items which are not removed"""
+        return [item for stamp, item in zip(self.stamps, self.items) if stamp not in removed_stamps]
+
+    def update(self, list_indexes, removed_stamps, new_items):
+        """Remove items from the list and add new items at its end, and
+        return the changed list
+        """
+        if not self.owned:
+            list_indexes.pop(id(self.items), None)
+            self.items = list(self.items)
+            self.owned = True
+            list_indexes[id(self.items)] = self
+
+        for stamp in sorted(removed_stamps, reverse=True):
+            pos = bisect_left(self.stamps, stamp)
+            del self.items[pos]
+            del self.stamps[pos]
+            item_key = self.item_keys.pop(stamp)
+            if item_key is None:
+                self.other_stamps.remove(stamp)
+            else:
+                self.index[item_key].remove(stamp)
+                if not self.index[item_key]:
+                    del self.index[item_key]
+
+        for item in new_items:
+            self.items.append(item)
+            self.stamps.append(self.next_stamp)
+            self.add_stamp(self.next_stamp, item)
+            self.next_stamp += 1
+
+        return self.items
 
-    t_keys = next((t_key_item[key] for t_key_item in tst_keys if key in t_key_item), None)
-    if t_keys:
-        t_keys.pop('__merge_op', None)
-        t_keys.pop('__delete_op', None)
-        t_keys.pop('__key_match_op', None)
-        t_key_set = set(t_keys.keys())
 
-    return t_key_set
+def get_list_index(list_indexes, items, key_names):
+    """Return the index of a list of existing configuration, from the
+    indexes of the lists already used in the derivation if possible
+
+    :param list_indexes: dict of the indexes by the ids of their lists
+    :param key_names: sorted names of the test keys of the list items, or
+                      None if they are matched by another key match operation
+    """
+    list_index = list_indexes.get(id(items))
+    if list_index is None or list_index.items is not items or list_index.key_names != key_names:
+        list_index = ListIndex(items, key_names)
+        list_indexes[id(items)] = list_index
+    return list_index
 
 
 #
@@ -76,19 +195,6 @@ def __KEY_MATCH_OP_DEFAULT(key_set, command, exist_conf):
     return key_matched
 
 
-def get_key_match_op(key, test_keys):
-    k_match_op = __KEY_MATCH_OP_DEFAULT
-    t_key_set = set()
-    if not test_keys or not key:
-        return k_match_op
-
-    t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
-    if t_keys:
-        k_match_op = t_keys.get('__key_match_op', __KEY_MATCH_OP_DEFAULT)
-
-    return k_match_op
-
-
 #
 # Pre-defined Merge Operations
 #
@@ -114,22 +220,6 @@ def __MERGE_OP_DEFAULT(key_set, command, exist_conf):
     return False, new_conf
 
 
-merge_op_dft = __MERGE_OP_DEFAULT
-
-
-def get_merge_op(key, test_keys):
-    mrg_op = merge_op_dft
-    if not test_keys:
-        return mrg_op
-    if not key:
-        key = '__default_ops'
-    t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
-    if t_keys:
-        mrg_op = t_keys.get('__merge_op', merge_op_dft)
-
-    return mrg_op
-
-
 #
 # Pre-defined Delete Operations
 #
@@ -312,75 +402,214 @@ def __DELETE_OP_DEFAULT(key_set, command, exist_conf):
     return False, new_conf
 
 
-delete_op_dft = __DELETE_OP_DEFAULT
+# Pre-defined operations, which only add, replace or remove entries of the
+# existing configuration dict passed to them
+SHALLOW_OPS = (
+    __MERGE_OP_DEFAULT,
+    __DELETE_CONFIG,
+    __DELETE_CONFIG_IF_NO_SUBCONFIG,
+    __DELETE_SUBCONFIG_AND_LEAFS,
+    __DELETE_SUBCONFIG_ONLY,
+    __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_SAME_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_CONFIG_IF_NO_NON_KEY_LEAF_OR_SUBCONFIG,
+    __DELETE_OP_DEFAULT,
+)
 
 
-def get_delete_op(key, test_keys):
-    del_op = delete_op_dft
+def get_op_args(op, command, exist_conf):
+    """Return the command and the existing configuration to pass to a merge
+    or delete operation, copied for the operation to change them in place
+
+    The derived configuration shares the unchanged parts of the existing
+    configuration and of the commands, so the pre-defined operations get a
+    shallow copy of the existing configuration, and the other operations,
+    which can change any part of their arguments, get deep copies of them.
+    """
+    if op in SHALLOW_OPS:
+        return command, dict(exist_conf)
+    return deepcopy(command), deepcopy(exist_conf)
+
+
+class OpsTable(object):
+    """Operations of the keys of a configuration, compiled from test keys
+
+    For each key, the table holds the tuple of its test key set, the sorted
+    names of the test keys matching its list items (None if they are matched
+    by another key match operation), and its key match, merge and delete
+    operations, as found in the first test keys entry with the key. The keys
+    without entry get the default operations of the '__default_ops' entry.
+    The table is not changed while deriving a configuration, except to add
+    the tables of the items of its lists, so that derivations can share it.
+    """
+
+    def __init__(self, test_keys, key_ops, default_ops):
+        self.test_keys = test_keys
+        self.key_ops = key_ops
+        self.default_ops = default_ops
+        self.item_tables = {}
+
+    @property
+    def merge_op_dft(self):
+        return self.default_ops[3]
+
+    @property
+    def delete_op_dft(self):
+        return self.default_ops[4]
+
+    def get(self, key):
+        """Return the tuple of the test key set, key names and operations of
+        a key
+        """
+        return self.key_ops.get(key, self.default_ops)
+
+    def get_item_table(self, key):
+        """Return the table of the items of the list of a key, compiled from
+        the test keys entries without the key
+        """
+        item_table = self.item_tables.get(key)
+        if item_table is None:
+            item_test_keys = [t_key_item for t_key_item in self.test_keys if key not in t_key_item]
+            item_table = compile_test_keys(item_test_keys, self.default_ops)
+            self.item_tables[key] = item_table
+        return item_table
+
+
+def compile_test_keys(test_keys, default_ops=None):
+    """Return the OpsTable of test keys
+
+    :param default_ops: tuple of the operations of the keys without entry,
+                        by default those of the '__default_ops' entry
+    """
+    if isinstance(test_keys, OpsTable):
+        return test_keys
     if not test_keys:
-        return del_op
-    if not key:
-        key = '__default_ops'
-    t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
-    if t_keys:
-        del_op = t_keys.get('__delete_op', delete_op_dft)
+        test_keys = []
 
-    return del_op
+    key_entries = {}
+    for t_key_item in test_keys:
+        for key, t_keys in t_key_item.items():
+            key_entries.setdefault(key, t_keys)
+
+    if default_ops is None:
+        merge_op = __MERGE_OP_DEFAULT
+        delete_op = __DELETE_OP_DEFAULT
+        t_keys = key_entries.get('__default_ops')
+        if t_keys:
+            merge_op = t_keys.get('__merge_op', merge_op)
+            delete_op = t_keys.get('__delete_op', delete_op)
+        default_ops = (frozenset(), (), __KEY_MATCH_OP_DEFAULT, merge_op, delete_op)
+
+    key_ops = {}
+    for key, t_keys in key_entries.items():
+        if not key or not t_keys:
+            continue
+        t_key_set = frozenset(t_key for t_key in t_keys if t_key not in ('__merge_op', '__delete_op', '__key_match_op'))
+        k_match_op = t_keys.get('__key_match_op', __KEY_MATCH_OP_DEFAULT)
+        key_names = None
+        if k_match_op is __KEY_MATCH_OP_DEFAULT:
+            key_names = tuple(sorted(t_key_set))
+        key_ops[key] = (t_key_set, key_names, k_match_op,
+                        t_keys.get('__merge_op', default_ops[3]),
+                        t_keys.get('__delete_op', default_ops[4]))
 
+    return OpsTable(test_keys, key_ops, default_ops)
 
-def get_new_config(commands, exist_conf, test_keys=None):
 
+def get_new_config(commands, exist_conf, test_keys=None):
+    """Return the configuration derived from the existing configuration and
+    the commands of a resource module
+
+    The configuration is derived without changing the commands or the
+    existing configuration, sharing their unchanged parts, and the lists of
+    the derived configuration are indexed once for all the commands. It is
+    copied once at the end, so that the module can change it in place. The
+    test keys are compiled once into an OpsTable, and no module state is
+    changed, so that configurations can be derived concurrently.
+    """
     if not commands:
         return exist_conf
 
-    cmds = deepcopy(commands)
-
     n_conf = list()
     e_conf = exist_conf
-    for cmd in cmds:
+    ops_table = compile_test_keys(test_keys)
+    list_indexes = {}
+    for cmd in commands:
         state = cmd['state']
-        cmd.pop('state')
+        cmd = {key: value for key, value in cmd.items() if key != 'state'}
 
         if state == 'merged':
-            n_conf = derive_config_from_merged_cmd(cmd, e_conf, test_keys)
+            n_conf = derive_config_from_merged_cmd(cmd, e_conf, ops_table, list_indexes)
         elif state == 'deleted':
-            n_conf = derive_config_from_deleted_cmd(cmd, e_conf, test_keys)
+            n_conf = derive_config_from_deleted_cmd(cmd, e_conf, ops_table, list_indexes)
         elif state == 'replaced':
-            n_conf = derive_config_from_merged_cmd(cmd, e_conf, test_keys)
+            n_conf = derive_config_from_merged_cmd(cmd, e_conf, ops_table, list_indexes)
         elif state == 'overridden':
-            n_conf = derive_config_from_merged_cmd(cmd, e_conf, test_keys)
+            n_conf = derive_config_from_merged_cmd(cmd, e_conf, ops_table, list_indexes)
             # If the "cmd" is derived from playbook, that is "want", the below
             # line should be good enough:
             # n_conf = cmd
 
         e_conf = n_conf
 
-    return n_conf
+    return deepcopy(n_conf)
+
+
+def use_generated_config(module):
+    """Return True if the configuration of a resource module after its
+    changes is generated from the commands with 'get_new_config' instead of
+    being read again from the device, that is in check mode, or when the
+    ANSIBLE_SONIC_GENERATED_AFTER environment variable is true
+    """
+    return module.check_mode or boolean(os.environ.get(GENERATED_AFTER_ENV_VAR) or False, strict=False)
+
+
+def warn_generated_config_error(module, exc):
+    """Warn that the configuration of a resource module after its changes
+    could not be generated, and is read from the device instead
+
+    In check mode, where the device was not changed and the configuration
+    can only be generated, the error is raised again.
+    """
+    if module.check_mode:
+        raise exc
+    module.warn('Could not generate the configuration after the changes, reading it from the device: %s'
+                % to_native(exc))
+
 
+def add_generated_config(module, result, new_config):
+    """Add the generated configuration of a resource module to its result,
+    as 'after_generated' in check mode, or as 'after' if the configuration
+    changed
+    """
+    if module.check_mode:
+        result['after_generated'] = new_config
+    elif result['changed']:
+        result['after'] = new_config
 
-def derive_config_from_merged_cmd(command, exist_conf, test_keys=None):
 
-    global merge_op_dft
+def derive_config_from_merged_cmd(command, exist_conf, test_keys=None, list_indexes=None):
 
     if not command:
         return exist_conf
 
-    merge_op_dft = get_merge_op('__default_ops', test_keys)
+    ops_table = compile_test_keys(test_keys)
 
     if isinstance(command, list) and isinstance(exist_conf, list):
         nu, new_conf_dict = derive_config_from_merged_cmd_dict({"config": command},
                                                                {"config": exist_conf},
-                                                               test_keys)
+                                                               ops_table, list_indexes=list_indexes)
         new_conf = new_conf_dict.get("config", [])
     elif isinstance(command, dict) and isinstance(exist_conf, dict):
-        root_merge_op = get_merge_op('config', test_keys)
+        root_merge_op = ops_table.get('config')[3]
         nu, new_conf = derive_config_from_merged_cmd_dict(command, exist_conf,
-                                                          test_keys, None,
-                                                          None, root_merge_op)
+                                                          ops_table, None,
+                                                          None, root_merge_op, list_indexes)
     elif isinstance(command, dict) and isinstance(exist_conf, list):
         nu, new_conf_dict = derive_config_from_merged_cmd_dict({"config": [command]},
                                                                {"config": exist_conf},
-                                                               test_keys)
+                                                               ops_table, list_indexes=list_indexes)
         new_conf = new_conf_dict.get("config", [])
     else:
         new_conf = exist_conf
@@ -389,37 +618,45 @@ def derive_config_from_merged_cmd(command, exist_conf, test_keys=None):
 
 
 def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_set=None,
-                                       key_match_op=None, merge_op=None):
+                                       key_match_op=None, merge_op=None, list_indexes=None):
+    """Return whether the keys of a command and of the existing configuration
+    match, and the configuration with the command merged
 
-    if test_keys is None:
-        test_keys = []
+    The derived configuration shares the unchanged parts of the existing
+    configuration and of the command, which are not changed, except the lists
+    already copied in the derivation, as tracked by list_indexes.
+
+    :param test_keys: test keys, or the OpsTable compiled from them
+    """
+    ops_table = compile_test_keys(test_keys)
     if key_set is None:
         key_set = set()
     if key_match_op is None:
         key_match_op = __KEY_MATCH_OP_DEFAULT
     if merge_op is None:
-        merge_op = merge_op_dft
+        merge_op = ops_table.merge_op_dft
+    if list_indexes is None:
+        list_indexes = {}
 
-    new_conf = deepcopy(exist_conf)
     if not command:
-        return False, new_conf
+        return False, exist_conf
 
-    trival_cmd_key_set, dict_list_cmd_key_set = get_key_sets(command)
-    trival_exist_key_set, dict_list_exist_key_set = get_key_sets(new_conf)
-
-    common_trival_key_set = trival_cmd_key_set.intersection(trival_exist_key_set)
-    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+    nu, dict_list_cmd_key_set = get_key_sets(command)
 
-    key_matched = key_match_op(key_set, command, new_conf)
+    key_matched = key_match_op(key_set, command, exist_conf)
     if key_matched:
+        nu, merged_key_set = get_key_sets(exist_conf)
+        command, new_conf = get_op_args(merge_op, command, exist_conf)
         done, new_conf = merge_op(key_set, command, new_conf)
         if done:
             return key_matched, new_conf
         else:
             nu, dict_list_exist_key_set = get_key_sets(new_conf)
             common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+            # Keys whose lists of the command were set by the merge operation
+            merged_key_set = common_dict_list_key_set.difference(merged_key_set)
     else:
-        return key_matched, new_conf
+        return key_matched, exist_conf
 
     for key in key_set:
         common_dict_list_key_set.discard(key)
@@ -429,31 +666,40 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
         cmd_value = command[key]
         exist_value = new_conf[key]
 
-        t_key_set = get_test_key_set(key, test_keys)
-        t_key_match_op = get_key_match_op(key, test_keys)
-        t_merge_op = get_merge_op(key, test_keys)
+        t_key_set, key_names, t_key_match_op, t_merge_op, nu = ops_table.get(key)
 
         if (isinstance(cmd_value, list) and isinstance(exist_value, list)):
             c_list = cmd_value
             e_list = exist_value
 
+            item_table = ops_table.get_item_table(key)
+            if key in merged_key_set and c_list is e_list and t_key_set and all(isinstance(item, dict) for item in c_list):
+                new_conf[key] = merge_list_into_itself(c_list, item_table, t_key_set, t_key_match_op,
+                                                       t_merge_op, list_indexes)
+                continue
+
+            list_index = get_list_index(list_indexes, e_list, key_names)
+
             new_conf_list = list()
+            removed_stamps = set()
             not_dict_item = False
             dict_no_key_item = False
             for c_item in c_list:
                 matched_key_dict = False
-                for e_item in e_list:
+                for stamp, e_item in list_index.get_candidates(c_item):
+                    if stamp in removed_stamps:
+                        continue
                     if (isinstance(c_item, dict) and isinstance(e_item, dict)):
                         if t_key_set:
-                            remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
                             k_mtchd, new_conf_dict = derive_config_from_merged_cmd_dict(c_item,
                                                                                         e_item,
-                                                                                        remaining_keys,
+                                                                                        item_table,
                                                                                         t_key_set,
                                                                                         t_key_match_op,
-                                                                                        t_merge_op)
+                                                                                        t_merge_op,
+                                                                                        list_indexes)
                             if k_mtchd:
-                                new_conf[key].remove(e_item)
+                                removed_stamps.add(stamp)
                                 if new_conf_dict:
                                     new_conf_list.append(new_conf_dict)
                                 matched_key_dict = True
@@ -472,8 +718,15 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
                 if not_dict_item or dict_no_key_item:
                     break
 
+            if not_dict_item or dict_no_key_item:
+                e_list = list_index.get_remaining_items(removed_stamps)
+                new_conf[key] = e_list
+
             if dict_no_key_item:
                 new_conf_list = e_list + c_list
+                # The list repeats its items, so the lists in them must not
+                # be changed in place any more
+                list_indexes.clear()
 
             if not_dict_item:
                 c_set = set(c_list)
@@ -481,21 +734,23 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
                 merge_set = c_set.union(e_set)
                 if merge_set:
                     new_conf[key] = list(merge_set)
-            elif new_conf_list:
-                new_conf[key].extend(new_conf_list)
+            elif dict_no_key_item:
+                new_conf[key] = e_list + new_conf_list
+            elif removed_stamps or new_conf_list:
+                new_conf[key] = list_index.update(list_indexes, removed_stamps, new_conf_list)
 
         elif (isinstance(cmd_value, dict) and isinstance(exist_value, dict)):
             k_mtchd, new_conf_dict = derive_config_from_merged_cmd_dict(cmd_value,
                                                                         exist_value,
-                                                                        test_keys,
+                                                                        ops_table,
                                                                         None,
                                                                         t_key_match_op,
-                                                                        t_merge_op)
+                                                                        t_merge_op,
+                                                                        list_indexes)
             if k_mtchd and new_conf_dict:
                 new_conf[key] = new_conf_dict
 
         elif (isinstance(cmd_value, (list, dict)) or isinstance(exist_value, (list, dict))):
-            new_conf[key] = exist_value
             break
 
         else:
@@ -504,29 +759,60 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
     return key_matched, new_conf
 
 
-def derive_config_from_deleted_cmd(command, exist_conf, test_keys=None):
+def merge_list_into_itself(c_list, item_table, t_key_set, t_key_match_op, t_merge_op, list_indexes):
+    """Return the list of the dicts of a command merged into the same list,
+    which the merge operation set in the configuration as it had no such list
+
+    The items are matched and merged in the order in which the list was
+    merged when it was changed while being matched against itself: each
+    merged item is moved to the end of the list, and the command item
+    after it in the changed list is merged next, so that the order of the
+    generated configuration does not change.
+    """
+    items = list(c_list)
+    new_conf_list = list()
+    pos = 0
+    while pos < len(items):
+        c_item = items[pos]
+        matched_key_dict = False
+        for e_pos, e_item in enumerate(items):
+            k_mtchd, new_conf_dict = derive_config_from_merged_cmd_dict(c_item, e_item, item_table, t_key_set,
+                                                                        t_key_match_op, t_merge_op, list_indexes)
+            if k_mtchd:
+                del items[e_pos]
+                if new_conf_dict:
+                    new_conf_list.append(new_conf_dict)
+                matched_key_dict = True
+                break
+
+        if not matched_key_dict:
+            new_conf_list.append(c_item)
+        pos += 1
 
-    global delete_op_dft
+    return items + new_conf_list
+
+
+def derive_config_from_deleted_cmd(command, exist_conf, test_keys=None, list_indexes=None):
 
     if not command or not exist_conf:
         return exist_conf
 
-    delete_op_dft = get_delete_op('__default_ops', test_keys)
+    ops_table = compile_test_keys(test_keys)
 
     if isinstance(command, list) and isinstance(exist_conf, list):
         nu, new_conf_dict = derive_config_from_deleted_cmd_dict({"config": command},
                                                                 {"config": exist_conf},
-                                                                test_keys)
+                                                                ops_table, list_indexes=list_indexes)
         new_conf = new_conf_dict.get("config", [])
     elif isinstance(command, dict) and isinstance(exist_conf, dict):
-        root_delete_op = get_delete_op('config', test_keys)
+        root_delete_op = ops_table.get('config')[4]
         nu, new_conf = derive_config_from_deleted_cmd_dict(command, exist_conf,
-                                                           test_keys, None,
-                                                           None, root_delete_op)
+                                                           ops_table, None,
+                                                           None, root_delete_op, list_indexes)
     elif isinstance(command, dict) and isinstance(exist_conf, list):
         nu, new_conf_dict = derive_config_from_deleted_cmd_dict({"config": [command]},
                                                                 {"config": exist_conf},
-                                                                test_keys)
+                                                                ops_table, list_indexes=list_indexes)
         new_conf = new_conf_dict.get("config", [])
     else:
         new_conf = exist_conf
@@ -535,29 +821,34 @@ def derive_config_from_deleted_cmd(command, exist_conf, test_keys=None):
 
 
 def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key_set=None,
-                                        key_match_op=None, delete_op=None):
+                                        key_match_op=None, delete_op=None, list_indexes=None):
+    """Return whether the keys of a command and of the existing configuration
+    match, and the configuration with the command deleted
 
-    if test_keys is None:
-        test_keys = []
+    The derived configuration shares the unchanged parts of the existing
+    configuration and of the command, which are not changed, except the lists
+    already copied in the derivation, as tracked by list_indexes.
+
+    :param test_keys: test keys, or the OpsTable compiled from them
+    """
+    ops_table = compile_test_keys(test_keys)
     if key_set is None:
         key_set = set()
     if key_match_op is None:
         key_match_op = __KEY_MATCH_OP_DEFAULT
     if delete_op is None:
-        delete_op = delete_op_dft
+        delete_op = ops_table.delete_op_dft
+    if list_indexes is None:
+        list_indexes = {}
 
-    new_conf = deepcopy(exist_conf)
     if not command:
         return True, []
 
-    trival_cmd_key_set, dict_list_cmd_key_set = get_key_sets(command)
-    trival_exist_key_set, dict_list_exist_key_set = get_key_sets(new_conf)
-
-    common_trival_key_set = trival_cmd_key_set.intersection(trival_exist_key_set)
-    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+    nu, dict_list_cmd_key_set = get_key_sets(command)
 
-    key_matched = key_match_op(key_set, command, new_conf)
+    key_matched = key_match_op(key_set, command, exist_conf)
     if key_matched:
+        command, new_conf = get_op_args(delete_op, command, exist_conf)
         done, new_conf = delete_op(key_set, command, new_conf)
         if done:
             return key_matched, new_conf
@@ -565,7 +856,7 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
             nu, dict_list_exist_key_set = get_key_sets(new_conf)
             common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
     else:
-        return key_matched, new_conf
+        return key_matched, exist_conf
 
     for key in key_set:
         common_dict_list_key_set.discard(key)
@@ -575,29 +866,33 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
         cmd_value = command[key]
         exist_value = new_conf[key]
 
-        t_key_set = get_test_key_set(key, test_keys)
-        t_key_match_op = get_key_match_op(key, test_keys)
-        t_delete_op = get_delete_op(key, test_keys)
+        t_key_set, key_names, t_key_match_op, nu, t_delete_op = ops_table.get(key)
 
         if (isinstance(cmd_value, list) and isinstance(exist_value, list)):
             c_list = cmd_value
             e_list = exist_value
 
+            item_table = ops_table.get_item_table(key)
+            list_index = get_list_index(list_indexes, e_list, key_names)
+
             new_conf_list = list()
+            removed_stamps = set()
             not_dict_item = False
             dict_no_key_item = False
             for c_item in c_list:
-                for e_item in e_list:
+                for stamp, e_item in list_index.get_candidates(c_item):
+                    if stamp in removed_stamps:
+                        continue
                     if (isinstance(c_item, dict) and isinstance(e_item, dict)):
                         if t_key_set:
-                            remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
                             k_mtchd, new_conf_dict = derive_config_from_deleted_cmd_dict(c_item, e_item,
-                                                                                         remaining_keys,
+                                                                                         item_table,
                                                                                          t_key_set,
                                                                                          t_key_match_op,
-                                                                                         t_delete_op)
+                                                                                         t_delete_op,
+                                                                                         list_indexes)
                             if k_mtchd:
-                                new_conf[key].remove(e_item)
+                                removed_stamps.add(stamp)
                                 if new_conf_dict:
                                     new_conf_list.append(new_conf_dict)
                                 break
@@ -614,7 +909,7 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
 
             if not_dict_item:
                 c_set = set(c_list)
-                e_set = set(e_list)
+                e_set = set(list_index.get_remaining_items(removed_stamps))
                 delete_set = e_set.difference(c_set)
                 if delete_set:
                     new_conf[key] = list(delete_set)
@@ -622,23 +917,23 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
                     new_conf[key] = []
             elif dict_no_key_item:
                 new_conf[key] = e_list
-            elif new_conf_list:
-                new_conf[key].extend(new_conf_list)
+            elif removed_stamps or new_conf_list:
+                new_conf[key] = list_index.update(list_indexes, removed_stamps, new_conf_list)
 
         elif (isinstance(cmd_value, dict) and isinstance(exist_value, dict)):
             k_mtchd, new_conf_dict = derive_config_from_deleted_cmd_dict(cmd_value,
                                                                          exist_value,
-                                                                         test_keys,
+                                                                         ops_table,
                                                                          None,
                                                                          t_key_match_op,
-                                                                         t_delete_op)
+                                                                         t_delete_op,
+                                                                         list_indexes)
             if k_mtchd:
                 new_conf.pop(key, None)
                 if new_conf_dict:
                     new_conf[key] = new_conf_dict
 
         elif (isinstance(cmd_value, (list, dict)) or isinstance(exist_value, (list, dict))):
-            new_conf[key] = exist_value
             break
 
         else:
@@ -647,17 +942,217 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
     return key_matched, new_conf
 
 
-def get_formatted_config_diff(exist_conf, new_conf, verbosity=0):
+def get_diff_mode():
+    """Return the mode of the formatted diff set by the ANSIBLE_SONIC_DIFF_MODE
+    environment variable, 'text' by default
+    """
+    mode = (os.environ.get(DIFF_MODE_ENV_VAR) or DIFF_MODE_TEXT).strip().lower()
+    if mode not in (DIFF_MODE_TEXT, DIFF_MODE_STRUCTURAL):
+        mode = DIFF_MODE_TEXT
+    return mode
+
+
+def get_diff_max_lines():
+    """Return the maximum number of lines of the formatted diff set by the
+    ANSIBLE_SONIC_DIFF_MAX_LINES environment variable, or None if it is not
+    set or not a positive number
+    """
+    try:
+        max_lines = int(os.environ.get(DIFF_MAX_LINES_ENV_VAR) or 0)
+    except ValueError:
+        return None
+    if max_lines <= 0:
+        return None
+    return max_lines
+
+
+def format_diff_value(value):
+    """Return the lines of a value of the configuration, as formatted in the
+    text diff
+    """
+    value = json.dumps(value, sort_keys=True, indent=4, separators=(u',', u': '))
+    return value.replace("\"", "\'").splitlines()
+
+
+def get_diff_item_label(item_key, key_names):
+    """Return the label of a list item in the path of a diff hunk"""
+    return u'[%s]' % u', '.join(u'%s=%s' % (name, format_diff_value(value)[0])
+                                for name, value in zip(key_names, item_key))
+
+
+def get_hashable_value(value):
+    """Return a hashable value equal to the given value of the configuration
+    for the values to which it is compared
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, get_hashable_value(item)) for key, item in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(get_hashable_value(item) for item in value))
+    return value
+
+
+def get_structural_diff(exist_conf, new_conf, test_keys=None):
+    """Return an iterator on the lines of the structural diff of two
+    configurations
+
+    The configurations are walked together, with the list items matched by
+    the values of their test keys, or by value if they have no test keys.
+    For each dict with changed values, the diff has a hunk headed by the
+    path of the dict, with the changed values, and for each list with added
+    or removed items, a hunk with the items. The unchanged entries are not
+    in the diff, nor the order of the list items.
+    """
+    ops_table = compile_test_keys(test_keys)
+    hunks = get_value_diff_hunks(u'config', 'config', exist_conf, new_conf, ops_table)
+    header = [u'--- before\n', u'+++ after\n']
+    for path, lines in hunks:
+        for line in header:
+            yield line
+        header = []
+        yield u'@@ %s @@\n' % path
+        for line in lines:
+            yield line + u'\n'
+
+
+def get_value_diff_hunks(path, key, exist_value, new_value, ops_table):
+    """Return an iterator on the (path, lines) hunks of the diff of a value of
+    the configuration
+    """
+    if exist_value == new_value:
+        return iter(())
+    if isinstance(exist_value, dict) and isinstance(new_value, dict):
+        return get_dict_diff_hunks(path, exist_value, new_value, ops_table)
+    if isinstance(exist_value, list) and isinstance(new_value, list):
+        return get_list_diff_hunks(path, key, exist_value, new_value, ops_table)
+    lines = [u'-    ' + line for line in format_diff_value(exist_value)]
+    lines.extend(u'+    ' + line for line in format_diff_value(new_value))
+    return iter([(path, lines)])
+
+
+def get_dict_diff_hunks(path, exist_dict, new_dict, ops_table):
+    lines = []
+    nested = []
+    for key in sorted(set(exist_dict).union(new_dict)):
+        exist_value = exist_dict.get(key)
+        new_value = new_dict.get(key)
+        if key in exist_dict and key in new_dict:
+            if exist_value == new_value:
+                continue
+            if ((isinstance(exist_value, dict) and isinstance(new_value, dict)) or
+                    (isinstance(exist_value, list) and isinstance(new_value, list))):
+                nested.append(key)
+                continue
+        label = format_diff_value(key)[0] + u': '
+        for sign, conf in ((u'-', exist_dict), (u'+', new_dict)):
+            if key in conf:
+                value_lines = format_diff_value(conf[key])
+                value_lines[0] = label + value_lines[0]
+                lines.extend(u'%s    %s' % (sign, line) for line in value_lines)
+
+    if lines:
+        yield path, lines
+    for key in nested:
+        for hunk in get_value_diff_hunks(u'%s.%s' % (path, key), key, exist_dict[key], new_dict[key], ops_table):
+            yield hunk
+
+
+def get_list_diff_hunks(path, key, exist_list, new_list, ops_table):
+    key_names = ops_table.get(key)[1]
+    item_table = ops_table.get_item_table(key)
+
+    # Match the items with the same test key values, in their order
+    exist_items = {}
+    other_exist_idxs = []
+    for idx, item in enumerate(exist_list):
+        item_key = get_list_item_key(item, key_names) if key_names else None
+        if item_key is None:
+            other_exist_idxs.append(idx)
+        else:
+            exist_items.setdefault(item_key, deque()).append(idx)
+
+    matched_idxs = {}
+    other_new_idxs = []
+    for idx, item in enumerate(new_list):
+        item_key = get_list_item_key(item, key_names) if key_names else None
+        exist_idxs = exist_items.get(item_key) if item_key is not None else None
+        if exist_idxs:
+            matched_idxs[exist_idxs.popleft()] = (idx, item_key)
+        else:
+            other_new_idxs.append(idx)
+    for exist_idxs in exist_items.values():
+        other_exist_idxs.extend(exist_idxs)
+    other_exist_idxs.sort()
+
+    # Match the other items by value
+    new_values = {}
+    for idx in other_new_idxs:
+        new_values.setdefault(get_hashable_value(new_list[idx]), deque()).append(idx)
+    removed_idxs = []
+    for idx in other_exist_idxs:
+        new_idxs = new_values.get(get_hashable_value(exist_list[idx]))
+        if new_idxs:
+            new_idxs.popleft()
+        else:
+            removed_idxs.append(idx)
+    added_idxs = sorted(idx for new_idxs in new_values.values() for idx in new_idxs)
+
+    lines = []
+    for sign, conf_list, idxs in ((u'-', exist_list, removed_idxs), (u'+', new_list, added_idxs)):
+        for idx in idxs:
+            lines.extend(u'%s    %s' % (sign, line) for line in format_diff_value(conf_list[idx]))
+    if lines:
+        yield path, lines
+
+    for exist_idx in sorted(matched_idxs):
+        new_idx, item_key = matched_idxs[exist_idx]
+        item_path = path + get_diff_item_label(item_key, key_names)
+        for hunk in get_value_diff_hunks(item_path, key, exist_list[exist_idx], new_list[new_idx], item_table):
+            yield hunk
+
+
+def get_limited_diff(diffs, max_lines):
+    """Return an iterator on the first lines of a diff, followed by a line
+    noting that the diff is truncated if it has more lines
+    """
+    for count, line in enumerate(diffs):
+        if count == max_lines:
+            yield u'... diff truncated to %d lines\n' % max_lines
+            return
+        yield line
+
+
+def get_formatted_config_diff(exist_conf, new_conf, verbosity=0, test_keys=None, mode=None, max_lines=None):
+    """Return the diff of the configuration of a resource module before and
+    after its changes, as a list of lines with verbosity 3 or more, or as
+    the 'prepared' text of a dict otherwise
+
+    :param test_keys: test keys matching the list items in the structural diff
+    :param mode: 'text' for the context diff of the whole configurations,
+                 'structural' for the diff of their changed entries only, by
+                 default the mode set by ANSIBLE_SONIC_DIFF_MODE
+    :param max_lines: maximum number of lines of the diff, by default the
+                      number set by ANSIBLE_SONIC_DIFF_MAX_LINES, if any
+    """
+    if mode is None:
+        mode = get_diff_mode()
+    if max_lines is None:
+        max_lines = get_diff_max_lines()
+
+    if mode == DIFF_MODE_STRUCTURAL:
+        diffs = get_structural_diff(exist_conf, new_conf, test_keys)
+    else:
+        exist_conf = json.dumps(exist_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
+        new_conf = json.dumps(new_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
 
-    exist_conf = json.dumps(exist_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
-    new_conf = json.dumps(new_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
+        bfr = exist_conf.replace("\"", "\'")
+        aft = new_conf.replace("\"", "\'")
 
-    bfr = exist_conf.replace("\"", "\'")
-    aft = new_conf.replace("\"", "\'")
+        bfr_list = bfr.splitlines(True)
+        aft_list = aft.splitlines(True)
+        diffs = context_diff(bfr_list, aft_list, fromfile='before', tofile='after')
 
-    bfr_list = bfr.splitlines(True)
-    aft_list = aft.splitlines(True)
-    diffs = context_diff(bfr_list, aft_list, fromfile='before', tofile='after')
+    if max_lines:
+        diffs = get_limited_diff(diffs, max_lines)
 
     if verbosity >= 3:
         formatted_diff = list()
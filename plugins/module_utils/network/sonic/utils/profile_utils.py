@@ -0,0 +1,86 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Utilities for profiling the requests sent to the device
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import math
+import os
+import re
+
+from ansible.module_utils.parsing.convert_bool import boolean
+
+PROFILE_ENV_VAR = 'ANSIBLE_SONIC_PROFILE'
+
+
+def is_profile_enabled():
+    """Check if profiling is enabled with the ANSIBLE_SONIC_PROFILE environment variable"""
+    return boolean(os.environ.get(PROFILE_ENV_VAR, False), strict=False)
+
+
+def get_path_template(path):
+    """Return the template of a request path, with the list keys
+    and the query replaced, e.g. 'interface=Eth1%2f1' by 'interface={}'
+    """
+    return re.sub(r'=[^/]*', '={}', path.split('?')[0].strip('/'))
+
+
+def get_percentile(sorted_values, percent):
+    """Return the nearest-rank percentile of a sorted list of values"""
+    idx = int(math.ceil(percent / 100.0 * len(sorted_values))) - 1
+    return sorted_values[max(idx, 0)]
+
+
+def get_time_summary(times):
+    times = sorted(times)
+    return {
+        'count': len(times),
+        'total': round(sum(times), 6),
+        'p50': round(get_percentile(times, 50), 6),
+        'p95': round(get_percentile(times, 95), 6),
+        'max': round(times[-1], 6)
+    }
+
+
+def get_profile_summary(calls, requests):
+    """Aggregate the profile records of a module run
+
+    :param calls: list of (name, seconds) tuples, one per connection call
+                  made by the module
+    :param requests: list of per-request records from the httpapi plugin
+    :rtype: dict
+    :returns: the count and p50/p95/max times per call name and
+              per request method and path template
+    """
+    call_times = {}
+    for name, elapsed in calls:
+        call_times.setdefault(name, []).append(elapsed)
+
+    request_records = {}
+    for record in requests:
+        key = '%s %s' % ((record.get('method') or 'get').upper(), record['path'])
+        request_records.setdefault(key, []).append(record)
+
+    summary = {'calls': {}, 'requests': {}}
+    for name, times in call_times.items():
+        summary['calls'][name] = get_time_summary(times)
+    for key, records in request_records.items():
+        req_summary = get_time_summary([rec['network_time'] + rec['decode_time'] for rec in records])
+        req_summary['network_time'] = round(sum(rec['network_time'] for rec in records), 6)
+        req_summary['decode_time'] = round(sum(rec['decode_time'] for rec in records), 6)
+        req_summary['bytes_in'] = sum(rec['bytes_in'] for rec in records)
+        req_summary['bytes_decoded'] = sum(rec['bytes_decoded'] for rec in records)
+        req_summary['bytes_out'] = sum(rec['bytes_out'] for rec in records)
+        req_summary['cached'] = sum(1 for rec in records if rec.get('cached'))
+        req_summary['status'] = {}
+        for rec in records:
+            status = str(rec.get('status'))
+            req_summary['status'][status] = req_summary['status'].get(status, 0) + 1
+        summary['requests'][key] = req_summary
+
+    return summary
@@ -129,7 +129,7 @@ def remove_void_config(config, test_keys=None):
 
     if isinstance(config, list):
         new_conf_dict = remove_void_config_dict({"config": config}, test_keys)
-        new_conf = new_conf_dict.get("config", [])
+        new_conf = new_conf_dict.get("config", []) if new_conf_dict else []
     elif isinstance(config, dict):
         new_conf = remove_void_config_dict(config, test_keys)
     else:
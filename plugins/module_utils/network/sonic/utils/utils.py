@@ -127,10 +127,17 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
             keys_to_compare = next((test_key_item[key] for test_key_item in test_keys if key in test_key_item), None)
             changed_list = []
             if p_list and d_list:
+                d_index = index_list_items(d_list, keys_to_compare) if keys_to_compare else None
                 for p_list_item in p_list:
                     matched = False
                     has_diff = False
-                    for d_list_item in d_list:
+                    d_list_items = d_list
+                    if d_index is not None and isinstance(p_list_item, dict):
+                        p_key = get_list_item_key(p_list_item, keys_to_compare)
+                        if p_key is not None:
+                            # Only the first entry with the same keys can match
+                            d_list_items = d_index.get(p_key, ())
+                    for d_list_item in d_list_items:
                         if (isinstance(p_list_item, dict) and isinstance(d_list_item, dict)):
                             if keys_to_compare:
                                 key_matched_cnt = 0
@@ -191,6 +198,40 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
     return changed_dict
 
 
+def get_list_item_key(item, keys):
+    """Return the tuple of the values of the keys of a dict list item, or
+    None if a key is missing or a value is not hashable"""
+    try:
+        item_key = tuple(item[key] for key in keys)
+        hash(item_key)
+    except (KeyError, TypeError):
+        return None
+    return item_key
+
+
+def index_list_items(items, keys):
+    """Index the items of a list by the values of their keys, for the items
+    of another list to be matched with them by key
+
+    An item is indexed as a single entry tuple, the first item being kept
+    when several items have the same keys.
+
+    :rtype: dict
+    :returns: the index, or None if an item is not a dict, misses a key or
+              has a value which is not hashable, which prevents matching
+              the other items by their keys only
+    """
+    index = {}
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        item_key = get_list_item_key(item, keys)
+        if item_key is None:
+            return None
+        index.setdefault(item_key, (item,))
+    return index
+
+
 def convert_dict_to_single_entry_list(base_data, compare_with_data, test_keys):
     # if it is dict comparision convert dict into single entry list by adding 'config' as key
     new_base = {'config': [base_data]}
@@ -681,33 +722,38 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
             e_list = exist_value
             t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
             t_key_set = set()
+            remaining_keys = []
             if t_keys:
                 t_key_set = set(t_keys.keys())
+                remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
 
             replaced_list = list()
             not_dict_item = False
             dict_no_key_item = False
-            for n_item in n_list:
-                for e_item in e_list:
-                    if (isinstance(n_item, dict) and isinstance(e_item, dict)):
-                        if t_keys:
-                            remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
-                            replaced_dict = get_replaced_config_dict(n_item, e_item,
-                                                                     remaining_keys, t_key_set)
+            if t_keys and all(isinstance(item, dict) for item in n_list) and \
+               all(isinstance(item, dict) for item in e_list):
+                replaced_list = get_replaced_config_list(n_list, e_list, remaining_keys, t_key_set)
+            else:
+                for n_item in n_list:
+                    for e_item in e_list:
+                        if (isinstance(n_item, dict) and isinstance(e_item, dict)):
+                            if t_keys:
+                                replaced_dict = get_replaced_config_dict(n_item, e_item,
+                                                                         remaining_keys, t_key_set)
+                            else:
+                                dict_no_key_item = True
+                                break
+
+                            if replaced_dict:
+                                replaced_list.append(replaced_dict)
+                                break
                         else:
-                            dict_no_key_item = True
+                            not_dict_item = True
                             break
 
-                        if replaced_dict:
-                            replaced_list.append(replaced_dict)
-                            break
-                    else:
-                        not_dict_item = True
+                    if not_dict_item or dict_no_key_item:
                         break
 
-                if not_dict_item or dict_no_key_item:
-                    break
-
             if dict_no_key_item:
                 replaced_list = e_list
 
@@ -745,6 +791,60 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
     return replaced_conf
 
 
+def get_config_item_key(item, key_names):
+    """Return the tuple of the values of the test keys of a list item, or
+    None if a key is missing or empty
+    """
+    item_key = []
+    for key in key_names:
+        value = item.get(key)
+        if value in [None, [], {}]:
+            return None
+        item_key.append(value)
+    return tuple(item_key)
+
+
+def get_replaced_config_list(n_list, e_list, test_keys, key_set):
+    """Return the replaced configuration of the items of a list of dicts
+    identified by test keys
+
+    A new item is only replaced by an existing item with the same values of
+    all the test keys, so the existing items are bucketed by the tuple of
+    these values, and each new item is only compared with the items of its
+    bucket, in their order in the list. The items with a value which is not
+    hashable are compared with the new items with equal values of their keys.
+    """
+    key_names = sorted(key_set)
+    e_items = {}
+    unhashable_e_items = []
+    for e_item in e_list:
+        item_key = get_config_item_key(e_item, key_names)
+        if item_key is None:
+            continue
+        try:
+            e_items.setdefault(item_key, []).append(e_item)
+        except TypeError:
+            unhashable_e_items.append((item_key, e_item))
+
+    replaced_list = []
+    for n_item in n_list:
+        item_key = get_config_item_key(n_item, key_names)
+        if item_key is None:
+            continue
+        try:
+            candidates = e_items.get(item_key, [])
+        except TypeError:
+            candidates = [e_item for e_key, e_item in unhashable_e_items if e_key == item_key]
+
+        for e_item in candidates:
+            replaced_dict = get_replaced_config_dict(n_item, e_item, test_keys, key_set)
+            if replaced_dict:
+                replaced_list.append(replaced_dict)
+                break
+
+    return replaced_list
+
+
 def check_required(module, required_parameters, parameters, options_context=None):
     '''This utility is a wrapper for the Ansible "check_required_arguments"
     function. The "required_parameters" input list provides a list of
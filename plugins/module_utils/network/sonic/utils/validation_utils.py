@@ -0,0 +1,222 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Validation of the facts of the network resources against their argument specs
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+from copy import deepcopy
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible.module_utils.common.validation import (
+    check_mutually_exclusive,
+    check_required_by,
+    check_required_one_of,
+    check_required_together
+)
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+
+SKIP_FACTS_VALIDATION_ENV_VAR = 'ANSIBLE_SONIC_SKIP_FACTS_VALIDATION'
+
+# Keys of an option spec handled by the compiled validation. A spec using
+# other keys (aliases, fallback, deprecations...) is validated by AnsibleModule.
+COMPILED_SPEC_KEYS = frozenset((
+    'type', 'elements', 'options', 'default', 'required', 'choices', 'no_log',
+    'mutually_exclusive', 'required_together', 'required_one_of', 'required_by'
+))
+# Checks of the options of a sub spec run after their types are validated,
+# in the order of AnsibleModule
+DEPENDENCY_CHECKS = (
+    ('required_together', check_required_together),
+    ('required_one_of', check_required_one_of),
+    ('required_by', check_required_by),
+)
+
+_compiled_specs = {}
+
+
+class ValidationFallback(Exception):
+    """Raised when parameters must be validated by AnsibleModule, which
+    reports their errors
+    """
+
+
+def get_type_checker(wanted):
+    if callable(wanted):
+        return wanted
+    return DEFAULT_TYPE_VALIDATORS[wanted or 'str']
+
+
+class CompiledOption(object):
+    """Option of an argument spec, with its type checkers and sub spec"""
+
+    def __init__(self, name, spec):
+        if not COMPILED_SPEC_KEYS.issuperset(spec):
+            raise ValueError('Option %s cannot be compiled' % name)
+        self.name = name
+        self.required = spec.get('required', False)
+        self.default = spec.get('default')
+        wanted = spec.get('type')
+        self.type_checker = get_type_checker(wanted)
+        elements = spec.get('elements')
+        self.elements_checker = get_type_checker(elements) if elements else None
+        choices = spec.get('choices')
+        self.choices = list(choices) if choices is not None else None
+        self.is_list = wanted == 'list'
+        self.sub_spec = None
+        if spec.get('options') is not None and (wanted == 'dict' or (wanted == 'list' and elements == 'dict')):
+            self.sub_spec = CompiledSpec(spec['options'], spec)
+        # Values which are not rebuilt by the validation are copied
+        self.copy_value = self.sub_spec is None and self.elements_checker is None and wanted in ('list', 'dict', 'raw')
+
+
+class CompiledSpec(object):
+    """Argument spec compiled once for the validation of parameters
+
+    The parameters of every level of the spec are validated in one pass and
+    in the order of AnsibleModule: unsupported parameters, mutually exclusive
+    options, defaults, required options, types, choices, other dependencies
+    between the options, then their sub options.
+
+    :param parent_spec: spec of the option with this spec as sub options,
+                        with the dependencies between the sub options
+    """
+
+    def __init__(self, argument_spec, parent_spec=None):
+        self.options = [CompiledOption(name, spec) for name, spec in argument_spec.items()]
+        self.names = frozenset(argument_spec)
+        parent_spec = parent_spec or {}
+        self.mutually_exclusive = parent_spec.get('mutually_exclusive')
+        self.checks = [(check, parent_spec[key]) for key, check in DEPENDENCY_CHECKS if parent_spec.get(key)]
+
+    def validate(self, parameters, strict=True):
+        """Return the validated parameters of this level of the spec
+
+        :param strict: False to only set the defaults and convert the types
+                       of the parameters, keeping the values which cannot be
+                       converted, without any other check
+        :raises ValidationFallback: if strict and the parameters are not valid
+        """
+        if strict:
+            if not self.names.issuperset(parameters):
+                raise ValidationFallback()
+            if self.mutually_exclusive:
+                try:
+                    check_mutually_exclusive(self.mutually_exclusive, parameters)
+                except TypeError:
+                    raise ValidationFallback()
+
+        result = dict(parameters)
+        missing = []
+        for option in self.options:
+            name = option.name
+            if name not in result:
+                if option.default is None:
+                    if option.required and strict:
+                        raise ValidationFallback()
+                    missing.append(name)
+                    continue
+                result[name] = deepcopy(option.default)
+
+            value = result[name]
+            if value is None and not option.required and option.default is None:
+                continue
+            try:
+                value = option.type_checker(value)
+                if option.elements_checker:
+                    if not isinstance(value, list):
+                        raise TypeError('Elements of %s are not in a list' % name)
+                    value = [option.elements_checker(element) for element in value]
+                elif option.copy_value:
+                    value = deepcopy(value)
+            except (TypeError, ValueError):
+                if strict:
+                    raise ValidationFallback()
+                continue
+            if strict and option.choices is not None:
+                values = value if isinstance(value, list) else [value]
+                if any(item not in option.choices for item in values):
+                    raise ValidationFallback()
+            result[name] = value
+
+        if strict:
+            for check, terms in self.checks:
+                try:
+                    check(terms, result)
+                except TypeError:
+                    raise ValidationFallback()
+
+        for name in missing:
+            result[name] = None
+
+        for option in self.options:
+            value = result[option.name]
+            if option.sub_spec is None or value is None:
+                continue
+            if option.is_list and isinstance(value, list):
+                result[option.name] = [self._validate_sub_parameters(option, element, strict) for element in value]
+            else:
+                result[option.name] = self._validate_sub_parameters(option, value, strict)
+        return result
+
+    @staticmethod
+    def _validate_sub_parameters(option, parameters, strict):
+        if not isinstance(parameters, dict):
+            if strict:
+                raise ValidationFallback()
+            return parameters
+        return option.sub_spec.validate(parameters, strict)
+
+
+def get_compiled_spec(argument_spec):
+    """Return the compiled argument spec, compiled on first use, or None
+    if the argument spec cannot be compiled
+    """
+    key = id(argument_spec)
+    entry = _compiled_specs.get(key)
+    if entry is None or entry[0] is not argument_spec:
+        try:
+            compiled_spec = CompiledSpec(argument_spec)
+        except ValueError:
+            compiled_spec = None
+        entry = (argument_spec, compiled_spec)
+        _compiled_specs[key] = entry
+    return entry[1]
+
+
+def is_facts_validation_skipped():
+    """Return True if the ANSIBLE_SONIC_SKIP_FACTS_VALIDATION environment
+    variable is true
+    """
+    return boolean(os.environ.get(SKIP_FACTS_VALIDATION_ENV_VAR) or False, strict=False)
+
+
+def validate_config(spec, data):
+    """Validate the facts of a resource against the argument spec of its
+    module, returning the same parameters as the 'validate_config' function
+    of ansible.netcommon
+
+    The argument spec is compiled on first use. Invalid data is validated
+    again by AnsibleModule, which reports the errors. When the
+    ANSIBLE_SONIC_SKIP_FACTS_VALIDATION environment variable is true, the
+    data produced by the device is trusted: only the defaults are set and
+    the types converted.
+
+    :param spec: argument spec of the module of the resource
+    :param data: facts of the resource, in a dict with a 'config' key
+    """
+    compiled_spec = get_compiled_spec(spec)
+    if compiled_spec is not None:
+        try:
+            return compiled_spec.validate(data, not is_facts_validation_skipped())
+        except ValidationFallback:
+            pass
+    return utils.validate_config(spec, data)
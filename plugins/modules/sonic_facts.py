@@ -137,6 +137,72 @@ options:
       - ssh_server
       - ecmp_load_share
       - fbs_interfaces
+  max_workers:
+    description:
+      - Maximum number of network resources whose facts are collected concurrently.
+      - The GET requests made concurrently for different resources are sent to the
+        device together. Set the C(ansible_httpapi_sonic_concurrent_requests) variable
+        of the httpapi connection to a value greater than 1 to send them concurrently.
+      - The facts are returned in the same order as when collected one resource at a time.
+    type: int
+    default: 1
+    version_added: 4.2.0
+  cache_dir:
+    description:
+      - Directory of the facts cache files, one gzip compressed JSON file per device,
+        named after the user, host and port of the connection.
+      - When specified, the network resource facts of a device are saved to its
+        cache file, and the facts of a resource saved less than I(cache_ttl) seconds
+        ago are returned without being collected from the device.
+      - The resource modules use the facts cache when the C(ANSIBLE_SONIC_FACTS_CACHE_DIR)
+        environment variable is set to the directory of the cache files. As they
+        compare the cached facts with the requested configuration, they compute the
+        fingerprints of the configuration of their resources as with I(fingerprint),
+        and only use cached facts saved with the same fingerprint and less than
+        I(cache_ttl) seconds ago.
+      - Any configuration change made by a module of the collection removes the
+        cache file of the device. Changes made by other means are not detected
+        before the cached facts expire.
+      - The cache files are readable by their owner only, as the facts can contain
+        sensitive configuration such as password hashes.
+      - When not specified, the C(ANSIBLE_SONIC_FACTS_CACHE_DIR) environment variable
+        is used, and the facts cache is disabled if it is not set.
+    type: path
+    version_added: 4.2.0
+  cache_ttl:
+    description:
+      - Number of seconds during which the cached facts of a resource are returned
+        instead of being collected from the device.
+      - With C(0), the facts are always collected from the device, and saved to the cache.
+      - When not specified, the C(ANSIBLE_SONIC_FACTS_CACHE_TTL) environment variable
+        is used, or 300 seconds if it is not set.
+    type: int
+    version_added: 4.2.0
+  fingerprint:
+    description:
+      - Return the fingerprints of the configuration of the network resources in
+        C(ansible_net_config_fingerprint), with the SHA-256 digest of the configuration
+        of each resource in C(resources) and of all of them in C(overall).
+      - The fingerprints are computed from the configuration containers read by the
+        facts of the resources, each requested once with only its configuration data.
+        A fingerprint changes whenever the configuration of its resource changes,
+        and can change with the configuration of another resource sharing a container.
+      - As each container is read whole, a fingerprint costs about as much as the
+        largest GET request of the facts of its resource. The fingerprints save the
+        other requests and the parsing of the facts of the resources, and a shared
+        container is read once for all its resources.
+      - The fingerprint of a resource is C(null), and its facts are always collected,
+        when the device rejects the RESTCONF query parameters for one of its containers,
+        as the configuration can then not be read without the changing state data.
+        C(overall) is then also C(null).
+      - Without I(cache_dir), only the fingerprints are returned and the network
+        resource facts are not collected.
+      - With I(cache_dir), the cached facts of a resource are returned if its fingerprint
+        is unchanged and they were saved less than I(cache_ttl) seconds ago, and the facts
+        of the other resources are collected from the device and saved with their fingerprint.
+    type: bool
+    default: false
+    version_added: 4.2.0
 """
 
 EXAMPLES = """
@@ -164,6 +230,31 @@ EXAMPLES = """
   dellemc.enterprise_sonic.sonic_facts:
     gather_subset: min
     gather_network_resources: lag_interfaces
+- name: Collect all network resource facts, 8 resources at a time
+  dellemc.enterprise_sonic.sonic_facts:
+    gather_subset: min
+    gather_network_resources: all
+    max_workers: 8
+  vars:
+    ansible_httpapi_sonic_concurrent_requests: 8
+- name: Collect the VLAN facts, from the facts cache if collected in the last hour
+  dellemc.enterprise_sonic.sonic_facts:
+    gather_subset: min
+    gather_network_resources: vlans
+    cache_dir: "~/.cache/sonic_facts"
+    cache_ttl: 3600
+- name: Get the fingerprints of the configuration of all network resources
+  dellemc.enterprise_sonic.sonic_facts:
+    gather_subset: min
+    gather_network_resources: all
+    fingerprint: true
+- name: Collect the facts of the network resources whose configuration changed since they were cached, in the last day
+  dellemc.enterprise_sonic.sonic_facts:
+    gather_subset: min
+    gather_network_resources: all
+    fingerprint: true
+    cache_dir: "~/.cache/sonic_facts"
+    cache_ttl: 86400
 """
 
 RETURN = """
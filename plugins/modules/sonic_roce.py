@@ -98,6 +98,13 @@ commands:
   returned: always
   type: list
   sample: ['command 1', 'command 2', 'command 3']
+reboot_downtime:
+  description:
+    - The number of seconds from sending the configuration change which triggered
+      a reboot until the device was ready again.
+  returned: when the configuration change triggered a reboot
+  type: float
+  sample: 92.4
 """
 
 
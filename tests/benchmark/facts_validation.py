@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the validation of large facts against the argument specs
+
+Validates generated facts of the vlans, interfaces and l3_acls resources
+with the 'validate_config' function of ansible.netcommon, and with the
+compiled argument specs of the collection, with and without the checks of
+ANSIBLE_SONIC_SKIP_FACTS_VALIDATION. Reports the median times and fails if
+the compiled validation returns other parameters than ansible.netcommon.
+
+Example:
+    python facts_validation.py --entries 5000 --runs 5
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.interfaces.interfaces import InterfacesArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vlans.vlans import VlansArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    SKIP_FACTS_VALIDATION_ENV_VAR,
+    validate_config
+)
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    # AnsibleModule needs no module arguments context before ansible-core 2.19
+    @contextmanager
+    def patch_module_args(args):
+        yield
+
+
+def get_vlans(entries):
+    return [{'vlan_id': idx + 1, 'description': 'VLAN %d' % (idx + 1), 'autostate': bool(idx % 2)} for idx in range(entries)]
+
+
+def get_interfaces(entries):
+    return [{'name': 'Ethernet%d' % idx, 'description': 'Port %d' % idx, 'mtu': 9100, 'enabled': True,
+             'speed': 'SPEED_25GB', 'auto_negotiate': False, 'fec': 'FEC_AUTO'} for idx in range(entries)]
+
+
+def get_l3_acls(entries):
+    rules = [{'sequence_num': idx + 1, 'action': 'permit', 'protocol': {'name': 'tcp'},
+              'source': {'host': '10.0.%d.%d' % (idx // 250, idx % 250 + 1)}, 'destination': {'any': True}} for idx in range(entries)]
+    return [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': rules}]}]
+
+
+RESOURCES = (
+    ('vlans', VlansArgs.argument_spec, get_vlans),
+    ('interfaces', InterfacesArgs.argument_spec, get_interfaces),
+    ('l3_acls', L3_aclsArgs.argument_spec, get_l3_acls),
+)
+
+
+def measure(function, runs):
+    """Return the median time of runs of a function and its last result"""
+    times = []
+    for dummy in range(runs):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2], result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the validation of large facts against the argument specs")
+    parser.add_argument('--entries', type=int, default=1000, help='number of list entries of the facts of each resource')
+    parser.add_argument('--runs', type=int, default=5, help='number of validations of the facts of each resource')
+    args = parser.parse_args()
+
+    failed = False
+    print('%-12s %10s %10s %10s' % ('resource', 'netcommon', 'compiled', 'skip'))
+    with patch_module_args({}):
+        for name, spec, get_config in RESOURCES:
+            data = {'config': get_config(args.entries)}
+            os.environ.pop(SKIP_FACTS_VALIDATION_ENV_VAR, None)
+            netcommon_time, expected = measure(lambda: utils.validate_config(spec, data), args.runs)
+            compiled_time, compiled = measure(lambda: validate_config(spec, data), args.runs)
+            os.environ[SKIP_FACTS_VALIDATION_ENV_VAR] = 'true'
+            skip_time, skipped = measure(lambda: validate_config(spec, data), args.runs)
+            os.environ.pop(SKIP_FACTS_VALIDATION_ENV_VAR)
+            print('%-12s %10.3f %10.3f %10.3f' % (name, netcommon_time, compiled_time, skip_time))
+            if compiled != expected or skipped != expected:
+                print('DIFFERENT PARAMETERS %s' % name)
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the formatted diff of large configurations
+
+Formats with 'get_formatted_config_diff', as with --diff, the diff of the
+configurations of the cases of generated_config.py before and after their
+commands, in the text and structural modes, and reports the median times,
+the peak memory allocated and the number of lines of the diffs. Fails if
+one mode finds changes and the other does not. With --max-time, also fails
+if a structural diff exceeds a limit. With --mode, only formats the diffs
+in the given mode, as the text diffs of large configurations take minutes.
+
+Example:
+    python formatted_diff.py --entries 2000 --runs 3 --max-lines 1000
+    python formatted_diff.py --entries 50000 --mode structural
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import sys
+from functools import partial
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
+    get_formatted_config_diff,
+    get_new_config,
+)
+from generated_config import CASES, measure, measure_peak_memory
+
+MODES = ('text', 'structural')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the formatted diff of large configurations")
+    parser.add_argument('--entries', type=int, default=2000, help='number of entries of the configuration of each resource')
+    parser.add_argument('--runs', type=int, default=3, help='number of diffs of each configuration')
+    parser.add_argument('--max-lines', type=int, help='maximum number of lines of the diffs')
+    parser.add_argument('--max-time', type=float, help='maximum median time of a structural diff, in seconds')
+    parser.add_argument('--mode', choices=MODES, action='append', help='mode of the diffs, all modes by default')
+    args = parser.parse_args()
+
+    failed = False
+    print('%-12s %-11s %10s %10s %9s' % ('case', 'mode', 'time', 'peak MiB', 'lines'))
+    for name, get_config, test_keys in CASES:
+        have, commands = get_config(args.entries)
+        new_config = get_new_config(commands, have, test_keys)
+        changed = {}
+        for mode in args.mode or MODES:
+            format_diff = partial(get_formatted_config_diff, have, new_config, 3, test_keys, mode, args.max_lines)
+            diff_time, diff = measure(format_diff, args.runs)
+            peak = measure_peak_memory(format_diff)
+            print('%-12s %-11s %10.3f %10.1f %9d' % (name, mode, diff_time, peak / (1024.0 * 1024.0), len(diff)))
+            changed[mode] = bool(diff)
+            if mode == 'structural' and args.max_time is not None and diff_time > args.max_time:
+                print('LIMIT EXCEEDED %s' % name)
+                failed = True
+        if len(set(changed.values())) > 1:
+            print('MISMATCH %s' % name)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
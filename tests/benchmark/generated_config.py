@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the generation of the configuration after large changes
+
+Derives with 'get_new_config', as in check mode, the configuration of
+route maps, ACL rules and interfaces with --entries entries after merged
+and deleted commands changing one in ten of them, with the test keys of
+their resource modules. Reports the median times and the peak memory
+allocated, and fails if the existing configuration or the commands are
+changed. With --max-time, also fails if a generation exceeds a limit.
+With --threads, also derives the configurations of all the resources
+concurrently in worker threads, and fails if they differ from the
+configurations derived one after the other.
+
+Example:
+    python generated_config.py --entries 10000 --runs 3 --threads 4
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.interfaces.interfaces import (
+    TEST_KEYS_formatted_diff as INTERFACES_TEST_KEYS
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.l3_acls.l3_acls import (
+    TEST_KEYS_formatted_diff as L3_ACLS_TEST_KEYS
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.route_maps.route_maps import (
+    TEST_KEYS_generate_config as ROUTE_MAPS_TEST_KEYS
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import get_new_config
+
+
+def get_route_maps(entries):
+    have = [{'map_name': 'rm%d' % (idx // 10), 'sequence_num': (idx % 10 + 1) * 10, 'action': 'permit',
+             'match': {'as_path': 'aspath%d' % idx, 'ip': {'address': 'pfx%d' % idx}, 'tag': idx},
+             'set': {'metric': {'value': idx}, 'community': {'community_number': ['%d:%d' % (idx, idx)]}, 'local_preference': 100}}
+            for idx in range(entries)]
+    commands = []
+    for entry in have[::10]:
+        commands.append({'map_name': entry['map_name'], 'sequence_num': entry['sequence_num'],
+                         'set': {'local_preference': 200}, 'state': 'merged'})
+    for entry in have[5::10]:
+        commands.append({'map_name': entry['map_name'], 'sequence_num': entry['sequence_num'],
+                         'match': {'tag': entry['match']['tag']}, 'state': 'deleted'})
+    return have, commands
+
+
+def get_l3_acls(entries):
+    rules = [{'sequence_num': idx + 1, 'action': 'permit', 'protocol': {'name': 'tcp'},
+              'source': {'host': '10.0.%d.%d' % (idx // 250, idx % 250 + 1)}, 'destination': {'any': True}}
+             for idx in range(entries)]
+    have = [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'remark': 'fabric', 'rules': rules}]}]
+    merged_rules = [dict(rule, action='deny') for rule in rules[::10]]
+    deleted_rules = [{'sequence_num': rule['sequence_num']} for rule in rules[5::10]]
+    commands = [
+        {'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': merged_rules}], 'state': 'merged'},
+        {'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': deleted_rules}], 'state': 'deleted'}
+    ]
+    return have, commands
+
+
+def get_interfaces(entries):
+    have = [{'name': 'Ethernet%d' % idx, 'description': 'Port %d' % idx, 'mtu': 9100, 'enabled': True,
+             'auto_negotiate': False, 'fec': 'FEC_AUTO', 'advertised_speed': None} for idx in range(entries)]
+    commands = []
+    for entry in have[::10]:
+        commands.append({'name': entry['name'], 'description': 'Uplink', 'state': 'merged'})
+    for entry in have[5::10]:
+        commands.append({'name': entry['name'], 'mtu': 9100, 'state': 'deleted'})
+    return have, commands
+
+
+# (name, configuration and commands generator, test keys)
+CASES = (
+    ('route_maps', get_route_maps, ROUTE_MAPS_TEST_KEYS),
+    ('l3_acls', get_l3_acls, L3_ACLS_TEST_KEYS),
+    ('interfaces', get_interfaces, INTERFACES_TEST_KEYS),
+)
+
+
+def measure(function, runs):
+    """Return the median time of runs of a function and its last result"""
+    times = []
+    for dummy in range(runs):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2], result
+
+
+def measure_peak_memory(function):
+    """Return the peak memory allocated by a function, in bytes"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the generation of the configuration after large changes")
+    parser.add_argument('--entries', type=int, default=10000, help='number of entries of the configuration of each resource')
+    parser.add_argument('--runs', type=int, default=3, help='number of generations of each configuration')
+    parser.add_argument('--max-time', type=float, help='maximum median time of a generation, in seconds')
+    parser.add_argument('--threads', type=int, help='number of worker threads deriving the configurations concurrently')
+    args = parser.parse_args()
+
+    failed = False
+    runs = []
+    print('%-12s %10s %10s %9s' % ('case', 'time', 'peak MiB', 'commands'))
+    for name, get_config, test_keys in CASES:
+        have, commands = get_config(args.entries)
+        expected = deepcopy((have, commands))
+        generate = partial(get_new_config, commands, have, test_keys)
+        generate_time, new_config = measure(generate, args.runs)
+        runs.append((name, generate, new_config))
+        peak = measure_peak_memory(generate)
+        print('%-12s %10.3f %10.1f %9d' % (name, generate_time, peak / (1024.0 * 1024.0), len(commands)))
+        if (have, commands) != expected:
+            print('CHANGED INPUTS %s' % name)
+            failed = True
+        if args.max_time is not None and generate_time > args.max_time:
+            print('LIMIT EXCEEDED %s' % name)
+            failed = True
+
+    if args.threads:
+        def generate_run(idx):
+            return runs[idx % len(runs)][1]()
+
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(generate_run, range(args.threads * len(runs))))
+            concurrent_time = time.perf_counter() - start
+        print('%d concurrent generations in %.3f s' % (len(results), concurrent_time))
+        for idx, result in enumerate(results):
+            name, dummy, new_config = runs[idx % len(runs)]
+            if result != new_config:
+                print('CONCURRENT MISMATCH %s' % name)
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the startup cost of importing modules of the collection
+
+Imports each module in a new Python interpreter and reports the median
+import time, the time spent importing the collection's own code, as
+reported by 'python -X importtime', and the number of the collection's
+Python modules imported. With --max-time or --max-modules, fails if a
+module exceeds a limit.
+
+Example:
+    python import_time.py sonic_vlans sonic_facts --runs 10
+    python import_time.py sonic_vlans --max-modules 40
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import os
+import subprocess
+import sys
+
+COLLECTION_PACKAGE = 'ansible_collections.dellemc.enterprise_sonic'
+IMPORT_CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(len([name for name in sys.modules if name.startswith('{package}.')]))
+"""
+
+
+def measure_import(module, env):
+    """Import a module in a new interpreter
+
+    :rtype: tuple
+    :returns: the total import time and the import time of the collection's
+              code in seconds, and the number of the collection's modules imported
+    """
+    code = IMPORT_CODE.format(module=module, package=COLLECTION_PACKAGE)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    total, count = process.stdout.split()
+    own_time = 0
+    for line in process.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip().startswith(COLLECTION_PACKAGE):
+            own_time += int(fields[0].split(':')[1])
+    return float(total), own_time / 1000000.0, int(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup cost of importing modules of the collection")
+    parser.add_argument('modules', nargs='*', default=['sonic_vlans'],
+                        help="module names, e.g. 'sonic_vlans', or dotted Python module paths")
+    parser.add_argument('--runs', type=int, default=5, help='number of imports of each module')
+    parser.add_argument('--max-time', type=float, help='maximum median import time of the collection code, in seconds')
+    parser.add_argument('--max-modules', type=int, help="maximum number of the collection's Python modules imported")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    failed = False
+    print('%-24s %10s %10s %8s' % ('module', 'total', 'collection', 'modules'))
+    for module in args.modules:
+        name = module if '.' in module else '%s.plugins.modules.%s' % (COLLECTION_PACKAGE, module)
+        # The first import compiles the bytecode, do not count it
+        measure_import(name, dict(os.environ))
+        results = sorted(measure_import(name, env) for dummy in range(args.runs))
+        total = sorted(result[0] for result in results)[len(results) // 2]
+        own_time = sorted(result[1] for result in results)[len(results) // 2]
+        count = results[0][2]
+        print('%-24s %10.3f %10.3f %8d' % (module, total, own_time, count))
+        if (args.max_time is not None and own_time > args.max_time) or (args.max_modules is not None and count > args.max_modules):
+            print('LIMIT EXCEEDED %s' % module)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the diff of large lists of configuration
+
+Computes with 'get_diff' the difference between generated configurations
+of static routes, ACL rules and VLAN members, with lists of --entries
+entries matched by their test keys, and reports the median times. With
+--max-time, fails if a diff exceeds a limit.
+
+Example:
+    python list_diff.py --entries 10000 --runs 3
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import sys
+import time
+from copy import deepcopy
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import get_diff
+
+
+def get_static_routes(entries, changed=False):
+    prefixes = [{'prefix': '10.%d.%d.0/24' % (idx // 256, idx % 256),
+                 'next_hops': [{'index': {'interface': 'Ethernet%d' % (idx % 64), 'next_hop': '192.168.%d.1' % (idx % 64)},
+                                'metric': 2 if changed and idx % 10 == 0 else 1}]} for idx in range(entries)]
+    return [{'vrf_name': 'default', 'static_list': prefixes}]
+
+
+def get_acl_rules(entries, changed=False):
+    rules = [{'sequence_num': idx + 1, 'action': 'deny' if changed and idx % 10 == 0 else 'permit',
+              'protocol': {'name': 'tcp'}, 'source': {'host': '10.0.%d.%d' % (idx // 250, idx % 250 + 1)},
+              'destination': {'any': True}} for idx in range(entries)]
+    return [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': rules}]}]
+
+
+def get_vlan_members(entries, changed=False):
+    return [{'name': 'Ethernet%d' % idx, 'trunk': {'allowed_vlans': [{'vlan': (idx % 4000) + 1 + (1 if changed and idx % 10 == 0 else 0)}]}}
+            for idx in range(entries)]
+
+
+# (name, configuration generator, test keys)
+CASES = (
+    ('static_routes', get_static_routes, [{'config': {'vrf_name': ''}}, {'static_list': {'prefix': ''}}, {'next_hops': {'index': ''}}]),
+    ('acl_rules', get_acl_rules, [{'config': {'address_family': ''}}, {'acls': {'name': ''}}, {'rules': {'sequence_num': ''}}]),
+    ('vlan_members', get_vlan_members, [{'config': {'name': ''}}, {'allowed_vlans': {'vlan': ''}}]),
+)
+
+
+def measure(function, runs):
+    """Return the median time of runs of a function and its last result"""
+    times = []
+    for dummy in range(runs):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2], result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the diff of large lists of configuration")
+    parser.add_argument('--entries', type=int, default=10000, help='number of entries of the diffed lists')
+    parser.add_argument('--runs', type=int, default=3, help='number of diffs of each configuration')
+    parser.add_argument('--max-time', type=float, help='maximum median time of a diff, in seconds')
+    args = parser.parse_args()
+
+    failed = False
+    print('%-16s %10s %8s' % ('case', 'time', 'changed'))
+    for name, get_config, test_keys in CASES:
+        want = get_config(args.entries, changed=True)
+        have = get_config(args.entries)
+        diff_time, diff = measure(lambda: get_diff(want, have, deepcopy(test_keys)), args.runs)
+        changed = sum(len(entry.get('static_list') or entry.get('acls', [{}])[0].get('rules') or [entry]) for entry in diff)
+        print('%-16s %10.3f %8d' % (name, diff_time, changed))
+        if args.max_time is not None and diff_time > args.max_time:
+            print('LIMIT EXCEEDED %s' % name)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the replaced configuration of large lists of configuration
+
+Computes with 'get_replaced_config', as the replaced and overridden states
+do, the existing configuration replaced by generated configurations of
+static routes, ACL rules and VLAN members, with lists of --entries entries
+in reverse order and one in ten of them changed, and reports the median
+times and the number of replaced entries. With --max-time, fails if a
+computation exceeds a limit.
+
+Example:
+    python replaced_config.py --entries 10000 --runs 3
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import sys
+from functools import partial
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import get_replaced_config
+from list_diff import get_acl_rules, get_static_routes, get_vlan_members, measure
+
+
+def get_reversed_static_routes(entries, changed=False):
+    config = get_static_routes(entries, changed)
+    config[0]['static_list'].reverse()
+    return config
+
+
+def get_reversed_acl_rules(entries, changed=False):
+    config = get_acl_rules(entries, changed)
+    config[0]['acls'][0]['rules'].reverse()
+    return config
+
+
+def get_reversed_vlan_members(entries, changed=False):
+    return list(reversed(get_vlan_members(entries, changed)))
+
+
+# (name, configuration generator, test keys)
+CASES = (
+    ('static_routes', get_reversed_static_routes,
+     [{'config': {'vrf_name': ''}}, {'static_list': {'prefix': ''}}, {'next_hops': {'index': ''}}]),
+    ('acl_rules', get_reversed_acl_rules,
+     [{'config': {'address_family': ''}}, {'acls': {'name': ''}}, {'rules': {'sequence_num': ''}}]),
+    ('vlan_members', get_reversed_vlan_members,
+     [{'config': {'name': ''}}, {'allowed_vlans': {'vlan': ''}}]),
+)
+
+
+def count_replaced(replaced):
+    """Return the number of replaced entries of the lists of a case"""
+    return sum(len(entry.get('static_list') or entry.get('acls', [{}])[0].get('rules') or [entry]) for entry in replaced)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the replaced configuration of large lists of configuration")
+    parser.add_argument('--entries', type=int, default=10000, help='number of entries of the lists')
+    parser.add_argument('--runs', type=int, default=3, help='number of computations of each configuration')
+    parser.add_argument('--max-time', type=float, help='maximum median time of a computation, in seconds')
+    args = parser.parse_args()
+
+    failed = False
+    print('%-16s %10s %9s' % ('case', 'time', 'replaced'))
+    for name, get_config, test_keys in CASES:
+        want = get_config(args.entries, changed=True)
+        have = get_config(args.entries)
+        replace_time, replaced = measure(partial(get_replaced_config, want, have, test_keys), args.runs)
+        print('%-16s %10.3f %9d' % (name, replace_time, count_replaced(replaced)))
+        if args.max_time is not None and replace_time > args.max_time:
+            print('LIMIT EXCEEDED %s' % name)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,469 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Local RESTCONF emulator for benchmarking the enterprise_sonic modules
+
+Serves GET, PATCH, PUT, POST and DELETE requests under /restconf/data from
+an in-memory JSON datastore, and applies YANG Patch requests. The datastore
+is seeded from the 'existing_*' GET responses of unit test fixture files and
+from generated interface, VRF and BGP neighbor configuration of a given scale.
+
+The emulator does not validate requests against the YANG models. List entries
+are matched by the keys in LIST_KEYS, or else by their first leaves. RESTCONF
+query parameters are ignored and RPCs under /restconf/operations succeed with
+an empty output.
+
+Example:
+    python restconf_emulator.py --port 8080 --interfaces 512 --vrfs 16 --neighbors 8 \\
+        --fixture sonic_vlans.yaml
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import copy
+import glob
+import gzip
+import json
+import os
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import yaml
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'unit', 'modules', 'network', 'sonic', 'fixtures')
+YANG_PATCH_CONTENT_TYPE = 'application/yang-patch+json'
+
+# Key leaves of the lists which are not keyed by their first leaf
+LIST_KEYS = {
+    'protocol': ['identifier', 'name'],
+    'acl-set': ['name', 'type'],
+    'afi-safi': ['afi-safi-name'],
+    'neighbor': ['neighbor-address'],
+    'VRF_LIST': ['vrf_name'],
+    'PORT_LIST': ['ifname'],
+}
+
+
+class DatastoreError(Exception):
+    def __init__(self, code, message):
+        super(DatastoreError, self).__init__(message)
+        self.code = code
+
+
+def local_name(name):
+    return name.split(':')[-1]
+
+
+def parse_path(path):
+    """Split a RESTCONF data resource path into (name, keys) segments
+
+    The keys of a segment are None for a container, leaf or whole list.
+    """
+    segments = []
+    for segment in path.split('?')[0].strip('/').split('/'):
+        if not segment:
+            continue
+        name, sep, keys = segment.partition('=')
+        segments.append((name, [unquote(key) for key in keys.split(',')] if sep else None))
+    return segments
+
+
+def get_module(segments):
+    """Return the YANG module of the node addressed by the segments"""
+    for segment_name, dummy in reversed(segments):
+        if ':' in segment_name:
+            return segment_name.split(':')[0]
+    return None
+
+
+def get_qualified_name(segments):
+    """Return the name of the last segment qualified with its YANG module, as in a RESTCONF response"""
+    name = segments[-1][0]
+    module = get_module(segments)
+    if ':' in name or not module:
+        return name
+    return module + ':' + name
+
+
+def get_key_value(value):
+    """Return a key leaf value as text, without the module prefix of an identity"""
+    value = str(value)
+    if re.match(r'^[A-Za-z][\w.-]*:[^:]+$', value):
+        return local_name(value)
+    return value
+
+
+def get_key_fields(list_name, entry, count):
+    keys = LIST_KEYS.get(local_name(list_name))
+    if keys:
+        return keys
+    return [name for name, value in entry.items() if not isinstance(value, (dict, list))][:count]
+
+
+def find_child(node, name):
+    """Return the name of the child of a container matching a name, with or without module prefix"""
+    if name in node:
+        return name
+    name = local_name(name)
+    for child_name in node:
+        if local_name(child_name) == name:
+            return child_name
+    return None
+
+
+def find_entry(list_name, entries, keys):
+    for entry in entries:
+        if isinstance(entry, dict):
+            fields = get_key_fields(list_name, entry, len(keys))
+            if [get_key_value(entry.get(field)) for field in fields] == [get_key_value(key) for key in keys]:
+                return entry
+    return None
+
+
+def match_entry(list_name, entries, new_entry):
+    fields = get_key_fields(list_name, new_entry, 1)
+    if not fields:
+        return None
+    return find_entry(list_name, entries, [new_entry.get(field) for field in fields])
+
+
+def merge_dict(node, data):
+    for name, value in data.items():
+        child_name = find_child(node, name)
+        if child_name is None:
+            node[name] = copy.deepcopy(value)
+        else:
+            node[child_name] = merge_value(child_name, node[child_name], value)
+
+
+def merge_value(name, old, new):
+    if isinstance(old, dict) and isinstance(new, dict):
+        merge_dict(old, new)
+        return old
+    if isinstance(old, list) and isinstance(new, list):
+        for item in new:
+            if isinstance(item, dict):
+                entry = match_entry(name, old, item)
+                if entry is None:
+                    old.append(copy.deepcopy(item))
+                else:
+                    merge_dict(entry, item)
+            elif item not in old:
+                old.append(item)
+        return old
+    return copy.deepcopy(new)
+
+
+class Datastore(object):
+    """In-memory JSON datastore addressed by RESTCONF data resource paths"""
+
+    def __init__(self):
+        self.root = {}
+        self.lock = threading.Lock()
+
+    def _walk(self, segments, create=False):
+        """Return the (parent, key, node) of the node addressed by the segments
+
+        The parent of a list entry is the list, and its key the entry.
+        """
+        parent, key, node = None, None, self.root
+        for name, keys in segments:
+            if not isinstance(node, dict):
+                return None
+            child_name = find_child(node, name)
+            if child_name is None:
+                if not create:
+                    return None
+                child_name = name
+                node[child_name] = [] if keys is not None else {}
+            parent, key, node = node, child_name, node[child_name]
+            if keys is not None:
+                if not isinstance(node, list):
+                    return None
+                entry = find_entry(child_name, node, keys)
+                if entry is None:
+                    if not create:
+                        return None
+                    entry = dict(zip(LIST_KEYS.get(local_name(child_name), ['name']), keys))
+                    node.append(entry)
+                parent, key, node = node, entry, entry
+        return parent, key, node
+
+    def get(self, path):
+        segments = parse_path(path)
+        with self.lock:
+            if not segments:
+                return json.dumps({'ietf-restconf:data': self.root})
+            location = self._walk(segments)
+            if location is None:
+                raise DatastoreError(404, 'Resource not found')
+            node = location[2]
+            if segments[-1][1] is not None:
+                node = [node]
+            return json.dumps({get_qualified_name(segments): node})
+
+    def merge(self, path, data):
+        """Merge data into the parent of the addressed node (PATCH)"""
+        segments = parse_path(path)
+        with self.lock:
+            self._merge(segments[:-1], data)
+
+    def create(self, path, data):
+        """Merge data into the addressed node (POST)"""
+        with self.lock:
+            self._merge(parse_path(path), data)
+
+    def replace(self, path, data):
+        """Replace the addressed node with data (PUT)"""
+        segments = parse_path(path)
+        with self.lock:
+            if segments:
+                self._delete(segments)
+            self._merge(segments[:-1], data)
+
+    def delete(self, path):
+        with self.lock:
+            if not self._delete(parse_path(path)):
+                raise DatastoreError(404, 'Resource not found')
+
+    def _merge(self, segments, data):
+        location = self._walk(segments, create=True)
+        if location is None or not isinstance(location[2], dict) or not isinstance(data, dict):
+            raise DatastoreError(400, 'Invalid request data')
+        # Names are only qualified in the datastore where their module differs from the parent's
+        module = get_module(segments)
+        if module:
+            data = dict((local_name(name) if name.startswith(module + ':') else name, value) for name, value in data.items())
+        merge_dict(location[2], data)
+
+    def _delete(self, segments):
+        location = self._walk(segments) if segments else None
+        if location is None:
+            return False
+        parent, key = location[:2]
+        if isinstance(parent, list):
+            parent.remove(key)
+        else:
+            del parent[key]
+        return True
+
+    def yang_patch(self, data):
+        """Apply the 'merge' and 'remove' edits of a YANG Patch request"""
+        for edit in data.get('ietf-yang-patch:yang-patch', {}).get('edit', []):
+            if edit.get('operation') == 'remove':
+                self.delete(edit['target'])
+            else:
+                self.merge(edit['target'], edit.get('value', {}))
+
+    def load_fixture(self, file_name):
+        """Merge the successful GET responses of a unit test fixture file"""
+        if not os.path.isabs(file_name) and not os.path.exists(file_name):
+            file_name = os.path.join(FIXTURE_DIR, file_name)
+        with open(file_name) as fixture_file:
+            fixture = yaml.safe_load(fixture_file)
+        for test_case in fixture.values():
+            for name, requests in test_case.items():
+                if not (name.startswith('existing_') and isinstance(requests, list)):
+                    continue
+                for request in requests:
+                    response = request.get('response') or {}
+                    value = response.get('value')
+                    path = request.get('path', '').lstrip('/')
+                    if not path.startswith('data/') or response.get('code', 200) != 200 or not isinstance(value, dict):
+                        continue
+                    try:
+                        self.merge(path[len('data/'):], value)
+                    except DatastoreError:
+                        pass
+
+
+def generate_config(interfaces=0, vrfs=0, neighbors=0):
+    """Generate the (path, data) merges of a device configuration of a given scale
+
+    :param interfaces: number of Ethernet interfaces
+    :param vrfs: number of VRFs, in addition to the default VRF
+    :param neighbors: number of BGP neighbors in each VRF
+    """
+    merges = [('sonic-device-metadata:sonic-device-metadata', {
+        'sonic-device-metadata:sonic-device-metadata': {'DEVICE_METADATA': {'DEVICE_METADATA_LIST': [
+            {'name': 'localhost', 'hostname': 'sonic', 'intf_naming_mode': 'native'}
+        ]}}
+    })]
+
+    ports = []
+    intfs = []
+    for idx in range(interfaces):
+        name = 'Ethernet%d' % idx
+        ports.append({'ifname': name, 'admin_status': 'up', 'mtu': 9100, 'speed': 25000})
+        intfs.append({
+            'name': name,
+            'config': {'name': name, 'mtu': 9100, 'enabled': True, 'description': 'port %d' % idx},
+            'openconfig-if-ethernet:ethernet': {'config': {'port-speed': 'openconfig-if-ethernet:SPEED_25GB', 'auto-negotiate': False}}
+        })
+    merges.append(('sonic-port:sonic-port', {'sonic-port:sonic-port': {'PORT': {'PORT_LIST': ports}}}))
+    merges.append(('openconfig-interfaces:interfaces', {'openconfig-interfaces:interfaces': {'interface': intfs}}))
+
+    vrf_names = ['default'] + ['Vrf%d' % idx for idx in range(1, vrfs + 1)]
+    instances = []
+    for vrf_idx, vrf_name in enumerate(vrf_names):
+        bgp_neighbors = []
+        for idx in range(neighbors):
+            address = '10.%d.%d.%d' % (vrf_idx, idx // 250, idx % 250 + 1)
+            bgp_neighbors.append({
+                'neighbor-address': address,
+                'config': {'neighbor-address': address, 'peer-as': 65100 + idx, 'enabled': True}
+            })
+        instance = {
+            'name': vrf_name,
+            'config': {'name': vrf_name, 'type': 'openconfig-network-instance-types:L3VRF', 'enabled': True},
+            'protocols': {'protocol': [{
+                'identifier': 'openconfig-policy-types:BGP',
+                'name': 'bgp',
+                'config': {'identifier': 'openconfig-policy-types:BGP', 'name': 'bgp', 'enabled': True},
+                'bgp': {
+                    'global': {'config': {'as': 65000, 'router-id': '10.255.%d.1' % vrf_idx}},
+                    'neighbors': {'neighbor': bgp_neighbors}
+                }
+            }]}
+        }
+        if vrf_name == 'default':
+            instance['config']['type'] = 'openconfig-network-instance-types:DEFAULT_INSTANCE'
+        instances.append(instance)
+    merges.append(('sonic-vrf:sonic-vrf', {'sonic-vrf:sonic-vrf': {'VRF': {'VRF_LIST': [
+        {'vrf_name': vrf_name, 'fallback': False} for vrf_name in vrf_names
+    ]}}}))
+    merges.append(('openconfig-network-instance:network-instances',
+                   {'openconfig-network-instance:network-instances': {'network-instance': instances}}))
+    return merges
+
+
+class RestconfHandler(BaseHTTPRequestHandler):
+    """RESTCONF request handler backed by the 'datastore' of its server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        path = self.path.split('?')[0]
+        code, payload = 200, b''
+        try:
+            data = json.loads(body) if body else {}
+            if path.startswith('/restconf/operations/'):
+                code = 204 if self.command == 'POST' else 405
+            elif not (path + '/').startswith('/restconf/data/'):
+                raise DatastoreError(404, 'Resource not found')
+            else:
+                path = path[len('/restconf/data'):]
+                datastore = self.server.datastore
+                if self.command == 'GET':
+                    payload = datastore.get(path).encode('utf-8')
+                elif self.command == 'PATCH' and self.headers.get('Content-Type') == YANG_PATCH_CONTENT_TYPE:
+                    datastore.yang_patch(data)
+                    code = 204
+                elif self.command == 'PATCH':
+                    datastore.merge(path, data)
+                    code = 204
+                elif self.command == 'PUT':
+                    datastore.replace(path, data)
+                    code = 204
+                elif self.command == 'POST':
+                    datastore.create(path, data)
+                    code = 201
+                elif self.command == 'DELETE':
+                    datastore.delete(path)
+                    code = 204
+        except (DatastoreError, ValueError) as exc:
+            code = getattr(exc, 'code', 400)
+            payload = json.dumps({'ietf-restconf:errors': {'error': [
+                {'error-type': 'application', 'error-tag': 'invalid-value', 'error-message': str(exc)}
+            ]}}).encode('utf-8')
+
+        with self.server.stats_lock:
+            stats = self.server.stats.setdefault(self.command, {'requests': 0, 'bytes_in': 0, 'bytes_out': 0})
+            stats['requests'] += 1
+            stats['bytes_in'] += len(body)
+            stats['bytes_out'] += len(payload)
+
+        self.send_response(code)
+        if payload and 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            payload = gzip.compress(payload)
+            self.send_header('Content-Encoding', 'gzip')
+        if payload:
+            self.send_header('Content-Type', 'application/yang-data+json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_PATCH = do_PUT = do_POST = do_DELETE = _reply
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, *args)
+
+
+def create_server(host='127.0.0.1', port=0, fixtures=None, interfaces=0, vrfs=0, neighbors=0, latency=0, verbose=False):
+    """Create an emulator server; call its serve_forever method to start it
+
+    :param fixtures: unit test fixture file names or paths; use 'all' for all fixture files
+    :param latency: number of seconds added to every request
+    """
+    datastore = Datastore()
+    for path, data in generate_config(interfaces, vrfs, neighbors):
+        datastore.merge(path, data)
+    for fixture in fixtures or []:
+        if fixture == 'all':
+            for file_name in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.yaml'))):
+                datastore.load_fixture(file_name)
+        else:
+            datastore.load_fixture(fixture)
+
+    server = ThreadingHTTPServer((host, port), RestconfHandler)
+    server.daemon_threads = True
+    server.datastore = datastore
+    server.latency = latency
+    server.verbose = verbose
+    server.stats = {}
+    server.stats_lock = threading.Lock()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local RESTCONF emulator for benchmarking the enterprise_sonic modules')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--fixture', action='append', default=[],
+                        help="unit test fixture file to seed the datastore with, or 'all'; may be repeated")
+    parser.add_argument('--interfaces', type=int, default=32, help='number of generated Ethernet interfaces')
+    parser.add_argument('--vrfs', type=int, default=0, help='number of generated VRFs besides the default VRF')
+    parser.add_argument('--neighbors', type=int, default=0, help='number of generated BGP neighbors per VRF')
+    parser.add_argument('--latency', type=float, default=0, help='number of seconds added to every request')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.fixture, args.interfaces, args.vrfs, args.neighbors,
+                           args.latency, args.verbose)
+    print('Serving RESTCONF on http://%s:%d/restconf' % server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Run the benchmark playbook against a local RESTCONF emulator
+
+Starts the emulator with the requested scale, runs benchmark.yaml over the
+httpapi connection with ANSIBLE_SONIC_PROFILE set, and prints the wall time,
+request count and bytes of every case. With --baseline, fails if a case
+sends more requests, or more bytes beyond a tolerance, than in a previous
+report written with --output.
+
+Example:
+    python run_benchmark.py --interfaces 1024 --vrfs 8 --neighbors 32 --output report.json
+    python run_benchmark.py --interfaces 1024 --vrfs 8 --neighbors 32 --baseline report.json \\
+        -- -e ansible_httpapi_sonic_keepalive_pool_size=4
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from restconf_emulator import create_server
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+INVENTORY = """[emulator]
+sonic ansible_host=127.0.0.1 ansible_httpapi_port={port}
+
+[emulator:vars]
+ansible_connection=ansible.netcommon.httpapi
+ansible_network_os=dellemc.enterprise_sonic.sonic
+ansible_httpapi_use_ssl=false
+ansible_user=admin
+ansible_password=admin
+"""
+
+
+def get_case_summary(result):
+    """Return the wall time, request count and bytes of a case result of the playbook"""
+    requests = result.get('profile', {}).get('requests', {}).values()
+    return {
+        'wall_time': result['wall_time'],
+        'requests': sum(request['count'] - request['cached'] for request in requests),
+        'cached': sum(request['cached'] for request in requests),
+        'bytes_in': sum(request['bytes_in'] for request in requests),
+        'bytes_out': sum(request['bytes_out'] for request in requests),
+        'changed': result.get('changed', False),
+    }
+
+
+def compare_with_baseline(summary, baseline, tolerance):
+    """Return the regressions of a summary against a baseline summary"""
+    regressions = []
+    for case, values in summary.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        if values['requests'] > base['requests']:
+            regressions.append('%s: %d requests, %d in baseline' % (case, values['requests'], base['requests']))
+        for key in ('bytes_in', 'bytes_out'):
+            if values[key] > base[key] * (1 + tolerance / 100.0):
+                regressions.append('%s: %d %s, %d in baseline' % (case, values[key], key, base[key]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the enterprise_sonic modules against a local RESTCONF emulator')
+    parser.add_argument('--interfaces', type=int, default=32, help='number of generated Ethernet interfaces')
+    parser.add_argument('--vrfs', type=int, default=0, help='number of generated VRFs besides the default VRF')
+    parser.add_argument('--neighbors', type=int, default=0, help='number of generated BGP neighbors per VRF')
+    parser.add_argument('--fixture', action='append', default=[],
+                        help="unit test fixture file to seed the emulator with, or 'all'; may be repeated")
+    parser.add_argument('--latency', type=float, default=0, help='number of seconds added by the emulator to every request')
+    parser.add_argument('--case', action='append', default=[], help='benchmark case to run, all cases by default; may be repeated')
+    parser.add_argument('--output', help='file to write the summary to, as JSON')
+    parser.add_argument('--baseline', help='summary of a previous run to compare with')
+    parser.add_argument('--tolerance', type=float, default=5,
+                        help='percentage by which the bytes may exceed the baseline (default: 5)')
+    parser.add_argument('playbook_args', nargs='*', help='extra ansible-playbook arguments, after --')
+    args = parser.parse_args()
+
+    server = create_server(fixtures=args.fixture, interfaces=args.interfaces, vrfs=args.vrfs,
+                           neighbors=args.neighbors, latency=args.latency)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        inventory = os.path.join(tmp_dir, 'inventory.ini')
+        with open(inventory, 'w') as inventory_file:
+            inventory_file.write(INVENTORY.format(port=server.server_address[1]))
+        report = os.path.join(tmp_dir, 'report.json')
+        extra_vars = {
+            'benchmark_interfaces': args.interfaces,
+            'benchmark_vrfs': args.vrfs,
+            'benchmark_neighbors': args.neighbors,
+            'benchmark_report': report,
+        }
+        if args.case:
+            extra_vars['benchmark_cases'] = args.case
+        command = ['ansible-playbook', '-i', inventory, os.path.join(BENCHMARK_DIR, 'benchmark.yaml'),
+                   '-e', json.dumps(extra_vars)] + args.playbook_args
+        env = dict(os.environ, ANSIBLE_SONIC_PROFILE='true')
+        result = subprocess.call(command, env=env)
+        if result != 0:
+            return result
+
+        with open(report) as report_file:
+            summary = dict((case['case'], get_case_summary(case)) for case in json.load(report_file))
+    finally:
+        shutil.rmtree(tmp_dir)
+        server.shutdown()
+        server.server_close()
+
+    print('%-24s %10s %9s %7s %12s %12s' % ('case', 'wall time', 'requests', 'cached', 'bytes in', 'bytes out'))
+    for case, values in summary.items():
+        print('%-24s %10.3f %9d %7d %12d %12d' % (case, values['wall_time'], values['requests'], values['cached'],
+                                                  values['bytes_in'], values['bytes_out']))
+    print('emulator totals: %s' % json.dumps(server.stats, sort_keys=True))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(summary, output_file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_with_baseline(summary, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print('REGRESSION %s' % regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
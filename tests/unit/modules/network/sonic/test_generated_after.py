@@ -0,0 +1,89 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import glob
+import importlib
+import inspect
+import os
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
+    GENERATED_AFTER_ENV_VAR,
+)
+from .sonic_module import TestSonicModule
+
+# Run the tests of every resource module again with the 'after'
+# configuration generated from the commands instead of read from the device,
+# so that a generator failing after the device was changed is caught rather
+# than only reported as a warning.
+#
+# The generated configurations are also compared with the ones generated by
+# the former get_new_config, which copied the configuration at every level,
+# for the same tests. The lists of values are compared in any order, as they
+# are generated from sets, and the few tests whose configurations depended
+# on the order of sets are not compared.
+
+
+MODULE_WARN = AnsibleModule.warn
+BASELINE_CONFIGS = TestSonicModule.load_fixtures('generated_after_baseline.yaml')
+
+
+def fail_generated_config_warning(module, warning):
+    if warning.startswith('Could not generate the configuration'):
+        raise AssertionError(warning)
+    MODULE_WARN(module, warning)
+
+
+def get_comparable_config(config):
+    """Return a configuration with its lists of values sorted"""
+    if isinstance(config, dict):
+        return dict((key, get_comparable_config(value)) for key, value in config.items())
+    if isinstance(config, list):
+        items = [get_comparable_config(item) for item in config]
+        if not any(isinstance(item, (dict, list)) for item in items):
+            items.sort(key=str)
+        return items
+    return config
+
+
+def generated_after_test_case(test_case):
+    """Return a subclass of a module test case which runs its tests with
+    ANSIBLE_SONIC_GENERATED_AFTER set, and compares the generated
+    configurations with the baseline ones
+    """
+    def setUp(self):
+        environ = patch.dict(os.environ, {GENERATED_AFTER_ENV_VAR: 'true'})
+        environ.start()
+        self.addCleanup(environ.stop)
+        warn = patch.object(AnsibleModule, 'warn', autospec=True, side_effect=fail_generated_config_warning)
+        warn.start()
+        self.addCleanup(warn.stop)
+        self.baseline_configs = list(BASELINE_CONFIGS.get('%s.%s' % (test_case.__name__, self._testMethodName), []))
+        test_case.setUp(self)
+
+    def execute_module(self, failed=False, changed=False):
+        result = test_case.execute_module(self, failed=failed, changed=changed)
+        if self.baseline_configs:
+            config = result.get('after_generated', result.get('after'))
+            self.assertEqual(get_comparable_config(config), self.baseline_configs.pop(0))
+        return result
+
+    return type(test_case.__name__ + 'GeneratedAfter', (test_case,), {'setUp': setUp, 'execute_module': execute_module})
+
+
+def add_generated_after_test_cases():
+    """Add the subclasses of the test cases of the resource modules to this
+    module, leaving no other test case in it for the test runner to collect
+    """
+    for test_file in sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'test_sonic_*.py'))):
+        test_module = importlib.import_module('.' + os.path.basename(test_file)[:-3], __package__)
+        for test_case in vars(test_module).values():
+            if inspect.isclass(test_case) and issubclass(test_case, TestSonicModule) and test_case.__module__ == test_module.__name__:
+                globals()[test_case.__name__ + 'GeneratedAfter'] = generated_after_test_case(test_case)
+
+
+add_generated_after_test_cases()
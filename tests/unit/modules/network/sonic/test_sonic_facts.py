@@ -2,17 +2,27 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+import shutil
+import tempfile
+
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_cache_utils import (
+    FACTS_CACHE_DIR_ENV_VAR,
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
     sonic_facts,
+    sonic_vlans,
 )
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
 from .sonic_module import TestSonicModule
 
+CONFIG_VLANS_EDIT_CONFIG = "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.vlans.vlans.edit_config"
+
 
 class TestSonicFactsModule(TestSonicModule):
     module = sonic_facts
@@ -43,3 +53,187 @@ class TestSonicFactsModule(TestSonicModule):
     def test_sonic_facts_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
         result = self.execute_module(changed=False)
+
+
+class TestSonicFactsParallelModule(TestSonicModule):
+    module = sonic_facts
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_get_connection = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts.get_connection"
+        )
+        cls.mock_vlans_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans.edit_config"
+        )
+        cls.mock_vrfs_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs.edit_config"
+        )
+        cls.fixture_data = cls.load_fixtures('sonic_facts.yaml')
+
+    def setUp(self):
+        super(TestSonicFactsParallelModule, self).setUp()
+        self.get_connection = self.mock_get_connection.start()
+        self.vlans_edit_config = self.mock_vlans_edit_config.start()
+        self.vlans_edit_config.side_effect = self.facts_side_effect
+        self.vrfs_edit_config = self.mock_vrfs_edit_config.start()
+        self.vrfs_edit_config.side_effect = self.facts_side_effect
+
+    def tearDown(self):
+        super(TestSonicFactsParallelModule, self).tearDown()
+        self.mock_get_connection.stop()
+        self.mock_vlans_edit_config.stop()
+        self.mock_vrfs_edit_config.stop()
+
+    def test_sonic_facts_parallel_01(self):
+        test_case = self.fixture_data['parallel_01']
+        self.initialize_facts_get_requests(test_case['existing_facts_config'])
+        results = []
+        for max_workers in (1, test_case['module_args']['max_workers']):
+            set_module_args(dict(test_case['module_args'], max_workers=max_workers))
+            results.append(self.execute_module(changed=False)['ansible_facts'])
+
+        self.assertEqual(results[1]['ansible_network_resources'], test_case['expected_network_resources'])
+        self.assertEqual(results[1]['ansible_network_resources'], results[0]['ansible_network_resources'])
+        self.assertEqual(list(results[1]['ansible_network_resources']), ['vlans', 'vrfs'])
+        self.assertEqual(results[1]['ansible_net_gather_network_resources'], ['vlans', 'vrfs'])
+
+    def test_sonic_facts_parallel_failure(self):
+        test_case = self.fixture_data['parallel_01']
+        self.initialize_facts_get_requests(test_case['existing_facts_config'])
+        self.vrfs_edit_config.side_effect = ValueError('Invalid VRF data')
+        set_module_args(test_case['module_args'])
+
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'Invalid VRF data')
+
+
+class TestSonicFactsCacheModule(TestSonicModule):
+    module = sonic_facts
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_get_connection = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts.get_connection"
+        )
+        cls.mock_vlans_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans.edit_config"
+        )
+        cls.mock_vrfs_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs.edit_config"
+        )
+        cls.mock_fingerprint_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.fingerprint_utils.edit_config"
+        )
+        cls.mock_get_query_unsupported = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.fingerprint_utils.get_query_unsupported"
+        )
+        cls.fixture_data = cls.load_fixtures('sonic_facts.yaml')
+
+    def setUp(self):
+        super(TestSonicFactsCacheModule, self).setUp()
+        self.fingerprint_edit_config = self.mock_fingerprint_edit_config.start()
+        self.fingerprint_edit_config.side_effect = self.facts_side_effect
+        self.get_query_unsupported = self.mock_get_query_unsupported.start()
+        self.get_query_unsupported.return_value = []
+        self.get_connection = self.mock_get_connection.start()
+        connection_options = {'host': 'sonic1', 'port': 443, 'remote_user': 'admin'}
+        self.get_connection.return_value.get_option.side_effect = connection_options.get
+        self.vlans_edit_config = self.mock_vlans_edit_config.start()
+        self.vlans_edit_config.side_effect = self.facts_side_effect
+        self.vrfs_edit_config = self.mock_vrfs_edit_config.start()
+        self.vrfs_edit_config.side_effect = self.facts_side_effect
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestSonicFactsCacheModule, self).tearDown()
+        self.mock_get_connection.stop()
+        self.mock_vlans_edit_config.stop()
+        self.mock_vrfs_edit_config.stop()
+        self.mock_fingerprint_edit_config.stop()
+        self.mock_get_query_unsupported.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def test_sonic_facts_cache_01(self):
+        test_case = self.fixture_data['parallel_01']
+        self.initialize_facts_get_requests(test_case['existing_facts_config'])
+        module_args = dict(test_case['module_args'], max_workers=1, cache_dir=self.cache_dir)
+
+        set_module_args(dict(module_args, gather_network_resources=['vlans']))
+        self.execute_module(changed=False)
+        self.assertEqual(self.vlans_edit_config.call_count, 1)
+        self.assertEqual(os.listdir(self.cache_dir), ['admin@sonic1_443.json.gz'])
+
+        # The VLAN facts are cached, the VRF facts are collected
+        set_module_args(module_args)
+        result = self.execute_module(changed=False)['ansible_facts']
+        self.assertEqual(self.vlans_edit_config.call_count, 1)
+        self.assertEqual(self.vrfs_edit_config.call_count, 1)
+        self.assertEqual(result['ansible_network_resources'], test_case['expected_network_resources'])
+        self.assertEqual(result['ansible_net_gather_network_resources'], ['vlans', 'vrfs'])
+
+        set_module_args(dict(module_args, cache_ttl=0))
+        self.execute_module(changed=False)
+        self.assertEqual(self.vlans_edit_config.call_count, 2)
+        self.assertEqual(self.vrfs_edit_config.call_count, 2)
+
+    def test_sonic_facts_fingerprint_01(self):
+        test_case = self.fixture_data['parallel_01']
+        self.initialize_facts_get_requests(test_case['existing_facts_config'])
+        module_args = dict(test_case['module_args'], max_workers=1, fingerprint=True)
+
+        # Without the facts cache, only the fingerprints are returned
+        set_module_args(module_args)
+        result = self.execute_module(changed=False)['ansible_facts']
+        fingerprint = result['ansible_net_config_fingerprint']
+        self.assertEqual(sorted(fingerprint['resources']), ['vlans', 'vrfs'])
+        self.assertEqual(result['ansible_network_resources'], {})
+        self.assertEqual(self.vlans_edit_config.call_count + self.vrfs_edit_config.call_count, 0)
+
+        # With the facts cache, the facts are collected once while the fingerprints are unchanged
+        set_module_args(dict(module_args, cache_dir=self.cache_dir, cache_ttl=3600))
+        for dummy in range(2):
+            result = self.execute_module(changed=False)['ansible_facts']
+            self.assertEqual(result['ansible_network_resources'], test_case['expected_network_resources'])
+            self.assertEqual(result['ansible_net_config_fingerprint'], fingerprint)
+        self.assertEqual(self.vlans_edit_config.call_count, 1)
+        self.assertEqual(self.vrfs_edit_config.call_count, 1)
+
+        self._facts_requests_dict['data/sonic-vlan:sonic-vlan']['value']['sonic-vlan:sonic-vlan']['VLAN']['VLAN_LIST'][0]['description'] = 'Descr2'
+        result = self.execute_module(changed=False)['ansible_facts']
+        self.assertEqual(result['ansible_network_resources']['vlans'][0]['description'], 'Descr2')
+        self.assertEqual(self.vlans_edit_config.call_count, 2)
+        self.assertEqual(self.vrfs_edit_config.call_count, 1)
+
+        # Cached facts are not returned past the TTL, even with an unchanged fingerprint
+        set_module_args(dict(module_args, cache_dir=self.cache_dir, cache_ttl=0))
+        self.execute_module(changed=False)
+        self.assertEqual(self.vlans_edit_config.call_count, 3)
+        self.assertEqual(self.vrfs_edit_config.call_count, 2)
+
+        # Without query parameters, the VLAN configuration has no fingerprint and its facts are collected
+        self.get_query_unsupported.return_value = ['sonic-vlan']
+        set_module_args(dict(module_args, cache_dir=self.cache_dir, cache_ttl=3600))
+        for dummy in range(2):
+            result = self.execute_module(changed=False)['ansible_facts']
+            self.assertIsNone(result['ansible_net_config_fingerprint']['resources']['vlans'])
+        self.assertEqual(self.vlans_edit_config.call_count, 5)
+        self.assertEqual(self.vrfs_edit_config.call_count, 2)
+
+    def test_sonic_facts_cache_resource_module(self):
+        test_case = self.fixture_data['parallel_01']
+        self.initialize_facts_get_requests(test_case['existing_facts_config'])
+        set_module_args(dict(test_case['module_args'], max_workers=1, cache_dir=self.cache_dir))
+        self.execute_module(changed=False)
+        self.assertEqual(self.vlans_edit_config.call_count, 1)
+
+        # A resource module only uses the cached facts saved with the fingerprint computed in its run
+        self.module = sonic_vlans
+        set_module_args({'config': [{'vlan_id': 10, 'autostate': False, 'description': 'Descr1'}], 'state': 'merged'})
+        with patch.dict(os.environ, {FACTS_CACHE_DIR_ENV_VAR: self.cache_dir}), patch(CONFIG_VLANS_EDIT_CONFIG) as config_edit_config:
+            for dummy in range(2):
+                result = self.execute_module(changed=False)
+                self.assertEqual(result['before'], test_case['expected_network_resources']['vlans'])
+        config_edit_config.assert_not_called()
+        self.assertEqual(self.vlans_edit_config.call_count, 2)
+        self.assertTrue(self.fingerprint_edit_config.called)
@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
@@ -72,6 +74,18 @@ class TestSonicL3AclsModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_l3_acls_merged_filtered_facts(self):
+        set_module_args(self.fixture_data['merged_03_filtered_facts']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_filtered_facts']['facts_get_requests'])
+        self.initialize_config_requests(self.fixture_data['merged_03_filtered_facts']['config_requests'])
+
+        with patch.dict(os.environ, {'ANSIBLE_SONIC_FILTERED_FACTS': 'true'}):
+            result = self.execute_module(changed=False)
+        self.validate_config_requests()
+        # The name of the ACL is quoted in the keyed path
+        facts_paths = set(request['path'] for call in self.facts_edit_config.call_args_list for request in call[0][1])
+        self.assertEqual(facts_paths, {'data/openconfig-acl:acl/acl-sets/acl-set=acl%201%2F2%2Cx%25,ACL_IPV4'})
+
     def test_sonic_l3_acls_replaced_01(self):
         set_module_args(self.fixture_data['replaced_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['replaced_01']['facts_get_requests'])
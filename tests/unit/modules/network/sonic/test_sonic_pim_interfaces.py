@@ -22,9 +22,6 @@ class TestSonicPimInterfacesModule(TestSonicModule):
 
     @classmethod
     def setUpClass(cls):
-        cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_interfaces.pim_interfaces.edit_config"
-        )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.pim_interfaces.pim_interfaces.edit_config"
         )
@@ -38,11 +35,9 @@ class TestSonicPimInterfacesModule(TestSonicModule):
 
     def setUp(self):
         super(TestSonicPimInterfacesModule, self).setUp()
-        self.facts_edit_config = self.mock_facts_edit_config.start()
         self.config_edit_config = self.mock_config_edit_config.start()
         self.utils_edit_config = self.mock_bgp_utils_edit_config.start()
 
-        self.facts_edit_config.side_effect = self.facts_side_effect
         self.config_edit_config.side_effect = self.config_side_effect
         self.utils_edit_config.side_effect = self.facts_side_effect
 
@@ -51,7 +46,6 @@ class TestSonicPimInterfacesModule(TestSonicModule):
 
     def tearDown(self):
         super(TestSonicPimInterfacesModule, self).tearDown()
-        self.mock_facts_edit_config.stop()
         self.mock_config_edit_config.stop()
         self.mock_bgp_utils_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
@@ -19,9 +19,6 @@ class TestSonicStaticRoutesModule(TestSonicModule):
 
     @classmethod
     def setUpClass(cls):
-        cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes.edit_config"
-        )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.static_routes.static_routes.edit_config"
         )
@@ -35,9 +32,7 @@ class TestSonicStaticRoutesModule(TestSonicModule):
 
     def setUp(self):
         super(TestSonicStaticRoutesModule, self).setUp()
-        self.facts_edit_config = self.mock_facts_edit_config.start()
         self.config_edit_config = self.mock_config_edit_config.start()
-        self.facts_edit_config.side_effect = self.facts_side_effect
         self.config_edit_config.side_effect = self.config_side_effect
         self.get_interface_naming_mode = self.mock_get_interface_naming_mode.start()
         self.get_interface_naming_mode.return_value = 'standard'
@@ -46,7 +41,6 @@ class TestSonicStaticRoutesModule(TestSonicModule):
 
     def tearDown(self):
         super(TestSonicStaticRoutesModule, self).tearDown()
-        self.mock_facts_edit_config.stop()
         self.mock_config_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
         self.mock_utils_edit_config.stop()
@@ -2,6 +2,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
@@ -65,6 +68,51 @@ class TestSonicVlansModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vlans_merged_generated_after(self):
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        with patch.dict(os.environ, {'ANSIBLE_SONIC_GENERATED_AFTER': 'true'}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(result['before'], [])
+        self.assertEqual(result['after'], [{'vlan_id': 10, 'description': 'Internal', 'autostate': False}])
+        self.assertNotIn('after_generated', result)
+        # The configuration is not read again after the change
+        facts_requests = [request for call in self.facts_edit_config.call_args_list for request in call[0][1]]
+        self.assertEqual(len(facts_requests), 1)
+
+    def test_sonic_vlans_merged_generated_after_error(self):
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        with patch.dict(os.environ, {'ANSIBLE_SONIC_GENERATED_AFTER': 'true'}):
+            with patch(
+                "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.vlans.vlans.get_new_config",
+                side_effect=KeyError('vlan_id')
+            ):
+                with patch.object(AnsibleModule, 'warn') as warn:
+                    result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(result['after'], [])
+        warn.assert_called_once()
+        self.assertIn('reading it from the device', warn.call_args[0][0])
+        # The configuration is read again after the change
+        facts_requests = [request for call in self.facts_edit_config.call_args_list for request in call[0][1]]
+        self.assertEqual(len(facts_requests), 2)
+
+    def test_sonic_vlans_merged_filtered_facts(self):
+        set_module_args(self.fixture_data['merged_03_filtered_facts']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_filtered_facts']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_filtered_facts']['expected_config_requests'])
+        with patch.dict(os.environ, {'ANSIBLE_SONIC_FILTERED_FACTS': 'true'}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(result['before'], [{'vlan_id': 10, 'description': 'Descr1', 'autostate': False}])
+        # Only the VLANs of the configuration are read
+        facts_paths = set(request['path'] for call in self.facts_edit_config.call_args_list for request in call[0][1])
+        self.assertEqual(facts_paths, {'data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST=Vlan10', 'data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST=Vlan20'})
+
     def test_sonic_vlans_deleted_01_vlan_descr(self):
         set_module_args(self.fixture_data['deleted_01_vlan_descr']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01_vlan_descr']['existing_vlans_config'])
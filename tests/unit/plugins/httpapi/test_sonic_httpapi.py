@@ -0,0 +1,568 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+from io import BytesIO
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.urls import open_url
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat import unittest
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic import HttpApi, ResponseBody, read_text
+
+
+class RestconfHandler(BaseHTTPRequestHandler):
+    """Minimal RESTCONF responder recording the client port of every request"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = json.loads(self.rfile.read(length)) if length else None
+        content_type = self.headers.get('Content-Type')
+        self.server.requests.append((self.command, self.path, self.client_address[1], content_type, data))
+        self.server.auth.append(self.headers.get('Authorization') or self.headers.get('X-Auth-Token'))
+        if content_type == 'application/yang-patch+json' and not self.server.yang_patch:
+            code = 415
+            body = {'ietf-restconf:errors': {'error': [{'error-message': 'Unsupported media type'}]}}
+        elif self.server.unready:
+            self.server.unready -= 1
+            code = 503
+            body = {'ietf-restconf:errors': {'error': [{'error-message': 'Service unavailable'}]}}
+        elif '?' in self.path and not self.server.query:
+            code = 400
+            parameter = self.path.split('?')[1].split('=')[0]
+            body = {'ietf-restconf:errors': {'error': [{'error-type': 'protocol', 'error-tag': 'invalid-value',
+                                                        'error-message': 'Query parameter %s is not supported' % parameter}]}}
+        elif self.server.invalid:
+            self.server.invalid -= 1
+            code = 400
+            body = {'ietf-restconf:errors': {'error': [self.server.invalid_error]}}
+        elif self.path.endswith('boot-time'):
+            code = 200
+            body = {'openconfig-system:boot-time': self.server.boot_time}
+        elif self.path.endswith('missing'):
+            code = 404
+            body = {'ietf-restconf:errors': {'error': [{'error-message': 'Resource not found'}]}}
+        else:
+            code = 200
+            body = {'path': self.path}
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(code)
+        if self.headers.get('Accept-Encoding') == 'gzip':
+            payload = gzip.compress(payload)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'application/yang-data+json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_PATCH = do_DELETE = do_POST = do_PUT = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestSonicHttpApi(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RestconfHandler)
+        self.server.requests = []
+        self.server.auth = []
+        self.server.yang_patch = True
+        self.server.query = True
+        self.server.unready = 0
+        self.server.invalid = 0
+        self.server.invalid_error = {'error-message': 'Invalid interface name'}
+        self.server.boot_time = 1000
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        port = self.server.server_address[1]
+        connection_options = {
+            'host': '127.0.0.1',
+            'port': port,
+            'use_ssl': False,
+            'remote_user': 'admin',
+            'password': 'admin',
+            'persistent_command_timeout': 30,
+        }
+        connection = MagicMock()
+        connection._auth = None
+        connection.connected = False
+        connection.get_option = connection_options.get
+        self.connection_options = connection_options
+
+        def connect():
+            # Authenticate like the _connect method of the httpapi connection plugin
+            connection.connected = True
+            if connection_options.get('session_key'):
+                connection._auth = connection_options['session_key']
+        connection._connect.side_effect = connect
+        self.plugin_options = {
+            'root_path': '/restconf',
+            'keepalive_pool_size': 2,
+            'keepalive_idle_timeout': 30,
+            'concurrent_requests': 1,
+            'yang_patch': False,
+            'cache_ttl': 0,
+            'cache_size': 256,
+            'compression': False,
+            'reboot_ready_path': 'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost',
+            'reboot_ready_count': 2,
+            'reboot_boot_time_path': 'data/openconfig-system:system/state/boot-time',
+            'reboot_probe_delay': 30,
+            'reboot_timeout': 600,
+            'record_file': None,
+            'replay_file': None,
+            'replay_latency': 0,
+        }
+        self.httpapi = HttpApi(connection)
+        self.httpapi.get_option = self.plugin_options.get
+
+    def tearDown(self):
+        self.httpapi.logout()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keepalive_reuses_connection(self):
+        for dummy in range(5):
+            code, response = self.httpapi.get('data/sonic-vlan:sonic-vlan')
+            self.assertEqual(code, 200)
+            self.assertEqual(response, {'path': '/restconf/data/sonic-vlan:sonic-vlan'})
+
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(set(request[2] for request in self.server.requests)), 1)
+
+    def test_keepalive_session_key(self):
+        self.connection_options['session_key'] = {'X-Auth-Token': 'token'}
+        for dummy in range(2):
+            self.httpapi.get('data/sonic-vlan:sonic-vlan')
+
+        self.assertEqual(self.httpapi.connection._connect.call_count, 1)
+        self.assertEqual(self.server.auth, ['token', 'token'])
+
+    def test_keepalive_basic_auth(self):
+        self.httpapi.get('data/sonic-vlan:sonic-vlan')
+
+        self.assertEqual(self.httpapi.connection._connect.call_count, 1)
+        self.assertEqual(self.server.auth, ['Basic YWRtaW46YWRtaW4='])
+
+    def test_keepalive_dropped_connection(self):
+        self.httpapi.get('data/sonic-vlan:sonic-vlan')
+        # The device closed the idle connection
+        self.httpapi._pool._idle[0][0].sock.shutdown(socket.SHUT_RD)
+        self.httpapi.edit_config([{'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {}}])
+
+        self.assertEqual([request[0] for request in self.server.requests], ['GET', 'PATCH'])
+        self.assertEqual(len(set(request[2] for request in self.server.requests)), 2)
+
+    def test_keepalive_retry_idempotent_only(self):
+        self.httpapi.get('data/sonic-vlan:sonic-vlan')
+        conn = self.httpapi._pool._idle[0][0]
+        # The connection fails once the request is sent
+        conn.getresponse = MagicMock(side_effect=http_client.RemoteDisconnected('closed'))
+        with self.assertRaises(AnsibleConnectionFailure):
+            self.httpapi.edit_config([{'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {}}])
+
+        self.httpapi.get('data/sonic-vlan:sonic-vlan')
+        conn = self.httpapi._pool._idle[0][0]
+        conn.getresponse = MagicMock(side_effect=http_client.RemoteDisconnected('closed'))
+        code, response = self.httpapi.get('data/sonic-vlan:sonic-vlan')
+
+        self.assertEqual(code, 200)
+        # The PATCH request is sent once, the last GET request twice
+        self.assertEqual(sorted(request[0] for request in self.server.requests), ['GET', 'GET', 'GET', 'GET', 'PATCH'])
+
+    def test_keepalive_idle_timeout(self):
+        self.plugin_options['keepalive_idle_timeout'] = 0
+        for dummy in range(3):
+            self.httpapi.get('data/sonic-vlan:sonic-vlan')
+
+        self.assertEqual(len(set(request[2] for request in self.server.requests)), 3)
+
+    def test_keepalive_not_found(self):
+        responses = self.httpapi.edit_config([
+            {'path': 'data/missing', 'method': 'get', 'data': None},
+            {'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {'sonic-vlan:sonic-vlan': {}}},
+        ])
+
+        self.assertEqual(responses, [[{}, {}], (200, {'path': '/restconf/data/sonic-vlan:sonic-vlan'})])
+        self.assertEqual(len(set(request[2] for request in self.server.requests)), 1)
+
+    def test_concurrent_get_order(self):
+        self.plugin_options['concurrent_requests'] = 4
+        requests = [{'path': 'data/vrf=Vrf%s' % idx, 'method': 'get', 'data': None} for idx in range(8)]
+        requests.insert(3, {'path': 'data/missing', 'method': 'get', 'data': None})
+        requests.insert(6, {'path': 'data/vrf=Vrf1', 'method': 'patch', 'data': {'vrf': {}}})
+
+        responses = self.httpapi.edit_config(requests)
+
+        self.assertEqual(len(responses), len(requests))
+        for request, response in zip(requests, responses):
+            if request['path'] == 'data/missing':
+                self.assertEqual(response, [{}, {}])
+            else:
+                self.assertEqual(response, (200, {'path': '/restconf/' + request['path']}))
+        methods = [request[0] for request in self.server.requests]
+        self.assertEqual(methods.index('PATCH'), 6)
+
+    def test_yang_patch_batch(self):
+        self.plugin_options['yang_patch'] = True
+        requests = [
+            {'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {'sonic-vlan:sonic-vlan': {}}},
+            {'path': 'data/vrf=Vrf1/config/description', 'method': 'delete', 'data': None},
+            {'path': 'operations/sonic-config-mgmt:write-erase', 'method': 'post', 'data': {}},
+        ]
+
+        responses = self.httpapi.edit_config(requests)
+
+        self.assertEqual(len(responses), 3)
+        self.assertEqual([request[:2] for request in self.server.requests], [
+            ('PATCH', '/restconf/data'),
+            ('POST', '/restconf/operations/sonic-config-mgmt:write-erase'),
+        ])
+        self.assertEqual(self.server.requests[0][4], {'ietf-yang-patch:yang-patch': {
+            'patch-id': 'ansible-edit-config',
+            'edit': [
+                {'edit-id': '1', 'operation': 'merge', 'target': '/sonic-vlan:sonic-vlan', 'value': {'sonic-vlan:sonic-vlan': {}}},
+                {'edit-id': '2', 'operation': 'remove', 'target': '/vrf=Vrf1/config/description'},
+            ]
+        }})
+
+    def test_yang_patch_fallback(self):
+        self.plugin_options['yang_patch'] = True
+        self.server.yang_patch = False
+        requests = [
+            {'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {'sonic-vlan:sonic-vlan': {}}},
+            {'path': 'data/vrf=Vrf1/config/description', 'method': 'delete', 'data': None},
+        ]
+
+        self.httpapi.edit_config(requests)
+        self.httpapi.edit_config(requests)
+
+        self.assertEqual([request[0] for request in self.server.requests], ['PATCH', 'PATCH', 'DELETE', 'PATCH', 'DELETE'])
+        self.assertEqual(self.server.requests[0][3], 'application/yang-patch+json')
+
+    def test_cache_get(self):
+        self.plugin_options['cache_ttl'] = 60
+        for dummy in range(3):
+            code, response = self.httpapi.get('data/openconfig-interfaces:interfaces')
+            self.assertEqual(response, {'path': '/restconf/data/openconfig-interfaces:interfaces'})
+            response['path'] = 'modified'
+        self.httpapi.get('/data//openconfig-interfaces:interfaces/')
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_cache_invalidation(self):
+        self.plugin_options['cache_ttl'] = 60
+        paths = [
+            'data/openconfig-interfaces:interfaces',
+            'data/openconfig-interfaces:interfaces/interface=Eth1%2f2/config',
+            'data/openconfig-interfaces:interfaces/interface=Eth1%2f3/config',
+            'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST',
+        ]
+        for path in paths:
+            self.httpapi.get(path)
+        self.httpapi.send_request({'openconfig-interfaces:mtu': 9100}, method='patch',
+                                  path='data/openconfig-interfaces:interfaces/interface=Eth1%2F2/config/mtu')
+        del self.server.requests[:]
+        for path in paths:
+            self.httpapi.get(path)
+
+        self.assertEqual([request[1] for request in self.server.requests], ['/restconf/' + path for path in paths])
+
+    def test_cache_invalidation_sibling_path(self):
+        self.plugin_options['cache_ttl'] = 60
+        sibling = 'data/sonic-port:sonic-port/PORT/PORT_LIST=Ethernet4'
+        self.httpapi.get(sibling)
+        self.httpapi.send_request({'sonic-port-breakout:BREAKOUT_CFG_LIST': [{'port': '1/1', 'brkout_mode': '4x25G'}]},
+                                  method='patch', path='data/sonic-port:sonic-port/PORT/PORT_LIST=Ethernet0/breakout')
+        self.httpapi.get(sibling)
+        self.httpapi.get(sibling)
+
+        self.assertEqual([request[:2] for request in self.server.requests], [
+            ('GET', '/restconf/' + sibling),
+            ('PATCH', '/restconf/data/sonic-port:sonic-port/PORT/PORT_LIST=Ethernet0/breakout'),
+            ('GET', '/restconf/' + sibling),
+        ])
+
+    def test_cache_size_and_ttl(self):
+        self.plugin_options['cache_ttl'] = 60
+        self.plugin_options['cache_size'] = 2
+        for path in ('data/a:a', 'data/b:b', 'data/c:c', 'data/a:a'):
+            self.httpapi.get(path)
+        self.assertEqual(len(self.server.requests), 4)
+
+        self.httpapi._cache._ttl = 0
+        self.httpapi.get('data/a:a')
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_query_parameters(self):
+        request = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None,
+                   'depth': 3, 'content': 'config', 'fields': 'interface(name;config)'}
+
+        self.httpapi.edit_config([request])
+
+        self.assertEqual(self.server.requests[0][1],
+                         '/restconf/data/openconfig-interfaces:interfaces?depth=3&content=config&fields=interface(name;config)')
+
+    def test_query_parameters_fallback(self):
+        self.server.query = False
+        request = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None,
+                   'depth': None, 'content': 'config', 'fields': None}
+
+        responses = self.httpapi.edit_config([request, request])
+
+        self.assertEqual(responses[1], (200, {'path': '/restconf/data/openconfig-interfaces:interfaces'}))
+        self.assertEqual([request[1] for request in self.server.requests], [
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+            '/restconf/data/openconfig-interfaces:interfaces',
+            '/restconf/data/openconfig-interfaces:interfaces',
+        ])
+
+    def test_query_parameters_fallback_per_module(self):
+        self.server.query = False
+        interfaces = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None, 'content': 'config'}
+        vlans = {'path': 'data/sonic-vlan:sonic-vlan', 'method': 'get', 'data': None, 'content': 'config'}
+
+        self.httpapi.edit_config([interfaces])
+        self.server.query = True
+        self.httpapi.edit_config([interfaces, vlans])
+
+        self.assertEqual([request[1] for request in self.server.requests], [
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+            '/restconf/data/openconfig-interfaces:interfaces',
+            '/restconf/data/openconfig-interfaces:interfaces',
+            '/restconf/data/sonic-vlan:sonic-vlan?content=config',
+        ])
+        self.assertEqual(self.httpapi.get_query_unsupported(), ['openconfig-interfaces'])
+
+    def test_query_parameters_other_error(self):
+        self.server.invalid = 1
+        request = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None, 'content': 'config'}
+
+        with self.assertRaises(ConnectionError):
+            self.httpapi.edit_config([request])
+        self.httpapi.edit_config([request])
+
+        self.assertEqual([request[1] for request in self.server.requests], [
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+        ])
+
+    def test_query_parameters_invalid_content(self):
+        self.server.invalid = 1
+        self.server.invalid_error = {'error-type': 'application', 'error-tag': 'invalid-value',
+                                     'error-message': 'Invalid content in the request body'}
+        request = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None, 'content': 'config'}
+
+        with self.assertRaises(ConnectionError):
+            self.httpapi.edit_config([request])
+        self.httpapi.edit_config([request])
+
+        self.assertEqual([request[1] for request in self.server.requests], [
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+            '/restconf/data/openconfig-interfaces:interfaces?content=config',
+        ])
+
+    def test_compression(self):
+        self.plugin_options['compression'] = True
+        path = 'data/openconfig-interfaces:interfaces/interface=Eth1%2f1' + '/x' * 20000
+
+        code, response = self.httpapi.get(path)
+
+        self.assertEqual(response, {'path': '/restconf/' + path})
+        stats = self.httpapi.get_request_stats()
+        self.assertEqual(stats[0]['bytes_decoded'], len(json.dumps(response)))
+        self.assertTrue(stats[0]['bytes_in'] < stats[0]['bytes_decoded'] / 10)
+
+    def test_compression_connection_plugin(self):
+        self.plugin_options['compression'] = True
+        self.plugin_options['keepalive_pool_size'] = 0
+        self.httpapi.connection.send = self._connection_send
+        path = 'data/openconfig-interfaces:interfaces/interface=Eth1%2f1' + '/x' * 20000
+
+        code, response = self.httpapi.get(path)
+        with self.assertRaises(ConnectionError):
+            self.httpapi.get('data/missing')
+
+        self.assertEqual(response, {'path': '/restconf/' + path})
+        stats = self.httpapi.get_request_stats()
+        self.assertEqual(stats[0]['bytes_decoded'], len(json.dumps(response)))
+        self.assertTrue(stats[0]['bytes_in'] < stats[0]['bytes_decoded'] / 10)
+        self.assertEqual(stats[1]['status'], 404)
+
+    def test_compressed_body_read_in_chunks(self):
+        text = json.dumps({'description': u' '.join(u'%d \u00e9t\u00e9 \u2713' % (i * 7919 % 100003) for i in range(30000))},
+                          ensure_ascii=False)
+        compressed = BytesIO(gzip.compress(text.encode('utf-8')))
+        compressed_reads = []
+        compressed_read = compressed.read
+
+        def read(size=-1):
+            data = compressed_read(size)
+            compressed_reads.append(len(data))
+            return data
+
+        compressed.read = read
+        response = MagicMock(headers={'Content-Encoding': 'gzip'})
+        body = ResponseBody(response, compressed)
+
+        # Multi-byte characters split between chunks are decoded once whole
+        self.assertEqual(read_text(body, chunk_size=1001), text)
+        self.assertEqual(body.size, len(text.encode('utf-8')))
+        # The compressed body is read in small parts, as they are decompressed
+        self.assertTrue(len([size for size in compressed_reads if size]) > 5)
+        self.assertTrue(max(compressed_reads) < len(compressed.getvalue()) / 5)
+
+    def _connection_send(self, path, data, **kwargs):
+        """Send a request like the 'send' method of the httpapi connection plugin"""
+        try:
+            response = open_url(self.httpapi._get_url() + path, data=data, **kwargs)
+        except HTTPError as exc:
+            response = exc
+        return response, BytesIO(response.read())
+
+    def _reboot(self, unready=0, boot_time=None):
+        """Return a send_request replacement emulating a request triggering a reboot"""
+        def send_request(*args, **kwargs):
+            self.server.unready = unready
+            self.server.boot_time = boot_time or self.server.boot_time
+            del self.server.requests[:]
+            raise Exception('command timeout triggered')
+        return send_request
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time.sleep')
+    def test_reboot_readiness(self, mock_sleep):
+        with patch.object(HttpApi, 'send_request', side_effect=self._reboot(unready=3)):
+            downtime = self.httpapi.edit_config_reboot([{'path': 'data/sonic-port-breakout:sonic-port-breakout', 'method': 'patch'}])
+
+        self.assertIsNotNone(downtime)
+        self.assertEqual([request[1].split('/')[-1] for request in self.server.requests],
+                         ['DEVICE_METADATA_LIST=localhost'] * 5 + ['boot-time'])
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [30, 5, 10, 20, 5])
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time.sleep')
+    def test_reboot_readiness_boot_time(self, mock_sleep):
+        with patch.object(HttpApi, 'send_request', side_effect=self._reboot(boot_time=2000)):
+            downtime = self.httpapi.edit_config_reboot([{'path': 'data/sonic-port-breakout:sonic-port-breakout', 'method': 'patch'}])
+
+        self.assertIsNotNone(downtime)
+        self.assertEqual([request[1].split('/')[-1] for request in self.server.requests],
+                         ['DEVICE_METADATA_LIST=localhost', 'boot-time', 'DEVICE_METADATA_LIST=localhost', 'boot-time'])
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time')
+    def test_reboot_not_started(self, mock_time):
+        clock = [1000.0]
+        mock_time.time.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        self.plugin_options['reboot_timeout'] = 20
+        with patch.object(HttpApi, 'send_request', side_effect=self._reboot()):
+            with self.assertRaises(Exception):
+                self.httpapi.edit_config_reboot([{'path': 'data/sonic-port-breakout:sonic-port-breakout', 'method': 'patch'}])
+
+        self.assertEqual([call[0][0] for call in mock_time.sleep.call_args_list], [20])
+        self.assertEqual(len(self.server.requests), 2)
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time.sleep')
+    def test_reboot_no_reboot(self, mock_sleep):
+        downtime = self.httpapi.edit_config_reboot([{'path': 'data/sonic-port-breakout:sonic-port-breakout', 'method': 'patch', 'data': {}}])
+
+        self.assertIsNone(downtime)
+        mock_sleep.assert_not_called()
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time.sleep')
+    def test_reboot_timeout(self, mock_sleep):
+        self.server.unready = 1000
+        self.plugin_options['reboot_timeout'] = 0
+        with patch.object(HttpApi, 'send_request', side_effect=Exception('command timeout triggered')):
+            with self.assertRaises(Exception):
+                self.httpapi.edit_config_reboot([{'path': 'data/sonic-port-breakout:sonic-port-breakout', 'method': 'patch'}])
+
+    def test_request_stats(self):
+        self.plugin_options['cache_ttl'] = 60
+        self.httpapi.get('data/openconfig-interfaces:interfaces/interface=Eth1%2f1')
+        self.httpapi.get('data/openconfig-interfaces:interfaces/interface=Eth1%2f1')
+        self.httpapi.send_request({'openconfig-interfaces:mtu': 9100}, method='patch',
+                                  path='data/openconfig-interfaces:interfaces/interface=Eth1%2f2/config/mtu')
+
+        stats = self.httpapi.get_request_stats()
+
+        self.assertEqual([(rec['method'], rec['path'], rec['status'], rec['cached']) for rec in stats], [
+            ('get', 'restconf/data/openconfig-interfaces:interfaces/interface={}', 200, False),
+            ('get', 'restconf/data/openconfig-interfaces:interfaces/interface={}', 200, True),
+            ('patch', 'restconf/data/openconfig-interfaces:interfaces/interface={}/config/mtu', 200, False),
+        ])
+        self.assertEqual(stats[2]['bytes_out'], len('{"openconfig-interfaces:mtu": 9100}'))
+        self.assertTrue(stats[0]['bytes_in'] > 0)
+        self.assertEqual(self.httpapi.get_request_stats(), [])
+
+    def test_record_replay(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        record_file = os.path.join(tmp_dir, 'record.jsonl.gz')
+        self.plugin_options['record_file'] = record_file
+        requests = [
+            {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'data': None},
+            {'path': 'data/missing', 'method': 'get', 'data': None},
+            {'path': 'data/sonic-vlan:sonic-vlan', 'method': 'patch', 'data': {'sonic-vlan:sonic-vlan': {}}},
+        ]
+        recorded = self.httpapi.edit_config(requests)
+
+        with gzip.open(record_file, 'rt') as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(entries[2], {
+            'method': 'patch',
+            'path': '/restconf/data/sonic-vlan:sonic-vlan',
+            'data': {'sonic-vlan:sonic-vlan': {}},
+            'response': {'code': 200, 'value': {'path': '/restconf/data/sonic-vlan:sonic-vlan'}}
+        })
+        self.assertEqual(entries[1]['response']['code'], 404)
+
+        self.server.requests = []
+        self.plugin_options['replay_file'] = record_file
+        replay = HttpApi(self.httpapi.connection)
+        replay.get_option = self.plugin_options.get
+        self.assertEqual(replay.edit_config(requests), recorded)
+        self.assertEqual(replay.edit_config([{'path': 'data/vrf=Vrf1', 'method': 'delete', 'data': None}]), [(204, '')])
+        with self.assertRaises(Exception):
+            replay.get('data/sonic-vrf:sonic-vrf')
+        self.assertEqual(self.server.requests, [])
+        with gzip.open(record_file, 'rt') as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+    @patch('ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic.time.sleep')
+    def test_replay_order_and_latency(self, mock_sleep):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        replay_file = os.path.join(tmp_dir, 'record.jsonl')
+        with open(replay_file, 'w') as f:
+            for value in ('before', 'after'):
+                f.write(json.dumps({'method': 'get', 'path': '/restconf/data/vrf=Vrf1', 'data': None,
+                                    'response': {'code': 200, 'value': {'description': value}}}) + '\n')
+        self.plugin_options['replay_file'] = replay_file
+        self.plugin_options['replay_latency'] = 0.5
+
+        responses = [self.httpapi.get('data/vrf=Vrf1')[1]['description'] for dummy in range(3)]
+
+        self.assertEqual(responses, ['before', 'after', 'after'])
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [0.5, 0.5, 0.5])
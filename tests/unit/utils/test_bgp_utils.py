@@ -0,0 +1,106 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
+    VRF_BULK_GET_THRESHOLD,
+    get_all_bgp_neighbors,
+    get_fields,
+    get_vrf_subtrees,
+)
+
+BGP_UTILS = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils'
+NETWORK_INSTANCE_PATH = '/data/openconfig-network-instance:network-instances/network-instance'
+
+
+def get_network_instance(vrf_name, bgp_as):
+    instance = {'name': vrf_name, 'config': {'name': vrf_name}}
+    if bgp_as:
+        instance['protocols'] = {'protocol': [{
+            'identifier': 'openconfig-policy-types:BGP',
+            'name': 'bgp',
+            'bgp': {
+                'global': {'config': {'as': bgp_as}},
+                'neighbors': {'neighbor': [{'neighbor-address': '10.0.0.%d' % bgp_as}]}
+            }
+        }]}
+    return instance
+
+
+class NetworkInstances(object):
+    """Device answering the GET requests of network instances, and recording them"""
+
+    def __init__(self, vrf_count):
+        self.vrfs = ['Vrf%d' % idx for idx in range(vrf_count)]
+        self.instances = [get_network_instance(vrf_name, idx % 2 and idx) for idx, vrf_name in enumerate(self.vrfs)]
+        self.requests = []
+
+    def edit_config(self, module, requests):
+        self.requests.extend(requests)
+        responses = []
+        for request in requests:
+            path = request['path']
+            if path == 'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST':
+                responses.append((200, {'sonic-vrf:VRF_LIST': [{'vrf_name': vrf_name} for vrf_name in self.vrfs]}))
+            elif path == 'data/openconfig-network-instance:network-instances':
+                responses.append((200, {'openconfig-network-instance:network-instances': {'network-instance': self.instances}}))
+            else:
+                vrf_name, subpath = path[len(NETWORK_INSTANCE_PATH) + 1:].split('/', 1)
+                bgp = self.instances[self.vrfs.index(vrf_name)].get('protocols', {}).get('protocol', [{}])[0].get('bgp', {})
+                name = subpath.split('/')[-1]
+                node = bgp.get('global', {}).get('config') if name == 'config' else bgp.get(name)
+                responses.append((200, {'openconfig-network-instance:%s' % name: node} if node else {}))
+        return responses
+
+
+class TestBgpUtils(unittest.TestCase):
+
+    def test_get_fields(self):
+        self.assertEqual(get_fields(['protocols/protocol=BGP,bgp/bgp/global/config', 'protocols/protocol=BGP,bgp/bgp/neighbors']),
+                         'network-instance(name;protocols/protocol(identifier;name;bgp(global/config;neighbors)))')
+        self.assertEqual(get_fields(['protocols/protocol=BGP,bgp/bgp/global', 'table-connections']),
+                         'network-instance(name;protocols/protocol(identifier;name;bgp/global);table-connections)')
+        self.assertEqual(get_fields(['protocols/protocol=BGP,bgp/bgp/global', 'protocols/protocol=BGP,bgp/bgp']),
+                         'network-instance(name;protocols/protocol(identifier;name;bgp))')
+
+    def test_get_vrf_subtrees(self):
+        subpaths = ['protocols/protocol=BGP,bgp/bgp/global/config', 'protocols/protocol=BGP,bgp/bgp/neighbors']
+        for vrf_count in (VRF_BULK_GET_THRESHOLD - 1, VRF_BULK_GET_THRESHOLD):
+            device = NetworkInstances(vrf_count)
+            with patch(BGP_UTILS + '.edit_config', side_effect=device.edit_config):
+                vrf_subtrees = get_vrf_subtrees(MagicMock(), device.vrfs, subpaths)
+
+            self.assertEqual(vrf_subtrees['Vrf0'], [{}, {}])
+            self.assertEqual(vrf_subtrees['Vrf1'], [{'openconfig-network-instance:config': {'as': 1}},
+                                                    {'openconfig-network-instance:neighbors': {'neighbor': [{'neighbor-address': '10.0.0.1'}]}}])
+            if vrf_count < VRF_BULK_GET_THRESHOLD:
+                self.assertEqual(len(device.requests), vrf_count * len(subpaths))
+            else:
+                self.assertEqual(device.requests, [{
+                    'path': 'data/openconfig-network-instance:network-instances', 'method': 'get', 'data': None, 'depth': None, 'content': None,
+                    'fields': 'network-instance(name;protocols/protocol(identifier;name;bgp(global/config;neighbors)))'
+                }])
+
+    def test_get_all_bgp_neighbors_bulk(self):
+        results = []
+        for vrf_count in (VRF_BULK_GET_THRESHOLD - 1, VRF_BULK_GET_THRESHOLD + 1):
+            device = NetworkInstances(vrf_count)
+            with patch(BGP_UTILS + '.edit_config', side_effect=device.edit_config):
+                results.append(get_all_bgp_neighbors(MagicMock()))
+            if vrf_count > VRF_BULK_GET_THRESHOLD:
+                self.assertEqual(len(device.requests), 2)
+
+        self.assertEqual(results[0], results[1][:len(results[0])])
+        self.assertEqual([neighbors['vrf_name'] for neighbors in results[1]], ['Vrf1', 'Vrf3', 'Vrf5', 'Vrf7'])
+
+    def test_get_all_bgp_neighbors_vrfs(self):
+        device = NetworkInstances(8)
+        with patch(BGP_UTILS + '.edit_config', side_effect=device.edit_config):
+            result = get_all_bgp_neighbors(MagicMock(), vrfs=['Vrf3', 'Vrf4'])
+
+        self.assertEqual([neighbors['vrf_name'] for neighbors in result], ['Vrf3'])
+        # The VRF list is not requested
+        self.assertEqual(len(device.requests), 4)
@@ -0,0 +1,129 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.data_source_utils import (
+    DataSource,
+    get_subtree_slice,
+)
+
+INTERFACES = {
+    'openconfig-interfaces:interfaces': {
+        'interface': [
+            {
+                'name': 'Eth1/1',
+                'config': {'name': 'Eth1/1', 'mtu': 9100},
+                'openconfig-if-ethernet:ethernet': {'config': {'port-speed': 'openconfig-if-ethernet:SPEED_25GB'}},
+                'subinterfaces': {'subinterface': [{'index': 0, 'config': {'index': 0}}]}
+            },
+            {'name': 'Vlan10', 'config': {'name': 'Vlan10'}}
+        ]
+    }
+}
+NETWORK_INSTANCES = {
+    'openconfig-network-instance:network-instances': {
+        'network-instance': [
+            {
+                'name': 'Vrf1',
+                'protocols': {'protocol': [
+                    {'identifier': 'openconfig-policy-types:BGP', 'name': 'bgp', 'bgp': {'global': {'config': {'as': 65001}}}}
+                ]}
+            }
+        ]
+    }
+}
+
+
+def get_request(path):
+    return {'path': path, 'method': 'get', 'data': None, 'depth': None, 'content': None, 'fields': None}
+
+
+class RecordingSender(object):
+    """Send function of the data source, answering from a dict of paths"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent = []
+
+    def __call__(self, requests):
+        self.sent.append([request['path'] for request in requests])
+        result = []
+        for request in requests:
+            body = self.responses.get(request['path'].strip('/'))
+            if body is None:
+                raise ConnectionError('Resource not found', code=404)
+            result.append((200, body))
+        return result
+
+
+class TestDataSourceUtils(unittest.TestCase):
+
+    def test_get_subtree_slice(self):
+        path = 'data/openconfig-interfaces:interfaces'
+        self.assertEqual(get_subtree_slice(INTERFACES, path, path + '/interface'),
+                         {'openconfig-interfaces:interface': INTERFACES['openconfig-interfaces:interfaces']['interface']})
+        self.assertEqual(get_subtree_slice(INTERFACES, path, path + '/interface=Eth1%2f1/config'),
+                         {'openconfig-interfaces:config': {'name': 'Eth1/1', 'mtu': 9100}})
+        self.assertEqual(get_subtree_slice(INTERFACES, path, path + '/interface=Vlan10'),
+                         {'openconfig-interfaces:interface': [{'name': 'Vlan10', 'config': {'name': 'Vlan10'}}]})
+        self.assertEqual(get_subtree_slice(INTERFACES, path, path + '/interface=Eth1%2f1/openconfig-if-ethernet:ethernet/config'),
+                         {'openconfig-if-ethernet:config': {'port-speed': 'openconfig-if-ethernet:SPEED_25GB'}})
+        self.assertEqual(get_subtree_slice(INTERFACES, path, path + '/interface=Eth1%2f1/subinterfaces/subinterface=0'),
+                         {'openconfig-interfaces:subinterface': [{'index': 0, 'config': {'index': 0}}]})
+        self.assertIsNone(get_subtree_slice(INTERFACES, path, path + '/interface=Eth1%2f2'))
+        self.assertIsNone(get_subtree_slice(INTERFACES, path, path + '/interface=Vlan10/openconfig-vlan:routed-vlan'))
+
+        path = 'data/openconfig-network-instance:network-instances'
+        self.assertEqual(get_subtree_slice(NETWORK_INSTANCES, path, path + '/network-instance=Vrf1/protocols/protocol=BGP,bgp/bgp/global'),
+                         {'openconfig-network-instance:global': {'config': {'as': 65001}}})
+
+    def test_same_path_sent_once(self):
+        sender = RecordingSender({'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST': {'sonic-vrf:VRF_LIST': [{'vrf_name': 'Vrf1'}]}})
+        data_source = DataSource(['bgp', 'mac'])
+
+        response = data_source.edit_config([get_request('data/sonic-vrf:sonic-vrf/VRF/VRF_LIST')], sender)
+        response[0][1]['sonic-vrf:VRF_LIST'].append({'vrf_name': 'Vrf2'})
+        response = data_source.edit_config([get_request('/data/sonic-vrf:sonic-vrf/VRF/VRF_LIST')], sender)
+
+        self.assertEqual(response, [(200, {'sonic-vrf:VRF_LIST': [{'vrf_name': 'Vrf1'}]})])
+        self.assertEqual(sender.sent, [['data/sonic-vrf:sonic-vrf/VRF/VRF_LIST']])
+
+    def test_shared_subtree(self):
+        sender = RecordingSender({'data/openconfig-interfaces:interfaces': INTERFACES})
+        data_source = DataSource(['l3_interfaces', 'interfaces'])
+
+        response = data_source.edit_config([get_request('data/openconfig-interfaces:interfaces/interface')], sender)
+        self.assertEqual(response[0][1], {'openconfig-interfaces:interface': INTERFACES['openconfig-interfaces:interfaces']['interface']})
+        response = data_source.edit_config([get_request('data/openconfig-interfaces:interfaces')], sender)
+        self.assertEqual(response[0][1], INTERFACES)
+        self.assertEqual(sender.sent, [['data/openconfig-interfaces:interfaces']])
+
+    def test_subtree_not_shared_by_one_resource(self):
+        sender = RecordingSender({'data/openconfig-interfaces:interfaces/interface': {'openconfig-interfaces:interface': []}})
+        data_source = DataSource(['interfaces'])
+
+        data_source.edit_config([get_request('data/openconfig-interfaces:interfaces/interface')], sender)
+        self.assertEqual(sender.sent, [['data/openconfig-interfaces:interfaces/interface']])
+
+    def test_missing_slice_sent_once(self):
+        sender = RecordingSender({'data/openconfig-interfaces:interfaces': INTERFACES})
+        data_source = DataSource(['interfaces', 'l3_interfaces'])
+        path = 'data/openconfig-interfaces:interfaces/interface=Vlan10/openconfig-vlan:routed-vlan'
+
+        for dummy in range(2):
+            with self.assertRaises(ConnectionError) as context:
+                data_source.edit_config([get_request(path)], sender)
+            self.assertEqual(context.exception.code, 404)
+        self.assertEqual(sender.sent, [['data/openconfig-interfaces:interfaces'], [path]])
+
+    def test_non_shared_requests(self):
+        sender = RecordingSender({'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST': {'sonic-vrf:VRF_LIST': []}})
+        data_source = DataSource(['vrfs'])
+        request = dict(get_request('data/sonic-vrf:sonic-vrf/VRF/VRF_LIST'), depth=2)
+
+        for dummy in range(2):
+            data_source.edit_config([request], sender)
+        self.assertEqual(len(sender.sent), 2)
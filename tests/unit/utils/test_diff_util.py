@@ -11,6 +11,7 @@ sys.path.append('/root/.ansible/collections')
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
+    get_replaced_config,
 )
 
 
@@ -38,6 +39,15 @@ class TestDiffUtils(unittest.TestCase):
 
         self.assertEqual(diff_exp, diff_act)
 
+    def read_and_compare_replaced(self, file_name):
+        file_name = os.path.join(os.path.dirname(__file__), file_name)
+        with open(file_name, "r") as file_stream:
+            data = yaml.full_load(file_stream)
+
+        replaced_act = get_replaced_config(data['want'], data['have'], data['test_keys'])
+
+        self.assertEqual(data['replaced'], replaced_act)
+
     def test_01_dict_diff_with_key_name(self):
         self.read_and_compare("test_01_dict_diff_with_key_name.yaml")
 
@@ -85,3 +95,31 @@ class TestDiffUtils(unittest.TestCase):
 
     def test_16_complex_list_with_dict_diff(self):
         self.read_and_compare("test_16_complex_list_with_dict_diff.yaml")
+
+    def test_17_list_diff_with_partial_keys(self):
+        self.read_and_compare("test_17_list_diff_with_partial_keys.yaml")
+
+    def test_18_list_diff_with_duplicate_keys(self):
+        self.read_and_compare("test_18_list_diff_with_duplicate_keys.yaml")
+
+    def test_19_replaced_list_with_key_name(self):
+        self.read_and_compare_replaced("test_19_replaced_list_with_key_name.yaml")
+
+    def test_20_replaced_list_with_duplicate_keys(self):
+        self.read_and_compare_replaced("test_20_replaced_list_with_duplicate_keys.yaml")
+
+    def test_21_replaced_large_list(self):
+        test_keys = [{'config': {'address_family': ''}}, {'acls': {'name': ''}}, {'rules': {'sequence_num': ''}}]
+        rules = [{'sequence_num': idx, 'action': 'permit', 'source': {'host': '10.0.%d.%d' % (idx // 250, idx % 250)}}
+                 for idx in range(1, 5001)]
+        want_rules = [dict(rule, action='deny') if rule['sequence_num'] % 10 == 0 else rule for rule in reversed(rules)]
+        want_rules[1] = dict(want_rules[1], source={'any': True})
+        have = [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': rules}]}]
+        want = [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': want_rules}]}]
+
+        # Only the rules with changed values are replaced, whole if a value
+        # other than the source is changed
+        replaced_rules = [rules[-1], {'sequence_num': 4999, 'source': {'host': '10.0.19.249'}}]
+        replaced_rules.extend(rule for rule in reversed(rules[:-1]) if rule['sequence_num'] % 10 == 0)
+        replaced_act = get_replaced_config(want, have, test_keys)
+        self.assertEqual(replaced_act, [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'rules': replaced_rules}]}])
@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import gzip
+import json
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_cache_utils import (
+    FACTS_CACHE_DIR_ENV_VAR,
+    FactsCache,
+    get_facts_cache,
+    get_facts_cache_file_name,
+)
+
+SONIC = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic'
+VLANS_FACTS = [{'vlan_id': 10, 'description': 'Descr1'}]
+
+
+class TestFactsCacheUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.cache_dir, 'facts', 'sonic1.json.gz')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_ttl(self):
+        facts_cache = FactsCache(self.path, ttl=60)
+        facts_cache.put('vlans', VLANS_FACTS)
+        facts_cache.put('vrfs', None)
+        facts_cache.save()
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        with gzip.open(self.path, 'rt') as cache_file:
+            self.assertEqual(json.load(cache_file)['resources']['vlans']['facts'], VLANS_FACTS)
+
+        facts_cache = FactsCache(self.path, ttl=60)
+        self.assertEqual(facts_cache.get('vlans')['facts'], VLANS_FACTS)
+        self.assertIsNone(facts_cache.get('vrfs')['facts'])
+        self.assertIsNone(facts_cache.get('bgp'))
+        with patch('time.time', return_value=facts_cache.get('vlans')['timestamp'] + 61):
+            self.assertIsNone(facts_cache.get('vlans'))
+        self.assertIsNone(FactsCache(self.path, ttl=0).get('vlans'))
+
+    def test_fingerprint(self):
+        facts_cache = FactsCache(self.path, ttl=60)
+        facts_cache.put('vlans', VLANS_FACTS, fingerprint='abc')
+        facts_cache.put('vrfs', None)
+        self.assertEqual(facts_cache.get('vlans', fingerprint='abc')['facts'], VLANS_FACTS)
+        self.assertIsNone(facts_cache.get('vlans', fingerprint='def'))
+        self.assertEqual(facts_cache.get('vlans')['facts'], VLANS_FACTS)
+        self.assertIsNone(facts_cache.get('vlans', fingerprint_required=True))
+        self.assertIsNone(facts_cache.get('vrfs', fingerprint='abc', fingerprint_required=True))
+        # The TTL also bounds the entries with an unchanged fingerprint
+        with patch('time.time', return_value=facts_cache.get('vlans')['timestamp'] + 61):
+            self.assertIsNone(facts_cache.get('vlans', fingerprint='abc'))
+        self.assertIsNone(FactsCache(self.path, ttl=0).get('vlans', fingerprint='abc'))
+
+    def test_unreadable_cache(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as cache_file:
+            cache_file.write('not gzip')
+        self.assertIsNone(FactsCache(self.path).get('vlans'))
+
+    def test_cleared_by_change(self):
+        module = MagicMock(spec=['params'], params={})
+        connection = MagicMock()
+        connection.get_option.side_effect = {'host': 'sonic:1', 'port': None, 'remote_user': None}.get
+        with patch.dict(os.environ, {FACTS_CACHE_DIR_ENV_VAR: self.cache_dir}), patch(SONIC + '.get_connection', return_value=connection):
+            facts_cache = get_facts_cache(module, lambda module: connection)
+            self.assertEqual(facts_cache.path, os.path.join(self.cache_dir, 'sonic_1.json.gz'))
+            facts_cache.put('vlans', VLANS_FACTS)
+            facts_cache.save()
+
+            edit_config(module, [{'path': 'data/sonic-vlan:sonic-vlan', 'method': 'get'}])
+            self.assertTrue(os.path.exists(facts_cache.path))
+            edit_config(module, [{'path': 'data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST=Vlan10', 'method': 'delete'}])
+            self.assertFalse(os.path.exists(facts_cache.path))
+            self.assertIsNone(FactsCache(facts_cache.path).get('vlans'))
+
+    def test_file_name(self):
+        self.assertEqual(get_facts_cache_file_name('sonic1'), 'sonic1.json.gz')
+        self.assertEqual(get_facts_cache_file_name('sonic1', 443, 'admin'), 'admin@sonic1_443.json.gz')
+        self.assertEqual(get_facts_cache_file_name('fe80::1', 8443, 'dom\\user'), 'dom_user@fe80__1_8443.json.gz')
+        # The same host reached on other ports or as other users has other cache files
+        self.assertEqual(len(set([
+            get_facts_cache_file_name('10.0.0.1', 443, 'admin'),
+            get_facts_cache_file_name('10.0.0.1', 8443, 'admin'),
+            get_facts_cache_file_name('10.0.0.1', 443, 'operator'),
+        ])), 3)
+
+    def test_disabled(self):
+        module = MagicMock(spec=['params'], params={})
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(get_facts_cache(module, MagicMock()))
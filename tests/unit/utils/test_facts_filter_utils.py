@@ -0,0 +1,49 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.facts_filter_utils import (
+    FILTERED_FACTS_ENV_VAR,
+    get_config_keys,
+    get_facts_key_filter,
+    has_facts_key_filter,
+    set_facts_key_filter,
+)
+
+
+def get_module(state, config):
+    module = MagicMock()
+    module.params = {'state': state, 'config': config}
+    return module
+
+
+def get_vlan_keys(conf):
+    return [conf['vlan_id']]
+
+
+class TestFactsFilterUtils(unittest.TestCase):
+
+    def test_get_config_keys(self):
+        config = [{'vlan_id': 20}, {'vlan_id': 10}, {'vlan_id': 20}]
+        with patch.dict(os.environ, {FILTERED_FACTS_ENV_VAR: 'true'}):
+            self.assertEqual(get_config_keys(get_module('merged', config), get_vlan_keys), [10, 20])
+            self.assertEqual(get_config_keys(get_module('replaced', config), get_vlan_keys), [10, 20])
+            self.assertIsNone(get_config_keys(get_module('overridden', config), get_vlan_keys))
+            self.assertIsNone(get_config_keys(get_module('deleted', config), get_vlan_keys))
+            self.assertIsNone(get_config_keys(get_module('merged', None), get_vlan_keys))
+            self.assertIsNone(get_config_keys(get_module('merged', config), lambda conf: None))
+        with patch.dict(os.environ, {FILTERED_FACTS_ENV_VAR: 'false'}):
+            self.assertIsNone(get_config_keys(get_module('merged', config), get_vlan_keys))
+
+    def test_set_facts_key_filter(self):
+        module = MagicMock(spec=['params'])
+        self.assertIsNone(get_facts_key_filter(module, 'vlans'))
+        set_facts_key_filter(module, 'vlans', [10, 20])
+        set_facts_key_filter(module, 'interfaces', None)
+        self.assertEqual(get_facts_key_filter(module, 'vlans'), [10, 20])
+        self.assertTrue(has_facts_key_filter(module, ['interfaces', 'vlans']))
+        self.assertFalse(has_facts_key_filter(module, ['interfaces']))
@@ -0,0 +1,133 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+    BatchedConnection,
+    FactsRegistry,
+)
+
+FACTS_PACKAGE = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts'
+FACTS_MODULE = FACTS_PACKAGE + '.facts'
+
+
+class TestFactsRegistry(unittest.TestCase):
+
+    def test_registry_resources(self):
+        self.assertEqual(set(FACT_RESOURCE_SUBSETS) | set(['all']), set(FactsArgs.choices))
+        for resource in FACT_RESOURCE_SUBSETS:
+            facts_class = FACT_RESOURCE_SUBSETS[resource]
+            self.assertEqual(facts_class.__module__, '%s.%s.%s' % (FACTS_PACKAGE, resource, resource))
+            self.assertTrue(facts_class.__name__.endswith('Facts'))
+
+    def test_registry_lazy_import(self):
+        imported = []
+        registry = FactsRegistry(('vlans', 'vrfs'), lambda resource: imported.append(resource) or resource)
+
+        self.assertEqual(sorted(registry), ['vlans', 'vrfs'])
+        self.assertEqual(imported, [])
+        self.assertEqual(registry.get('vrfs'), 'vrfs')
+        self.assertEqual(registry['vrfs'], 'vrfs')
+        self.assertIsNone(registry.get('bgp'))
+        self.assertEqual(imported, ['vrfs'])
+
+    def test_resource_module_imports(self):
+        code = ('import sys; import ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_vlans; '
+                'print("\\n".join(sorted(name for name in sys.modules if name.startswith("%s."))))' % FACTS_PACKAGE)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        modules = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True).split()
+
+        self.assertNotIn(FACTS_PACKAGE + '.vlans.vlans', modules)
+        self.assertNotIn(FACTS_PACKAGE + '.interfaces.interfaces', modules)
+
+
+class RecordingConnection(object):
+    """Connection answering every GET request with its path, holding the first call until released"""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def edit_config(self, requests, *args):
+        if not self.started.is_set():
+            self.started.set()
+            self.release.wait()
+        self.calls.append([req['path'] for req in requests])
+        if any(req['path'] == 'data/fail' for req in requests):
+            raise ValueError('failed request')
+        return [[200, req['path']] for req in requests]
+
+
+class TestBatchedConnection(unittest.TestCase):
+
+    def run_workers(self, connection, paths):
+        """Run a worker per path, the first one alone in the first call
+        and the others queued while this call is in progress
+        """
+        batched = BatchedConnection(connection)
+        results = {}
+        queued = threading.Semaphore(0)
+
+        class QueuedEvent(threading.Event):
+            """Event of a queued call, counting the workers waiting for their responses"""
+
+            def wait(self, timeout=None):
+                queued.release()
+                return super(QueuedEvent, self).wait(timeout)
+
+        def worker(path):
+            try:
+                results[path] = batched.edit_config([{'path': path, 'method': 'get'}, {'path': path + '/config', 'method': 'get'}])
+            except ValueError as exc:
+                results[path] = str(exc)
+
+        threads = [threading.Thread(target=worker, args=(path,)) for path in paths]
+        with patch(FACTS_MODULE + '.threading', SimpleNamespace(Event=QueuedEvent)):
+            threads[0].start()
+            connection.started.wait()
+            for thread in threads[1:]:
+                thread.start()
+            for thread in threads:
+                queued.acquire()
+        # Complete the first call once the other workers have queued their requests
+        connection.release.set()
+        for thread in threads:
+            thread.join()
+        batched.close()
+        return results
+
+    def test_batched_requests(self):
+        connection = RecordingConnection()
+        results = self.run_workers(connection, ['data/a', 'data/b', 'data/c'])
+
+        for path in ('data/a', 'data/b', 'data/c'):
+            self.assertEqual(results[path], [[200, path], [200, path + '/config']])
+        self.assertEqual(len(connection.calls), 2)
+        self.assertEqual(connection.calls[0], ['data/a', 'data/a/config'])
+        self.assertEqual(sorted(connection.calls[1]), ['data/b', 'data/b/config', 'data/c', 'data/c/config'])
+
+    def test_batched_request_failure(self):
+        connection = RecordingConnection()
+        results = self.run_workers(connection, ['data/a', 'data/b', 'data/fail'])
+
+        self.assertEqual(results['data/a'], [[200, 'data/a'], [200, 'data/a/config']])
+        self.assertEqual(results['data/b'], [[200, 'data/b'], [200, 'data/b/config']])
+        self.assertEqual(results['data/fail'], 'failed request')
+
+    def test_write_requests_not_batched(self):
+        connection = RecordingConnection()
+        connection.release.set()
+        batched = BatchedConnection(connection)
+        self.assertEqual(batched.edit_config([{'path': 'data/a', 'method': 'patch'}]), [[200, 'data/a']])
+        batched.close()
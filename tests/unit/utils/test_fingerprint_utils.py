@@ -0,0 +1,77 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import FACT_RESOURCE_SUBSETS
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.fingerprint_utils import (
+    RESOURCE_CONFIG_TREES,
+    get_config_fingerprints,
+    get_digest,
+)
+
+FINGERPRINT_UTILS = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.fingerprint_utils'
+
+
+class Device(object):
+    """Device answering the GET requests of configuration containers, and recording them"""
+
+    def __init__(self, trees):
+        self.trees = trees
+        self.requests = []
+
+    def edit_config(self, module, requests):
+        self.requests.extend(requests)
+        return [(200, self.trees[request['path']]) if request['path'] in self.trees else {} for request in requests]
+
+
+class TestFingerprintUtils(unittest.TestCase):
+
+    def test_all_resources(self):
+        self.assertEqual(sorted(RESOURCE_CONFIG_TREES), sorted(FACT_RESOURCE_SUBSETS))
+
+    def test_get_digest(self):
+        self.assertEqual(get_digest({'a': 1, 'b': [1, {'c': 2, 'd': 3}]}), get_digest({'b': [1, {'d': 3, 'c': 2}], 'a': 1}))
+        self.assertNotEqual(get_digest({'a': [1, 2]}), get_digest({'a': [2, 1]}))
+
+    def test_get_config_fingerprints(self):
+        trees = {
+            'data/sonic-vlan:sonic-vlan': {'sonic-vlan:sonic-vlan': {'VLAN': {'VLAN_LIST': [{'name': 'Vlan10'}]}}},
+            'data/openconfig-interfaces:interfaces': {'openconfig-interfaces:interfaces': {'interface': [{'name': 'Eth1/1'}]}}
+        }
+        resources = ['vlans', 'interfaces', 'l2_interfaces', 'vrfs']
+        device = Device(trees)
+        with patch(FINGERPRINT_UTILS + '.edit_config', side_effect=device.edit_config), \
+                patch(FINGERPRINT_UTILS + '.get_query_unsupported', return_value=[]):
+            overall, fingerprints = get_config_fingerprints(MagicMock(), resources)
+            self.assertEqual(sorted(request['path'] for request in device.requests), [
+                'data/openconfig-interfaces:interfaces', 'data/openconfig-network-instance:network-instances', 'data/sonic-vlan:sonic-vlan'
+            ])
+            self.assertTrue(all(request['content'] == 'config' for request in device.requests))
+            self.assertEqual(fingerprints['interfaces'], fingerprints['l2_interfaces'])
+            self.assertEqual(len(set(fingerprints.values())), 3)
+
+            trees['data/sonic-vlan:sonic-vlan']['sonic-vlan:sonic-vlan']['VLAN']['VLAN_LIST'].append({'name': 'Vlan20'})
+            new_overall, new_fingerprints = get_config_fingerprints(MagicMock(), resources)
+            self.assertNotEqual(new_overall, overall)
+            self.assertNotEqual(new_fingerprints['vlans'], fingerprints['vlans'])
+            self.assertEqual(new_fingerprints['interfaces'], fingerprints['interfaces'])
+            self.assertEqual(new_fingerprints['vrfs'], fingerprints['vrfs'])
+
+    def test_get_config_fingerprints_query_unsupported(self):
+        trees = {
+            'data/sonic-vlan:sonic-vlan': {'sonic-vlan:sonic-vlan': {'VLAN': {'VLAN_LIST': [{'name': 'Vlan10'}]}}},
+            'data/openconfig-interfaces:interfaces': {'openconfig-interfaces:interfaces': {'interface': [{'name': 'Eth1/1'}]}}
+        }
+        resources = ['vlans', 'interfaces', 'vlan_mapping']
+        device = Device(trees)
+        with patch(FINGERPRINT_UTILS + '.edit_config', side_effect=device.edit_config), \
+                patch(FINGERPRINT_UTILS + '.get_query_unsupported', return_value=['sonic-port']):
+            overall, fingerprints = get_config_fingerprints(MagicMock(), resources)
+
+        self.assertIsNone(overall)
+        self.assertIsNone(fingerprints['vlan_mapping'])
+        self.assertIsNotNone(fingerprints['vlans'])
+        self.assertIsNotNone(fingerprints['interfaces'])
@@ -0,0 +1,242 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from unittest.mock import patch
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
+    __DELETE_CONFIG_IF_NO_SUBCONFIG,
+    __DELETE_OP_DEFAULT,
+    __DELETE_SUBCONFIG_ONLY,
+    __KEY_MATCH_OP_DEFAULT,
+    __MERGE_OP_DEFAULT,
+    DIFF_MAX_LINES_ENV_VAR,
+    DIFF_MODE_ENV_VAR,
+    compile_test_keys,
+    get_formatted_config_diff,
+    get_new_config,
+)
+
+TEST_KEYS = [
+    {'config': {'address_family': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}},
+    {'acls': {'name': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}},
+    {'rules': {'sequence_num': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}},
+]
+
+
+def get_rules(sequence_nums, action='permit'):
+    return [{'sequence_num': sequence_num, 'action': action, 'source': {'host': '10.0.0.%d' % sequence_num}}
+            for sequence_num in sequence_nums]
+
+
+def get_acls(rules):
+    return [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'remark': 'test', 'rules': rules}]}]
+
+
+def merge_remark_op(key_set, command, exist_conf):
+    exist_conf['remark'] = command.get('remark', exist_conf.get('remark'))
+    exist_conf['rules'][0]['action'] = 'deny'
+    return True, exist_conf
+
+
+def match_name_op(key_set, command, exist_conf):
+    return command.get('name') == exist_conf.get('name')
+
+
+NAME_TEST_KEYS = [{'config': {'name': ''}}]
+DEFAULT_OPS_TEST_KEYS = [{'__default_ops': {'__delete_op': __DELETE_SUBCONFIG_ONLY}}] + NAME_TEST_KEYS
+COMPILED_TEST_KEYS = [
+    {'__default_ops': {'__delete_op': __DELETE_SUBCONFIG_ONLY}},
+    {'config': {'name': '', 'vrf': ''}},
+    {'members': {'name': '', '__key_match_op': match_name_op, '__merge_op': merge_remark_op}},
+    {'members': {'ifname': ''}},
+    {'rules': {'sequence_num': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}},
+]
+# Expected (test key set, key names, key match, merge and delete operations)
+COMPILED_OPS = {
+    'config': ({'name', 'vrf'}, ('name', 'vrf'), __KEY_MATCH_OP_DEFAULT, __MERGE_OP_DEFAULT, __DELETE_SUBCONFIG_ONLY),
+    'members': ({'name'}, None, match_name_op, merge_remark_op, __DELETE_SUBCONFIG_ONLY),
+    'other': (set(), (), __KEY_MATCH_OP_DEFAULT, __MERGE_OP_DEFAULT, __DELETE_SUBCONFIG_ONLY),
+    'rules': ({'sequence_num'}, ('sequence_num',), __KEY_MATCH_OP_DEFAULT, __MERGE_OP_DEFAULT, __DELETE_CONFIG_IF_NO_SUBCONFIG),
+}
+DEFAULT_OPS = (set(), (), __KEY_MATCH_OP_DEFAULT, __MERGE_OP_DEFAULT, __DELETE_OP_DEFAULT)
+
+
+class TestFormattedDiffUtils(unittest.TestCase):
+
+    def test_get_new_config(self):
+        have = get_acls(get_rules(range(1, 6)))
+        commands = [
+            dict(get_acls(get_rules([2], action='deny'))[0], state='merged'),
+            dict(get_acls([{'sequence_num': 4}])[0], state='deleted'),
+            dict(get_acls(get_rules([7]))[0], state='merged'),
+            dict(get_acls([{'sequence_num': 2, 'action': 'deny'}])[0], state='deleted'),
+        ]
+        expected_have = deepcopy(have)
+        expected_commands = deepcopy(commands)
+
+        new_config = get_new_config(commands, have, TEST_KEYS)
+        rules = new_config[0]['acls'][0]['rules']
+        self.assertEqual([rule['sequence_num'] for rule in rules], [1, 3, 5, 7])
+        self.assertEqual(rules[-1], get_rules([7])[0])
+        self.assertEqual(have, expected_have)
+        self.assertEqual(commands, expected_commands)
+
+        rules[0]['source']['host'] = '10.0.0.100'
+        rules.append({'sequence_num': 8})
+        self.assertEqual(have, expected_have)
+        self.assertEqual(commands, expected_commands)
+
+    def test_get_new_config_entry_without_key(self):
+        have = get_acls(get_rules(range(1, 4)))
+        have[0]['acls'][0]['rules'].insert(1, {'action': 'permit'})
+        commands = [
+            dict(get_acls(get_rules([3, 1], action='deny'))[0], state='merged'),
+            dict(get_acls([{'action': 'permit', 'sequence_num': 9}])[0], state='merged'),
+        ]
+
+        # The rule without a sequence number comes before the rule 3 in the
+        # list and matches the command for it
+        new_config = get_new_config(commands, have, TEST_KEYS)
+        self.assertEqual(new_config[0]['acls'][0]['rules'], [
+            {'sequence_num': 2, 'action': 'permit', 'source': {'host': '10.0.0.2'}},
+            {'sequence_num': 3, 'action': 'permit', 'source': {'host': '10.0.0.3'}},
+            {'action': 'deny', 'sequence_num': 3, 'source': {'host': '10.0.0.3'}},
+            {'sequence_num': 1, 'action': 'deny', 'source': {'host': '10.0.0.1'}},
+            {'action': 'permit', 'sequence_num': 9},
+        ])
+
+    def test_get_new_config_new_list_order(self):
+        have = get_acls([])
+        commands = [dict(get_acls(get_rules(range(1, 6)))[0], state='merged')]
+
+        # A list set from the command keeps the order in which the former
+        # derivation merged it into itself
+        new_config = get_new_config(commands, have, TEST_KEYS)
+        self.assertEqual([rule['sequence_num'] for rule in new_config[0]['acls'][0]['rules']], [2, 4, 1, 3, 5])
+
+    def test_get_new_config_custom_op(self):
+        have = get_acls(get_rules(range(1, 4)))
+        test_keys = [TEST_KEYS[0], {'acls': {'name': '', '__merge_op': merge_remark_op}}]
+        commands = [dict(get_acls(get_rules([1]))[0], state='merged')]
+        commands[0]['acls'][0]['remark'] = 'changed'
+        expected_have = deepcopy(have)
+        expected_commands = deepcopy(commands)
+
+        new_config = get_new_config(commands, have, test_keys)
+        self.assertEqual(new_config[0]['acls'][0]['remark'], 'changed')
+        self.assertEqual(new_config[0]['acls'][0]['rules'][0]['action'], 'deny')
+        self.assertEqual(have, expected_have)
+        self.assertEqual(commands, expected_commands)
+
+    def test_compile_test_keys(self):
+        ops_table = compile_test_keys(COMPILED_TEST_KEYS)
+        self.assertIs(compile_test_keys(ops_table), ops_table)
+        for key, key_ops in COMPILED_OPS.items():
+            self.assertEqual(ops_table.get(key), key_ops)
+
+        item_table = ops_table.get_item_table('members')
+        self.assertIs(ops_table.get_item_table('members'), item_table)
+        self.assertEqual(item_table.get('members'), COMPILED_OPS['other'])
+        self.assertEqual(item_table.get('rules'), COMPILED_OPS['rules'])
+        self.assertEqual(compile_test_keys(None).get('config'), DEFAULT_OPS)
+
+    def test_get_new_config_default_ops(self):
+        have = [{'name': 'x', 'a': 1, 'b': 2, 'sub': {'c': 1}}]
+        commands = [{'name': 'x', 'a': 1, 'sub': {'c': 1}, 'state': 'deleted'}]
+
+        # The default operations of a resource are not used for the next one
+        self.assertEqual(get_new_config(commands, have, DEFAULT_OPS_TEST_KEYS), [])
+        self.assertEqual(get_new_config(commands, have, NAME_TEST_KEYS), [{'name': 'x', 'b': 2}])
+
+    def test_get_new_config_concurrent(self):
+        acls_have = get_acls(get_rules(range(1, 51)))
+        have = [{'name': 'x', 'a': 1, 'b': 2, 'sub': {'c': 1}}]
+        commands = [{'name': 'x', 'a': 1, 'sub': {'c': 1}, 'state': 'deleted'}]
+        runs = [
+            ([dict(get_acls(get_rules(range(1, 51, 2), action='deny'))[0], state='merged')], acls_have, TEST_KEYS),
+            ([dict(get_acls([{'sequence_num': seq} for seq in range(1, 51, 3)])[0], state='deleted')], acls_have, TEST_KEYS),
+            (commands, have, DEFAULT_OPS_TEST_KEYS),
+            (commands, have, NAME_TEST_KEYS),
+        ]
+        expected = [get_new_config(*run) for run in runs]
+
+        def derive(idx):
+            return get_new_config(*runs[idx % len(runs)])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(derive, range(200)))
+        self.assertEqual(results, [expected[idx % len(runs)] for idx in range(200)])
+
+    def test_get_formatted_config_diff_structural(self):
+        have = get_acls(get_rules(range(1, 5)))
+        have[0]['acls'][0]['rules'].append({'action': 'permit'})
+        have[0]['acls'][0]['remark'] = None
+        new_config = deepcopy(have)
+        rules = new_config[0]['acls'][0]['rules']
+        rules[0]['action'] = 'deny'
+        rules[2]['source'] = {'any': True}
+        del rules[1]
+        rules.reverse()
+        rules.append({'sequence_num': 9, 'action': 'permit'})
+        new_config[0]['acls'][0]['remark'] = 'new'
+        new_config.append({'address_family': 'ipv6', 'acls': []})
+
+        diff = get_formatted_config_diff(have, new_config, 3, TEST_KEYS, mode='structural')
+        self.assertEqual(diff, [
+            '--- before',
+            '+++ after',
+            '@@ config @@',
+            "+    {",
+            "+        'acls': [],",
+            "+        'address_family': 'ipv6'",
+            "+    }",
+            "@@ config[address_family='ipv4'].acls[name='acl1'] @@",
+            "-    'remark': null",
+            "+    'remark': 'new'",
+            "@@ config[address_family='ipv4'].acls[name='acl1'].rules @@",
+            "-    {",
+            "-        'action': 'permit',",
+            "-        'sequence_num': 2,",
+            "-        'source': {",
+            "-            'host': '10.0.0.2'",
+            "-        }",
+            "-    }",
+            "+    {",
+            "+        'action': 'permit',",
+            "+        'sequence_num': 9",
+            "+    }",
+            "@@ config[address_family='ipv4'].acls[name='acl1'].rules[sequence_num=1] @@",
+            "-    'action': 'permit'",
+            "+    'action': 'deny'",
+            "@@ config[address_family='ipv4'].acls[name='acl1'].rules[sequence_num=3].source @@",
+            "+    'any': true",
+            "-    'host': '10.0.0.3'",
+        ])
+        self.assertEqual(get_formatted_config_diff(have, deepcopy(have), 0, TEST_KEYS, mode='structural'), {'prepared': ''})
+
+    def test_get_formatted_config_diff_max_lines(self):
+        have = {'members': ['Ethernet%d' % idx for idx in range(20)]}
+        new_config = {'members': ['Ethernet%d' % idx for idx in range(10, 30)]}
+
+        diff = get_formatted_config_diff(have, new_config, 3, mode='structural', max_lines=4)
+        self.assertEqual(diff, ['--- before', '+++ after', '@@ config.members @@', "-    'Ethernet0'",
+                                '... diff truncated to 4 lines'])
+        diff = get_formatted_config_diff(have, new_config, 0, max_lines=3)
+        self.assertEqual(diff, {'prepared': '*** before\n--- after\n***************\n... diff truncated to 3 lines\n'})
+
+    def test_get_formatted_config_diff_env(self):
+        have = {'members': ['Ethernet0']}
+        new_config = {'members': ['Ethernet1']}
+        structural_diff = ['--- before', '+++ after', '@@ config.members @@', "-    'Ethernet0'", "+    'Ethernet1'"]
+
+        with patch.dict(os.environ, {DIFF_MODE_ENV_VAR: 'Structural', DIFF_MAX_LINES_ENV_VAR: '3'}):
+            self.assertEqual(get_formatted_config_diff(have, new_config, 3), structural_diff[:3] + ['... diff truncated to 3 lines'])
+        with patch.dict(os.environ, {DIFF_MODE_ENV_VAR: 'structural', DIFF_MAX_LINES_ENV_VAR: 'none'}):
+            self.assertEqual(get_formatted_config_diff(have, new_config, 3), structural_diff)
+        with patch.dict(os.environ, {DIFF_MODE_ENV_VAR: 'other', DIFF_MAX_LINES_ENV_VAR: '0'}):
+            self.assertEqual(get_formatted_config_diff(have, new_config, 3)[:2], ['*** before', '--- after'])
@@ -0,0 +1,45 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.profile_utils import (
+    get_path_template,
+    get_profile_summary,
+)
+
+
+class TestProfileUtils(unittest.TestCase):
+
+    def test_get_path_template(self):
+        self.assertEqual(get_path_template('/restconf/data/openconfig-interfaces:interfaces/interface=Eth1%2f1/config?content=config'),
+                         'restconf/data/openconfig-interfaces:interfaces/interface={}/config')
+        self.assertEqual(get_path_template('data/sonic-vrf:sonic-vrf/VRF/VRF_LIST=Vrf1,default'),
+                         'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST={}')
+
+    def test_get_profile_summary(self):
+        calls = [('edit_config', 0.2), ('edit_config', 0.4), ('get_config', 1.0)]
+        requests = []
+        for idx in range(1, 21):
+            requests.append({'method': 'get', 'path': 'data/vrf={}', 'status': 200, 'bytes_in': 10, 'bytes_decoded': 40,
+                             'bytes_out': 0, 'network_time': idx / 10.0, 'decode_time': 0.0, 'cached': idx > 18})
+        requests.append({'method': 'patch', 'path': 'data/vrf={}', 'status': 204, 'bytes_in': 0, 'bytes_decoded': 0,
+                         'bytes_out': 5, 'network_time': 0.5, 'decode_time': 0.0})
+
+        summary = get_profile_summary(calls, requests)
+
+        self.assertEqual(summary['calls'], {
+            'edit_config': {'count': 2, 'total': 0.6, 'p50': 0.2, 'p95': 0.4, 'max': 0.4},
+            'get_config': {'count': 1, 'total': 1.0, 'p50': 1.0, 'p95': 1.0, 'max': 1.0},
+        })
+        get_summary = summary['requests']['GET data/vrf={}']
+        self.assertEqual(get_summary['count'], 20)
+        self.assertEqual(get_summary['p50'], 1.0)
+        self.assertEqual(get_summary['p95'], 1.9)
+        self.assertEqual(get_summary['max'], 2.0)
+        self.assertEqual(get_summary['bytes_in'], 200)
+        self.assertEqual(get_summary['bytes_decoded'], 800)
+        self.assertEqual(get_summary['cached'], 2)
+        self.assertEqual(get_summary['status'], {'200': 20})
+        self.assertEqual(summary['requests']['PATCH data/vrf={}']['bytes_out'], 5)
@@ -0,0 +1,115 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+import unittest
+from unittest.mock import patch
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils import (
+    SKIP_FACTS_VALIDATION_ENV_VAR,
+    get_compiled_spec,
+    validate_config,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import set_module_args
+
+VALIDATION_UTILS = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.validation_utils'
+
+ARGUMENT_SPEC = {
+    'config': {
+        'type': 'list',
+        'elements': 'dict',
+        'options': {
+            'name': {'type': 'str', 'required': True},
+            'mtu': {'type': 'int'},
+            'enabled': {'type': 'bool', 'default': True},
+            'mode': {'type': 'str', 'choices': ['access', 'trunk']},
+            'vlans': {'type': 'list', 'elements': 'int'},
+            'tags': {'type': 'list', 'elements': 'str'},
+            'timers': {
+                'type': 'dict',
+                'options': {
+                    'hello': {'type': 'int'},
+                    'dead': {'type': 'int'}
+                },
+                'required_together': [['hello', 'dead']]
+            },
+            'source': {
+                'type': 'dict',
+                'options': {
+                    'host': {'type': 'str'},
+                    'any': {'type': 'bool'}
+                },
+                'mutually_exclusive': [['host', 'any']]
+            }
+        }
+    },
+    'state': {'type': 'str', 'choices': ['merged', 'deleted'], 'default': 'merged'}
+}
+
+
+class TestValidationUtils(unittest.TestCase):
+
+    def setUp(self):
+        set_module_args({})
+        patcher = patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop(SKIP_FACTS_VALIDATION_ENV_VAR, None)
+
+    def test_validate_config(self):
+        data = {'config': [
+            {'name': 'Ethernet0', 'mtu': '9100', 'mode': 'trunk', 'vlans': ['10', 20], 'tags': [1, 'a'],
+             'timers': {'hello': 10, 'dead': '40'}, 'source': {'host': '10.0.0.1'}},
+            {'name': 'Ethernet4', 'mtu': None, 'timers': None},
+            {'name': 'Ethernet8', 'enabled': 'no', 'source': {'any': True}}
+        ]}
+        params = validate_config(ARGUMENT_SPEC, data)
+        self.assertEqual(params, utils.validate_config(ARGUMENT_SPEC, data))
+        self.assertEqual(params['config'][0]['vlans'], [10, 20])
+        self.assertEqual(params['config'][1]['enabled'], True)
+        self.assertIsNone(params['config'][1]['timers'])
+        self.assertEqual(params['state'], 'merged')
+
+    def test_validate_config_resource(self):
+        rules = [{'sequence_num': idx, 'action': 'permit', 'protocol': {'name': 'tcp'},
+                  'source': {'host': '10.0.0.%d' % idx}, 'destination': {'any': True}} for idx in range(1, 10)]
+        data = {'config': [{'address_family': 'ipv4', 'acls': [{'name': 'acl1', 'remark': 'test', 'rules': rules}]}]}
+        params = validate_config(L3_aclsArgs.argument_spec, data)
+        self.assertEqual(params, utils.validate_config(L3_aclsArgs.argument_spec, data))
+        self.assertEqual(data['config'][0]['acls'][0]['rules'][0], rules[0])
+        self.assertEqual(set(data['config'][0]['acls'][0]['rules'][0]), {'sequence_num', 'action', 'protocol', 'source', 'destination'})
+
+    def test_validate_config_fallback(self):
+        invalid_data = (
+            {'config': [{'name': 'Ethernet0', 'unknown': 1}]},
+            {'config': [{'mtu': 9100}]},
+            {'config': [{'name': 'Ethernet0', 'mtu': 'large'}]},
+            {'config': [{'name': 'Ethernet0', 'mode': 'routed'}]},
+            {'config': [{'name': 'Ethernet0', 'enabled': None}]},
+            {'config': [{'name': 'Ethernet0', 'timers': {'hello': 10}}]},
+            {'config': [{'name': 'Ethernet0', 'source': {'host': '10.0.0.1', 'any': True}}]},
+            {'config': ['Ethernet0']},
+        )
+        for data in invalid_data:
+            with patch(VALIDATION_UTILS + '.utils.validate_config', return_value={'config': None}) as netcommon_validate_config:
+                self.assertEqual(validate_config(ARGUMENT_SPEC, data), {'config': None})
+                netcommon_validate_config.assert_called_once_with(ARGUMENT_SPEC, data)
+
+    def test_validate_config_skip_validation(self):
+        os.environ[SKIP_FACTS_VALIDATION_ENV_VAR] = 'true'
+        data = {'config': [{'name': 'Ethernet0', 'mtu': '9100', 'mode': 'routed', 'timers': {'hello': 10}, 'tags': 'a'}]}
+        with patch(VALIDATION_UTILS + '.utils.validate_config') as netcommon_validate_config:
+            params = validate_config(ARGUMENT_SPEC, data)
+        netcommon_validate_config.assert_not_called()
+        self.assertEqual(params['config'][0]['mtu'], 9100)
+        self.assertEqual(params['config'][0]['mode'], 'routed')
+        self.assertEqual(params['config'][0]['timers'], {'hello': 10, 'dead': None})
+        self.assertEqual(params['config'][0]['tags'], ['a'])
+
+    def test_get_compiled_spec(self):
+        compiled_spec = get_compiled_spec(ARGUMENT_SPEC)
+        self.assertIs(get_compiled_spec(ARGUMENT_SPEC), compiled_spec)
+        self.assertIsNone(get_compiled_spec({'config': {'type': 'str', 'aliases': ['value']}}))